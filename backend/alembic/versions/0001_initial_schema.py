@@ -0,0 +1,141 @@
+"""initial schema
+
+Baseline: the schema Base.metadata.create_all produced before the CV store,
+CV imports, statistics rollup and background scoring were added (those are
+in 0002). Databases created that way are stamped at this revision on first
+startup.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 02:34:47.683401
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('question_banks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('category', sa.String(), nullable=False),
+    sa.Column('question', sa.Text(), nullable=False),
+    sa.Column('expected_keywords', sa.JSON(), nullable=True),
+    sa.Column('difficulty_level', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_question_banks_id'), 'question_banks', ['id'], unique=False)
+    op.create_index(op.f('ix_question_banks_role'), 'question_banks', ['role'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('full_name', sa.String(), nullable=False),
+    sa.Column('role', sa.Enum('ADMIN', 'HR', 'CANDIDATE', name='userrole'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+
+    op.create_table('applications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.Integer(), nullable=False),
+    sa.Column('job_role', sa.String(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'REVIEWING', 'SHORTLISTED', 'REJECTED', 'ACCEPTED', name='applicationstatus'), nullable=True),
+    sa.Column('cv_file_path', sa.String(), nullable=True),
+    sa.Column('cv_text', sa.Text(), nullable=True),
+    sa.Column('cv_analysis', sa.Text(), nullable=True),
+    sa.Column('cover_letter', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_applications_id'), 'applications', ['id'], unique=False)
+
+    op.create_table('interviews',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.Integer(), nullable=False),
+    sa.Column('hr_id', sa.Integer(), nullable=True),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.Enum('SCHEDULED', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='interviewstatus'), nullable=True),
+    sa.Column('scheduled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('overall_score', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['hr_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_interviews_id'), 'interviews', ['id'], unique=False)
+
+    op.create_table('interview_responses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('interview_id', sa.Integer(), nullable=False),
+    sa.Column('question', sa.Text(), nullable=False),
+    sa.Column('answer', sa.Text(), nullable=False),
+    sa.Column('question_number', sa.Integer(), nullable=False),
+    sa.Column('sentiment_score', sa.Float(), nullable=True),
+    sa.Column('confidence_score', sa.Float(), nullable=True),
+    sa.Column('clarity_score', sa.Float(), nullable=True),
+    sa.Column('relevance_score', sa.Float(), nullable=True),
+    sa.Column('overall_score', sa.Float(), nullable=True),
+    sa.Column('sentiment_analysis', sa.JSON(), nullable=True),
+    sa.Column('behavioral_cues', sa.JSON(), nullable=True),
+    sa.Column('ai_feedback', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['interview_id'], ['interviews.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_interview_responses_id'), 'interview_responses', ['id'], unique=False)
+
+    op.create_table('reminders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('interview_id', sa.Integer(), nullable=False),
+    sa.Column('candidate_id', sa.Integer(), nullable=False),
+    sa.Column('reminder_type', sa.String(), nullable=False),
+    sa.Column('scheduled_time', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'SENT', 'FAILED', name='reminderstatus'), nullable=True),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['candidate_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['interview_id'], ['interviews.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_reminders_id'), 'reminders', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_reminders_id'), table_name='reminders')
+    op.drop_table('reminders')
+    op.drop_index(op.f('ix_interview_responses_id'), table_name='interview_responses')
+    op.drop_table('interview_responses')
+    op.drop_index(op.f('ix_interviews_id'), table_name='interviews')
+    op.drop_table('interviews')
+    op.drop_index(op.f('ix_applications_id'), table_name='applications')
+    op.drop_table('applications')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_question_banks_role'), table_name='question_banks')
+    op.drop_index(op.f('ix_question_banks_id'), table_name='question_banks')
+    op.drop_table('question_banks')
@@ -0,0 +1,167 @@
+"""cv store, imports, statistics and scoring status
+
+Tables and columns added on top of the baseline: the shared CV store
+(cv_documents, cv_analyses and the applications.cv_* columns), bulk CV
+imports, the dashboard statistics rollup and interview_responses.scoring_status.
+Databases created with create_all part way through these changes already
+have some of them, so existing tables and columns are skipped.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 02:37:21.904316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# add_column does not create enum types (create_table does), so these are created explicitly
+CV_PROCESSING_STATUS = sa.Enum('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', name='cvprocessingstatus')
+SCORING_STATUS = sa.Enum('PENDING', 'COMPLETED', 'FAILED', name='scoringstatus')
+
+
+def _application_columns() -> list:
+    """New applications.cv_* columns (fresh objects, a Column belongs to one table)"""
+    return [
+        sa.Column('cv_document_id', sa.Integer(), sa.ForeignKey('cv_documents.id', name='fk_applications_cv_document_id'), nullable=True),
+        sa.Column('cv_analysis_id', sa.Integer(), sa.ForeignKey('cv_analyses.id', name='fk_applications_cv_analysis_id'), nullable=True),
+        sa.Column('cv_sha256', sa.String(length=64), nullable=True),
+        sa.Column('cv_size_bytes', sa.Integer(), nullable=True),
+        sa.Column('cv_status', CV_PROCESSING_STATUS, nullable=True),
+    ]
+
+
+def _tables() -> set:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table: str) -> set:
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    tables = _tables()
+
+    if 'cv_documents' not in tables:
+        op.create_table('cv_documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_cv_documents_id'), 'cv_documents', ['id'], unique=False)
+        op.create_index(op.f('ix_cv_documents_sha256'), 'cv_documents', ['sha256'], unique=True)
+
+    if 'cv_analyses' not in tables:
+        op.create_table('cv_analyses',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('job_role', sa.String(), nullable=False),
+        sa.Column('analysis', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['document_id'], ['cv_documents.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('document_id', 'job_role', name='uq_cv_analyses_document_role')
+        )
+        op.create_index(op.f('ix_cv_analyses_id'), 'cv_analyses', ['id'], unique=False)
+
+    existing = _columns('applications')
+    missing = [column for column in _application_columns() if column.name not in existing]
+    if missing:
+        CV_PROCESSING_STATUS.create(op.get_bind(), checkfirst=True)
+        with op.batch_alter_table('applications') as batch_op:
+            for column in missing:
+                batch_op.add_column(column)
+        if any(column.name == 'cv_status' for column in missing):
+            # CVs uploaded before background processing were processed synchronously
+            op.execute("UPDATE applications SET cv_status = 'COMPLETED' WHERE cv_file_path IS NOT NULL")
+
+    if 'interview_role_stats' not in tables:
+        op.create_table('interview_role_stats',
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('total_interviews', sa.Integer(), nullable=False),
+        sa.Column('completed_interviews', sa.Integer(), nullable=False),
+        sa.Column('score_sum', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('role')
+        )
+
+    if 'cv_imports' not in tables:
+        op.create_table('cv_imports',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_role', sa.String(), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='cvimportstatus'), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('total_files', sa.Integer(), nullable=True),
+        sa.Column('completed_files', sa.Integer(), nullable=True),
+        sa.Column('failed_files', sa.Integer(), nullable=True),
+        sa.Column('report', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_cv_imports_id'), 'cv_imports', ['id'], unique=False)
+
+    if 'cv_import_items' not in tables:
+        op.create_table('cv_import_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('import_id', sa.Integer(), nullable=False),
+        sa.Column('file_name', sa.String(), nullable=False),
+        sa.Column('file_path', sa.String(), nullable=False),
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('candidate_email', sa.String(), nullable=True),
+        sa.Column('candidate_name', sa.String(), nullable=True),
+        sa.Column('job_role', sa.String(), nullable=True),
+        sa.Column('application_id', sa.Integer(), nullable=True),
+        sa.Column('status', sa.Enum('STAGED', 'CREATED', 'EXTRACTED', 'COMPLETED', 'FAILED', name='cvimportitemstatus'), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+        sa.ForeignKeyConstraint(['import_id'], ['cv_imports.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_cv_import_items_id'), 'cv_import_items', ['id'], unique=False)
+        op.create_index(op.f('ix_cv_import_items_import_id'), 'cv_import_items', ['import_id'], unique=False)
+        op.create_index(op.f('ix_cv_import_items_status'), 'cv_import_items', ['status'], unique=False)
+
+    if 'scoring_status' not in _columns('interview_responses'):
+        SCORING_STATUS.create(op.get_bind(), checkfirst=True)
+        with op.batch_alter_table('interview_responses') as batch_op:
+            batch_op.add_column(sa.Column('scoring_status', SCORING_STATUS, nullable=True))
+        # Responses stored before background scoring were scored synchronously
+        op.execute("UPDATE interview_responses SET scoring_status = 'COMPLETED'")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('interview_responses') as batch_op:
+        batch_op.drop_column('scoring_status')
+    op.drop_index(op.f('ix_cv_import_items_status'), table_name='cv_import_items')
+    op.drop_index(op.f('ix_cv_import_items_import_id'), table_name='cv_import_items')
+    op.drop_index(op.f('ix_cv_import_items_id'), table_name='cv_import_items')
+    op.drop_table('cv_import_items')
+    op.drop_index(op.f('ix_cv_imports_id'), table_name='cv_imports')
+    op.drop_table('cv_imports')
+    op.drop_table('interview_role_stats')
+    with op.batch_alter_table('applications') as batch_op:
+        for column in reversed(_application_columns()):
+            batch_op.drop_column(column.name)
+    op.drop_index(op.f('ix_cv_analyses_id'), table_name='cv_analyses')
+    op.drop_table('cv_analyses')
+    op.drop_index(op.f('ix_cv_documents_sha256'), table_name='cv_documents')
+    op.drop_index(op.f('ix_cv_documents_id'), table_name='cv_documents')
+    op.drop_table('cv_documents')
+    SCORING_STATUS.drop(op.get_bind(), checkfirst=True)
+    CV_PROCESSING_STATUS.drop(op.get_bind(), checkfirst=True)
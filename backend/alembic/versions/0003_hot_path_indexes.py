@@ -0,0 +1,59 @@
+"""hot path indexes
+
+Composite indexes for the dashboard, pagination, question sampling and
+reminder polling queries. Databases created with create_all after the
+pagination change already have some of them, so existing ones are skipped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 02:40:12.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # Candidate listing: ORDER BY overall_score DESC, id DESC with optional role/status filters
+    ('ix_interviews_score_id', 'interviews', ['overall_score', 'id']),
+    ('ix_interviews_role_score_id', 'interviews', ['role', 'overall_score', 'id']),
+    ('ix_interviews_status_score_id', 'interviews', ['status', 'overall_score', 'id']),
+    # Interviews of a candidate, paginated by id
+    ('ix_interviews_candidate_id_id', 'interviews', ['candidate_id', 'id']),
+    # Responses of an interview in question order
+    ('ix_interview_responses_interview_question', 'interview_responses', ['interview_id', 'question_number']),
+    # Application listing filters, paginated by id
+    ('ix_applications_candidate_id_id', 'applications', ['candidate_id', 'id']),
+    ('ix_applications_status_id', 'applications', ['status', 'id']),
+    ('ix_applications_job_role_id', 'applications', ['job_role', 'id']),
+    # Question bank listing and sampling
+    ('ix_question_banks_role_category_id', 'question_banks', ['role', 'category', 'id']),
+    ('ix_question_banks_role_difficulty', 'question_banks', ['role', 'difficulty_level', 'is_active']),
+    # Due reminders: WHERE status = 'pending' AND scheduled_time <= now
+    ('ix_reminders_status_scheduled_time', 'reminders', ['status', 'scheduled_time']),
+]
+
+
+def _existing(table: str) -> set:
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        if name not in _existing(table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        if name in _existing(table):
+            op.drop_index(name, table_name=table)
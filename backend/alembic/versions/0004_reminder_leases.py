@@ -0,0 +1,35 @@
+"""reminder leases
+
+Lease columns that let several reminder dispatchers claim batches of due
+reminders without delivering the same reminder twice.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 09:12:47.530118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.add_column(sa.Column('claimed_by', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('claim_expires_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index(batch_op.f('ix_reminders_claimed_by'), ['claimed_by'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_reminders_claimed_by'))
+        batch_op.drop_column('claim_expires_at')
+        batch_op.drop_column('claimed_by')
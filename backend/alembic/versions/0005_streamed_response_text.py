@@ -0,0 +1,33 @@
+"""streamed response text
+
+Columns storing the follow-up question and candidate feedback streamed
+after an interview response.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 11:03:26.417952
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('interview_responses') as batch_op:
+        batch_op.add_column(sa.Column('followup_question', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('candidate_feedback', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('interview_responses') as batch_op:
+        batch_op.drop_column('candidate_feedback')
+        batch_op.drop_column('followup_question')
@@ -0,0 +1,33 @@
+"""cv import leases
+
+Lease columns that let one worker at a time run a bulk CV import, and let
+another worker resume it once the lease of a stopped run has expired.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 14:26:05.183342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('cv_imports') as batch_op:
+        batch_op.add_column(sa.Column('claimed_by', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('claim_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('cv_imports') as batch_op:
+        batch_op.drop_column('claim_expires_at')
+        batch_op.drop_column('claimed_by')
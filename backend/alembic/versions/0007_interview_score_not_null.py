@@ -0,0 +1,33 @@
+"""interview score not null
+
+interviews.overall_score becomes NOT NULL (the model already defaults it
+to 0.0), so the ranking's keyset pagination needs no NULL handling and its
+ORDER BY matches the (score, id) indexes. Existing NULLs are set to 0.0.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 15:02:44.716209
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE interviews SET overall_score = 0.0 WHERE overall_score IS NULL")
+    with op.batch_alter_table('interviews') as batch_op:
+        batch_op.alter_column('overall_score', existing_type=sa.Float(), nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('interviews') as batch_op:
+        batch_op.alter_column('overall_score', existing_type=sa.Float(), nullable=True)
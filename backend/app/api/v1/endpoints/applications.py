@@ -2,19 +2,29 @@
 Application and CV API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, UploadFile, File, Form
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-import os
-import shutil
 from pathlib import Path
+import zipfile
 
-from app.core.database import get_db
-from app.schemas.application import ApplicationCreate, ApplicationResponse, ApplicationUpdate
-from app.models.application import Application, ApplicationStatus
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.pagination import paginate_async
+from app.schemas.application import (
+    ApplicationCreate, ApplicationResponse, ApplicationUpdate, CVUploadStatus, CVImportResponse
+)
+from app.models.application import Application, ApplicationStatus, CVProcessingStatus
+from app.models.cv_import import CVImport, CVImportStatus
 from app.models.user import User, UserRole
-from app.core.security import get_current_user
-from app.services.ai.cv_analyzer import CVAnalyzer
+from app.core.security import get_current_user, get_token_user
+from app.services.ai.cv_processing import save_upload_stream, enqueue_cv_processing, attach_cv_async
+from app.services.ai.cv_import import (
+    ALLOWED_CV_EXTENSIONS, MANIFEST_NAME, create_import, import_dir, is_cv_file,
+    new_item, stage_zip, read_manifest, apply_manifest, finish_staging, enqueue_import, import_running
+)
 
 router = APIRouter()
 
@@ -22,13 +32,21 @@ router = APIRouter()
 UPLOAD_DIR = Path("uploads/cvs")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-cv_analyzer = CVAnalyzer()
+
+async def _get_application(db: AsyncSession, application_id: int) -> Application:
+    """Load an application or raise 404"""
+    application = (await db.execute(
+        select(Application).filter(Application.id == application_id)
+    )).scalars().first()
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return application
 
 
 @router.post("/", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
-def create_application(
+async def create_application(
     application: ApplicationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new job application"""
@@ -46,70 +64,218 @@ def create_application(
     )
     
     db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
+    await db.commit()
+    await db.refresh(db_application)
     
     return db_application
 
 
-@router.post("/{application_id}/upload-cv", response_model=ApplicationResponse)
-async def upload_cv(
+async def _store_cv(
     application_id: int,
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """Upload CV/resume for an application"""
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    file: UploadFile,
+    db: AsyncSession,
+    current_user: User
+) -> Application:
+    """Validate and stream an uploaded CV to disk, recording it on the application"""
+    application = await _get_application(db, application_id)
     
     if application.candidate_id != current_user.id and current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
     # Validate file type
-    allowed_extensions = {'.pdf', '.doc', '.docx', '.txt'}
     file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_CV_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"File type not allowed. Allowed types: {', '.join(allowed_extensions)}"
+            detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_CV_EXTENSIONS)}"
         )
     
-    # Save file
-    file_path = UPLOAD_DIR / f"{application_id}_{file.filename}"
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Stream file to disk
+    file_path = UPLOAD_DIR / f"{application_id}_{Path(file.filename).name}"
+    size, sha256 = await save_upload_stream(file, file_path)
     
-    # Extract text from CV
-    cv_text = cv_analyzer.extract_text(str(file_path), file_ext)
+    application.cv_file_path = str(file_path)
+    application.cv_sha256 = sha256
+    application.cv_size_bytes = size
+    application.cv_status = CVProcessingStatus.PENDING
+    await db.commit()
+    
+    return application
+
+
+def _cv_status(application: Application) -> dict:
+    """Build the CV processing status resource"""
+    return {
+        "application_id": application.id,
+        "cv_status": application.cv_status,
+        "cv_sha256": application.cv_sha256,
+        "cv_size_bytes": application.cv_size_bytes,
+        "status_url": f"{settings.API_V1_PREFIX}/applications/{application.id}/cv/status"
+    }
+
+
+@router.post("/{application_id}/upload-cv", response_model=ApplicationResponse)
+async def upload_cv(
+    application_id: int,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Upload CV/resume for an application"""
+    application = await _store_cv(application_id, file, db, current_user)
     
-    # Analyze CV using AI
-    cv_analysis = cv_analyzer.analyze_cv(cv_text, application.job_role)
+    # Extract and analyze the CV, reusing earlier results for the same file
+    await attach_cv_async(db, application)
     
     # Update application
-    application.cv_file_path = str(file_path)
-    application.cv_text = cv_text
-    application.cv_analysis = cv_analysis
+    application.cv_status = CVProcessingStatus.COMPLETED
     application.status = ApplicationStatus.REVIEWING
     
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await db.refresh(application)
     
     return application
 
 
+@router.post("/{application_id}/cv", response_model=CVUploadStatus, status_code=status.HTTP_202_ACCEPTED)
+async def upload_cv_background(
+    application_id: int,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Upload CV/resume and extract/analyze it in the background"""
+    application = await _store_cv(application_id, file, db, current_user)
+    enqueue_cv_processing(application.id)
+    return _cv_status(application)
+
+
+@router.get("/{application_id}/cv/status", response_model=CVUploadStatus)
+async def get_cv_status(
+    application_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
+):
+    """Get CV extraction/analysis status for an application"""
+    application = await _get_application(db, application_id)
+    
+    if application.candidate_id != current_user.id and current_user.role not in [UserRole.HR, UserRole.ADMIN]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    return _cv_status(application)
+
+
+@router.post("/imports", response_model=CVImportResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_cv_import(
+    job_role: str = Form(...),
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bulk import CVs (HR/Admin only)
+    
+    Accepts zip archives and/or individual CV files, plus an optional
+    manifest.csv (file,email,full_name,job_role) either uploaded directly
+    or inside an archive. Files are staged, then applications are created,
+    extracted and analyzed by the background import worker.
+    """
+    if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    cv_import = await db.run_sync(create_import, job_role, current_user.id)
+    directory = import_dir(cv_import.id)
+    items = []
+    manifest = {}
+    
+    try:
+        for file in files:
+            name = Path(file.filename or "").name
+            if name.lower().endswith(".zip"):
+                archive = directory / f"archive_{len(items)}_{name}"
+                await save_upload_stream(file, archive, settings.CV_IMPORT_MAX_ARCHIVE_BYTES)
+                try:
+                    staged, found = await run_in_threadpool(stage_zip, cv_import, archive, len(items))
+                except zipfile.BadZipFile:
+                    raise HTTPException(status_code=400, detail=f"{name} is not a valid zip archive")
+                finally:
+                    archive.unlink()
+                items.extend(staged)
+                manifest.update(found)
+            elif name.lower() == MANIFEST_NAME:
+                manifest.update(read_manifest(file.file))
+            elif is_cv_file(name) and len(items) < settings.CV_IMPORT_MAX_FILES:
+                path = directory / f"{len(items)}_{name}"
+                size, sha256 = await save_upload_stream(file, path)
+                items.append(new_item(cv_import, name, path, size, sha256))
+        
+        if not items:
+            raise HTTPException(
+                status_code=400,
+                detail=f"No CV files found. Allowed types: {', '.join(ALLOWED_CV_EXTENSIONS)} or .zip"
+            )
+    except HTTPException:
+        cv_import.status = CVImportStatus.FAILED
+        await db.commit()
+        raise
+    
+    apply_manifest(items, manifest)
+    db.add_all(items)
+    await db.run_sync(finish_staging, cv_import)
+    enqueue_import(cv_import.id)
+    
+    return cv_import
+
+
+async def _get_cv_import(import_id: int, db: AsyncSession, current_user: User) -> CVImport:
+    """Load an import for HR/Admin users"""
+    if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    cv_import = (await db.execute(select(CVImport).filter(CVImport.id == import_id))).scalars().first()
+    if not cv_import:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return cv_import
+
+
+@router.get("/imports/{import_id}", response_model=CVImportResponse)
+async def get_cv_import(
+    import_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
+):
+    """Get bulk import progress and throughput report (HR/Admin only)"""
+    return await _get_cv_import(import_id, db, current_user)
+
+
+@router.post("/imports/{import_id}/resume", response_model=CVImportResponse, status_code=status.HTTP_202_ACCEPTED)
+async def resume_cv_import(
+    import_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Resume an interrupted or partially failed import (HR/Admin only)"""
+    cv_import = await _get_cv_import(import_id, db, current_user)
+    if await db.run_sync(import_running, cv_import.id):
+        raise HTTPException(status_code=409, detail="Import is already running")
+    
+    enqueue_import(cv_import.id)
+    return cv_import
+
+
 @router.get("/", response_model=List[ApplicationResponse])
-def get_applications(
+async def get_applications(
+    response: Response,
     status: Optional[ApplicationStatus] = None,
     job_role: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
     """Get applications"""
-    query = db.query(Application)
+    query = select(Application)
     
     # Candidates can only see their own applications
     if current_user.role == UserRole.CANDIDATE:
@@ -120,20 +286,20 @@ def get_applications(
     if job_role:
         query = query.filter(Application.job_role == job_role)
     
-    applications = query.offset(skip).limit(limit).all()
+    applications = await paginate_async(
+        db, query, [(Application.id, False)], limit, cursor=cursor, skip=skip, response=response
+    )
     return applications
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
-def get_application(
+async def get_application(
     application_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
     """Get application by ID"""
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    application = await _get_application(db, application_id)
     
     # Check authorization
     if application.candidate_id != current_user.id and current_user.role not in [UserRole.HR, UserRole.ADMIN]:
@@ -143,67 +309,61 @@ def get_application(
 
 
 @router.patch("/{application_id}", response_model=ApplicationResponse)
-def update_application(
+async def update_application(
     application_id: int,
     application_update: ApplicationUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update application (HR/Admin only)"""
     if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    application = await _get_application(db, application_id)
     
     if application_update.status:
         application.status = application_update.status
     if application_update.cv_analysis:
         application.cv_analysis = application_update.cv_analysis
     
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await db.refresh(application)
     
     return application
 
 
 @router.post("/{application_id}/accept")
-def accept_application(
+async def accept_application(
     application_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Accept an application (HR/Admin only)"""
     if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    application = await _get_application(db, application_id)
     
     application.status = ApplicationStatus.ACCEPTED
-    db.commit()
+    await db.commit()
     
     return {"message": "Application accepted", "application_id": application_id}
 
 
 @router.post("/{application_id}/reject")
-def reject_application(
+async def reject_application(
     application_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Reject an application (HR/Admin only)"""
     if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    application = await _get_application(db, application_id)
     
     application.status = ApplicationStatus.REJECTED
-    db.commit()
+    await db.commit()
     
     return {"message": "Application rejected", "application_id": application_id}
 
@@ -2,36 +2,50 @@
 HR Dashboard API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List, Optional
-from sqlalchemy import func, desc
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.pagination import paginate_async
 from app.models.interview import Interview, InterviewStatus
 from app.models.user import User, UserRole
-from app.core.security import get_current_user
+from app.core.security import get_token_user
 from app.schemas.interview import InterviewWithResponses
+from app.services.dashboard.statistics import get_statistics_async
 
 router = APIRouter()
 
 
 @router.get("/candidates")
-def get_candidates(
+async def get_candidates(
+    response: Response,
     role: Optional[str] = None,
     min_score: Optional[float] = None,
     status: Optional[InterviewStatus] = None,
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
     """Get candidates with filtering options"""
     # Only HR and Admin can access
     if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    query = db.query(Interview)
+    # Column-only projection with the candidate name joined in: one query per page
+    query = select(
+        Interview.id,
+        Interview.candidate_id,
+        User.full_name,
+        Interview.role,
+        Interview.status,
+        Interview.overall_score,
+        Interview.completed_at
+    ).outerjoin(User, User.id == Interview.candidate_id)
     
     if role:
         query = query.filter(Interview.role == role)
@@ -40,13 +54,22 @@ def get_candidates(
     if status:
         query = query.filter(Interview.status == status)
     
-    interviews = query.order_by(desc(Interview.overall_score)).offset(skip).limit(limit).all()
+    # Highest scores first; id breaks ties so the cursor position is unique
+    interviews = await paginate_async(
+        db,
+        query,
+        [(Interview.overall_score, True), (Interview.id, True)],
+        limit,
+        cursor=cursor,
+        skip=skip,
+        response=response
+    )
     
     return [
         {
             "interview_id": i.id,
             "candidate_id": i.candidate_id,
-            "candidate_name": i.candidate.full_name if i.candidate else "Unknown",
+            "candidate_name": i.full_name or "Unknown",
             "role": i.role,
             "status": i.status,
             "overall_score": i.overall_score,
@@ -57,56 +80,32 @@ def get_candidates(
 
 
 @router.get("/statistics")
-def get_statistics(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_statistics(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
     """Get dashboard statistics"""
     # Only HR and Admin can access
     if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    total_interviews = db.query(func.count(Interview.id)).scalar()
-    completed_interviews = db.query(func.count(Interview.id)).filter(
-        Interview.status == InterviewStatus.COMPLETED
-    ).scalar()
-    
-    avg_score = db.query(func.avg(Interview.overall_score)).filter(
-        Interview.status == InterviewStatus.COMPLETED
-    ).scalar() or 0.0
-    
-    # Interviews by role
-    role_stats = db.query(
-        Interview.role,
-        func.count(Interview.id).label("count"),
-        func.avg(Interview.overall_score).label("avg_score")
-    ).filter(
-        Interview.status == InterviewStatus.COMPLETED
-    ).group_by(Interview.role).all()
-    
-    return {
-        "total_interviews": total_interviews,
-        "completed_interviews": completed_interviews,
-        "average_score": round(avg_score, 2),
-        "by_role": [
-            {"role": role, "count": count, "avg_score": round(avg_score or 0.0, 2)}
-            for role, count, avg_score in role_stats
-        ]
-    }
+    return await get_statistics_async(db)
 
 
-@router.get("/candidates/{interview_id}")
-def get_candidate_detail(
+@router.get("/candidates/{interview_id}", response_model=InterviewWithResponses)
+async def get_candidate_detail(
     interview_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
     """Get detailed candidate information"""
     # Only HR and Admin can access
     if current_user.role not in [UserRole.HR, UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = (await db.execute(
+        select(Interview).options(selectinload(Interview.responses)).filter(Interview.id == interview_id)
+    )).scalars().first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
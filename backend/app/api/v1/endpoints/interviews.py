@@ -2,155 +2,391 @@
 Interview API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+import json
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
 
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, get_async_db, get_async_engine
+from app.core.pagination import paginate_async
 from app.schemas.interview import (
     InterviewCreate, InterviewResponse, InterviewUpdate,
-    InterviewResponseCreate, InterviewResponseDetail, InterviewWithResponses
+    InterviewResponseCreate, InterviewResponseDetail, InterviewWithResponses,
+    InterviewResponseBatchCreate, InterviewBulkCreate, InterviewBulkResult
+)
+from app.core.config import settings
+from app.models.interview import (
+    Interview, InterviewResponse as InterviewResponseModel, InterviewStatus, ScoringStatus
 )
-from app.models.interview import Interview, InterviewResponse as InterviewResponseModel, InterviewStatus
 from app.models.user import User
-from app.core.security import get_current_user
-from app.services.scoring.scoring_engine import ScoringEngine
-from app.services.ai.interview_agent import InterviewAgent
+from app.core.security import get_current_user, get_token_user
+from app.services.scoring.scoring_queue import apply_scores, enqueue_scoring, enqueue_batch_scoring
+from app.services.registry import get_scoring_engine, get_question_selector, get_interview_agent
+from app.services.dashboard.statistics import StatisticsService
+from app.services.reminder.reminder_service import ReminderService
+from app.services.reminder.scheduler import reminder_scheduler
 
 router = APIRouter()
-scoring_engine = ScoringEngine()
-interview_agent = InterviewAgent()
+
+
+async def _get_interview(db: AsyncSession, interview_id: int) -> Interview:
+    """Load an interview or raise 404"""
+    interview = (await db.execute(select(Interview).filter(Interview.id == interview_id))).scalars().first()
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    return interview
+
+
+async def _get_response(db: AsyncSession, interview_id: int, response_id: int) -> InterviewResponseModel:
+    """Load a response of an interview or raise 404"""
+    db_response = (await db.execute(select(InterviewResponseModel).filter(
+        InterviewResponseModel.id == response_id,
+        InterviewResponseModel.interview_id == interview_id
+    ))).scalars().first()
+    if not db_response:
+        raise HTTPException(status_code=404, detail="Response not found")
+    return db_response
+
+
+def _as_utc(when: Optional[datetime]) -> Optional[datetime]:
+    """Naive UTC time, as stored by the rest of the app"""
+    if when is None or when.tzinfo is None:
+        return when
+    return when.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 @router.post("/", response_model=InterviewResponse, status_code=status.HTTP_201_CREATED)
-def create_interview(
+async def create_interview(
     interview: InterviewCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Create a new interview"""
     db_interview = Interview(**interview.dict())
     db.add(db_interview)
-    db.commit()
-    db.refresh(db_interview)
+    await db.run_sync(lambda session: StatisticsService(session).record_interview_created(db_interview.role))
+    await db.commit()
+    await db.refresh(db_interview)
     return db_interview
 
 
+@router.post("/bulk", response_model=InterviewBulkResult, status_code=status.HTTP_201_CREATED)
+async def create_interviews_bulk(
+    batch: InterviewBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Schedule interviews for a cohort, with reminders at each offset, in one transaction"""
+    rows = [
+        {
+            "candidate_id": slot.candidate_id,
+            "hr_id": batch.hr_id,
+            "role": batch.role,
+            "scheduled_at": _as_utc(slot.scheduled_at or batch.scheduled_at),
+            "status": InterviewStatus.SCHEDULED,
+        }
+        for slot in batch.candidates
+    ]
+    # One multi-row INSERT ... RETURNING for the whole cohort
+    interviews = (await db.scalars(insert(Interview).returning(Interview), rows)).all()
+    
+    def create_related(session) -> list:
+        StatisticsService(session).record_interview_created(batch.role, count=len(interviews))
+        return ReminderService(session).create_interview_reminders(
+            [(interview.id, interview.candidate_id, interview.scheduled_at)
+             for interview in interviews if interview.scheduled_at is not None],
+            batch.reminder_offsets_minutes
+        )
+    
+    reminders = await db.run_sync(create_related)
+    await db.commit()
+    for reminder_id, reminder_time in reminders:
+        reminder_scheduler.schedule(reminder_id, reminder_time)
+    return {"interviews": interviews, "reminders_created": len(reminders)}
+
+
 @router.get("/", response_model=List[InterviewResponse])
-def get_interviews(
+async def get_interviews(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
-    """Get all interviews"""
-    interviews = db.query(Interview).offset(skip).limit(limit).all()
+    """Get all interviews (pass the X-Next-Cursor header back as cursor for the next page)"""
+    interviews = await paginate_async(
+        db, select(Interview), [(Interview.id, False)], limit, cursor=cursor, skip=skip, response=response
+    )
     return interviews
 
 
 @router.get("/{interview_id}", response_model=InterviewWithResponses)
-def get_interview(
+async def get_interview(
     interview_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
 ):
     """Get interview by ID with responses"""
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = (await db.execute(
+        select(Interview).options(selectinload(Interview.responses)).filter(Interview.id == interview_id)
+    )).scalars().first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     return interview
 
 
 @router.post("/{interview_id}/start")
-def start_interview(
+async def start_interview(
     interview_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Start an interview"""
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
+    interview = await _get_interview(db, interview_id)
     
     interview.status = InterviewStatus.IN_PROGRESS
     from datetime import datetime
     interview.started_at = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
-    # Generate questions if not already generated
-    questions = interview_agent.generate_questions(role=interview.role, num_questions=5)
+    # Serve questions from the bank, generating only what is missing
+    questions = await get_question_selector().select_questions(db, role=interview.role, num_questions=5)
     return {"status": "started", "questions": questions}
 
 
 @router.post("/{interview_id}/responses", response_model=InterviewResponseDetail)
-def submit_response(
+async def submit_response(
     interview_id: int,
     response: InterviewResponseCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Submit an interview response"""
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
-    
-    # Score the response
-    scores = scoring_engine.score_response(
-        question=response.question,
-        answer=response.answer
-    )
+    interview = await _get_interview(db, interview_id)
     
     # Create response record
     db_response = InterviewResponseModel(
         interview_id=interview_id,
         question=response.question,
         answer=response.answer,
-        question_number=response.question_number,
-        sentiment_score=scores["sentiment_score"],
-        confidence_score=scores["confidence_score"],
-        clarity_score=scores["clarity_score"],
-        relevance_score=scores["relevance_score"],
-        overall_score=scores["overall_score"],
-        sentiment_analysis=scores["sentiment_analysis"],
-        behavioral_cues=scores["behavioral_cues"],
-        ai_feedback=scores["ai_feedback"]
+        question_number=response.question_number
     )
     
+    if settings.SCORING_MODE == "background":
+        # Persist immediately and let a worker fill in the scores
+        db_response.scoring_status = ScoringStatus.PENDING
+        db.add(db_response)
+        await db.commit()
+        await db.refresh(db_response)
+        enqueue_scoring(db_response.id, get_scoring_engine())
+        return db_response
+    
+    # Return the connection to the pool while the answer is scored
+    await db.commit()
+    
+    # Score the response
+    scores = await get_scoring_engine().score_response_async(
+        question=response.question,
+        answer=response.answer,
+        role=interview.role
+    )
+    apply_scores(db_response, scores)
+    
     db.add(db_response)
-    db.commit()
-    db.refresh(db_response)
+    await db.commit()
+    await db.refresh(db_response)
     
     return db_response
 
 
+@router.post("/{interview_id}/responses/batch", response_model=List[InterviewResponseDetail])
+async def submit_responses_batch(
+    interview_id: int,
+    batch: InterviewResponseBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Submit several interview responses, evaluated together"""
+    interview = await _get_interview(db, interview_id)
+    
+    if not batch.responses:
+        raise HTTPException(status_code=400, detail="No responses provided")
+    
+    db_responses = [
+        InterviewResponseModel(
+            interview_id=interview_id,
+            question=r.question,
+            answer=r.answer,
+            question_number=r.question_number
+        )
+        for r in batch.responses
+    ]
+    
+    if settings.SCORING_MODE == "background":
+        for db_response in db_responses:
+            db_response.scoring_status = ScoringStatus.PENDING
+        db.add_all(db_responses)
+        await db.commit()
+        for db_response in db_responses:
+            await db.refresh(db_response)
+        enqueue_batch_scoring([r.id for r in db_responses], get_scoring_engine())
+        return db_responses
+    
+    # Return the connection to the pool while the answers are scored
+    await db.commit()
+    
+    all_scores = await get_scoring_engine().score_responses_batch_async(
+        [{"question": r.question, "answer": r.answer} for r in batch.responses],
+        role=interview.role
+    )
+    for db_response, scores in zip(db_responses, all_scores):
+        apply_scores(db_response, scores)
+    
+    db.add_all(db_responses)
+    await db.commit()
+    for db_response in db_responses:
+        await db.refresh(db_response)
+    
+    return db_responses
+
+
+@router.get("/{interview_id}/responses/{response_id}", response_model=InterviewResponseDetail)
+async def get_response(
+    interview_id: int,
+    response_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_token_user)
+):
+    """Get a single response, used to poll for background scoring results"""
+    return await _get_response(db, interview_id, response_id)
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_and_store(response_id: int, field: str, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Relay generated text as "token" events, then store it on the response
+    
+    The final "done" event carries the full text once it is saved. If the
+    generation fails part way, an "error" event ends the stream instead and
+    nothing is stored, as with a stream the client abandons.
+    """
+    parts = []
+    try:
+        async for text in chunks:
+            parts.append(text)
+            yield _sse("token", {"text": text})
+    except Exception:
+        yield _sse("error", {"response_id": response_id, "detail": "Generation failed; request it again"})
+        return
+    
+    final_text = "".join(parts).strip()
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        await db.execute(
+            update(InterviewResponseModel)
+            .where(InterviewResponseModel.id == response_id)
+            .values({field: final_text})
+        )
+        await db.commit()
+    yield _sse("done", {"response_id": response_id, "text": final_text})
+
+
+def _event_stream(events: AsyncIterator[str]) -> StreamingResponse:
+    """Server-Sent Events response; proxy buffering is disabled so tokens arrive as generated"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/{interview_id}/responses/{response_id}/followup")
+async def stream_followup_question(
+    interview_id: int,
+    response_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream a follow-up question to a response as Server-Sent Events and store it"""
+    interview = await _get_interview(db, interview_id)
+    db_response = await _get_response(db, interview_id, response_id)
+    question, answer, role = db_response.question, db_response.answer, interview.role
+    # Release the connection while the model streams
+    await db.commit()
+    
+    chunks = get_interview_agent().stream_followup_question(question, answer, context=f"Interview for a {role} role")
+    return _event_stream(_stream_and_store(response_id, "followup_question", chunks))
+
+
+@router.post("/{interview_id}/responses/{response_id}/feedback")
+async def stream_feedback(
+    interview_id: int,
+    response_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream feedback on a response to the candidate as Server-Sent Events and store it"""
+    db_response = await _get_response(db, interview_id, response_id)
+    question, answer = db_response.question, db_response.answer
+    # Release the connection while the model streams
+    await db.commit()
+    
+    chunks = get_interview_agent().stream_feedback(question, answer)
+    return _event_stream(_stream_and_store(response_id, "candidate_feedback", chunks))
+
+
 @router.post("/{interview_id}/complete")
-def complete_interview(
+async def complete_interview(
     interview_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Complete an interview and calculate final score"""
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
+    interview = await _get_interview(db, interview_id)
     
     # Get all responses
-    responses = db.query(InterviewResponseModel).filter(
+    responses = (await db.execute(select(InterviewResponseModel).filter(
         InterviewResponseModel.interview_id == interview_id
-    ).all()
+    ))).scalars().all()
     
     if not responses:
         raise HTTPException(status_code=400, detail="No responses found")
     
+    if any(r.scoring_status == ScoringStatus.PENDING for r in responses):
+        raise HTTPException(status_code=409, detail="Responses are still being scored")
+    
+    failed = [r for r in responses if r.scoring_status == ScoringStatus.FAILED]
+    if failed:
+        # Score them again; the interview can be completed once they are done
+        for r in failed:
+            r.scoring_status = ScoringStatus.PENDING
+        await db.commit()
+        enqueue_batch_scoring([r.id for r in failed], get_scoring_engine())
+        raise HTTPException(
+            status_code=409,
+            detail=f"Scoring failed for {len(failed)} responses; they were queued to be scored again"
+        )
+    
     # Calculate overall score
     response_scores = [r.overall_score for r in responses]
-    overall_score = scoring_engine.calculate_interview_score(response_scores)
+    overall_score = get_scoring_engine().calculate_interview_score(response_scores)
     
+    await db.run_sync(lambda session: StatisticsService(session).record_interview_completed(
+        interview.role, interview.status, interview.overall_score, overall_score
+    ))
     interview.overall_score = overall_score
     interview.status = InterviewStatus.COMPLETED
     from datetime import datetime
     interview.completed_at = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     return {"status": "completed", "overall_score": overall_score}
 
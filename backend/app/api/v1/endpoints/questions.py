@@ -2,26 +2,28 @@
 Question Bank API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.pagination import paginate
 from app.models.question import QuestionBank
 from app.models.user import User
 from app.core.security import get_current_user
-from app.services.ai.interview_agent import InterviewAgent
+from app.services.registry import get_interview_agent
 
 router = APIRouter()
-interview_agent = InterviewAgent()
 
 
 @router.get("/")
 def get_questions(
+    response: Response,
     role: Optional[str] = None,
     category: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -33,12 +35,12 @@ def get_questions(
     if category:
         query = query.filter(QuestionBank.category == category)
     
-    questions = query.offset(skip).limit(limit).all()
+    questions = paginate(query, [(QuestionBank.id, False)], limit, cursor=cursor, skip=skip, response=response)
     return questions
 
 
 @router.post("/generate")
-def generate_questions(
+async def generate_questions(
     role: str,
     category: str = "mixed",
     num_questions: int = 5,
@@ -46,7 +48,7 @@ def generate_questions(
     current_user: User = Depends(get_current_user)
 ):
     """Generate AI questions for a role"""
-    questions = interview_agent.generate_questions(
+    questions = await get_interview_agent().generate_questions_async(
         role=role,
         category=category,
         num_questions=num_questions,
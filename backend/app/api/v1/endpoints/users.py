@@ -3,23 +3,25 @@ User API Endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.password_hashing import hash_password_async, verify_and_update_async
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.models.user import User
-from app.core.security import get_password_hash, verify_password, create_access_token, get_current_user
+from app.core.security import create_access_token, token_claims, get_current_user
 from app.schemas.user import Token
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
     # Check if user exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = (await db.execute(select(User).filter(User.email == user.email))).scalars().first()
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -27,7 +29,7 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await hash_password_async(user.password)
     db_user = User(
         email=user.email,
         hashed_password=hashed_password,
@@ -35,22 +37,33 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         role=user.role
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
 @router.post("/login", response_model=Token)
-def login(email: str, password: str, db: Session = Depends(get_db)):
+async def login(email: str, password: str, db: AsyncSession = Depends(get_async_db)):
     """Login user"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.hashed_password):
+    user = (await db.execute(select(User).filter(User.email == email))).scalars().first()
+    # Release the connection while bcrypt runs
+    await db.commit()
+    
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await verify_and_update_async(password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
-    access_token = create_access_token(data={"sub": user.email})
+    # Stored hash used other parameters (e.g. BCRYPT_ROUNDS changed): upgrade it
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    
+    access_token = create_access_token(data=token_claims(user))
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -0,0 +1,176 @@
+"""
+Cache Layer
+Pluggable key/value cache with TTL, backed by process memory or Redis
+"""
+
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a content-addressed key from JSON-serializable parts"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """
+    Interface shared by all cache backends
+
+    Async code uses the *_async methods, which never block the event loop;
+    the defaults call the sync methods directly, which suits backends that
+    do no I/O.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Value stored under key, or None"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store a value for ttl seconds (default_ttl when None)"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove a key if present"""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every key of this cache"""
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None):
+        self.set(key, value, ttl)
+
+    async def delete_async(self, key: str):
+        self.delete(key)
+
+
+class InMemoryCache(CacheBackend):
+    """Thread-safe in-process cache with TTL and LRU eviction"""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 3600):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis-backed cache shared across processes
+
+    Values are stored as JSON under a namespace prefix. Expiry uses Redis
+    TTLs; LRU eviction is left to the server's maxmemory-policy. Socket
+    timeouts bound every call, so an unreachable server degrades to cache
+    misses; the async methods run the calls in the threadpool.
+    """
+
+    def __init__(self, url: str, namespace: str, default_ttl: int = 3600):
+        self.prefix = f"botboss:{namespace}:"
+        self.default_ttl = default_ttl
+        self.client = redis.Redis.from_url(
+            url,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.client.get(self.prefix + key)
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            print(f"Error reading cache: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        try:
+            self.client.set(self.prefix + key, json.dumps(value), ex=ttl or self.default_ttl)
+        except Exception as e:
+            print(f"Error writing cache: {e}")
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as e:
+            print(f"Error deleting cache key: {e}")
+
+    def clear(self):
+        try:
+            for key in self.client.scan_iter(match=self.prefix + "*"):
+                self.client.delete(key)
+        except Exception as e:
+            print(f"Error clearing cache: {e}")
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        return await run_in_threadpool(self.get, key)
+
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None):
+        await run_in_threadpool(self.set, key, value, ttl)
+
+    async def delete_async(self, key: str):
+        await run_in_threadpool(self.delete, key)
+
+
+def create_cache(namespace: str, max_entries: int = 1024, default_ttl: int = 3600) -> CacheBackend:
+    """
+    Create a cache for the configured backend
+
+    Args:
+        namespace: Key prefix separating this cache from others
+        max_entries: LRU capacity for the in-memory backend
+        default_ttl: Default time to live in seconds
+
+    Returns:
+        Cache backend instance
+    """
+    if settings.CACHE_BACKEND == "redis":
+        if REDIS_AVAILABLE:
+            return RedisCache(settings.REDIS_URL, namespace, default_ttl=default_ttl)
+        print("Warning: redis package not installed, falling back to in-memory cache")
+    return InMemoryCache(max_entries=max_entries, default_ttl=default_ttl)
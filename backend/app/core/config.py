@@ -28,16 +28,64 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./botboss.db"
+    ASYNC_DATABASE_URL: str = ""  # Async endpoints; derived from DATABASE_URL (aiosqlite/asyncpg) when empty
+    QUERY_COUNT_HEADER: bool = False  # Add X-Query-Count to responses (debugging N+1 queries)
+    DB_AUTO_MIGRATE: bool = True  # Apply pending Alembic migrations on startup
+    DB_POOL_SIZE: int = 10  # Connections kept open (PostgreSQL/MySQL and file-based SQLite)
+    DB_MAX_OVERFLOW: int = 20  # Extra connections opened under load
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced (server-side idle timeouts)
+    DB_POOL_PRE_PING: bool = True  # Check connections on checkout and replace dropped ones
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # PostgreSQL statement_timeout (0 disables)
+    SQLITE_WAL: bool = True  # WAL journal mode so reads don't block the writer
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # How long a writer waits for the lock
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost; changing it rehashes each password on its next login
+    PASSWORD_HASH_MODE: str = "process"  # "process" or "thread" (dedicated pool either way)
+    PASSWORD_HASH_WORKERS: int = 0  # Concurrent hashes; 0 uses one worker per CPU core
+    USER_CACHE_TTL_SECONDS: int = 60  # Cache of token users in get_current_user (0 disables); uses CACHE_BACKEND
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_EMBED_CLAIMS: bool = False  # Put uid/role in tokens so read-only endpoints skip the user lookup
     
     # OpenAI
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4"
     
+    # Scoring
+    SCORING_MODE: str = "sync"  # "sync" or "background"
+    SCORING_WORKERS: int = 4
+    EVALUATION_BATCH_MODE: str = "packed"  # "packed" or "concurrent"
+    EVALUATION_BATCH_SIZE: int = 10  # Max answers per packed prompt
+    EVALUATION_CONCURRENCY: int = 5  # Max in-flight evaluation requests per batch
+    
+    # NLP analysis
+    NLP_EXECUTION_MODE: str = "thread"  # "thread" or "process"
+    NLP_PROCESS_WORKERS: int = 0  # 0 uses one worker per CPU core
+    CUE_LEXICONS_FILE: str = ""  # JSON file with per-role behavioral cue vocabularies
+    WARM_UP_SERVICES: bool = False  # Load AI clients and NLP models at startup instead of first use
+    
+    # CV uploads
+    CV_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    CV_UPLOAD_CHUNK_BYTES: int = 256 * 1024
+    CV_WORKERS: int = 2
+    CV_EXTRACT_MAX_CHARS: int = 20000  # Stop parsing once this much text is extracted (0 = whole file)
+    CV_PDF_WORKERS: int = 0  # PDF extraction processes (0 = CPU count)
+    CV_PDF_PARALLEL_MIN_PAGES: int = 24  # Smaller PDFs are extracted in-process
+    CV_PDF_PAGES_PER_TASK: int = 8
+    
+    # Bulk CV imports
+    CV_IMPORT_MAX_ARCHIVE_BYTES: int = 500 * 1024 * 1024
+    CV_IMPORT_MAX_FILES: int = 5000
+    CV_IMPORT_BATCH_SIZE: int = 200  # Applications created / files extracted per commit
+    CV_IMPORT_CONCURRENCY: int = 4  # Concurrent CV analysis requests
+    CV_IMPORT_RATE_PER_MINUTE: int = 60  # CV analysis requests per minute (0 = unlimited)
+    CV_IMPORT_MAX_RETRIES: int = 3  # Retries of rate-limited analysis requests
+    CV_IMPORT_LEASE_SECONDS: int = 600  # A running import whose worker stops renewing its lease can be resumed elsewhere
+    
     # Twilio
     TWILIO_ACCOUNT_SID: str = ""
     TWILIO_AUTH_TOKEN: str = ""
@@ -46,12 +94,43 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 1.0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 1.0  # Per cache call; slower calls count as misses
+    
+    # Cache
+    CACHE_BACKEND: str = "memory"  # "memory" or "redis"
+    QUESTION_CACHE_TTL_SECONDS: int = 86400
+    QUESTION_CACHE_MAX_ENTRIES: int = 1024
+    
+    # Question bank
+    QUESTION_BANK_WRITE_BACK: bool = True  # Store AI-generated questions for reuse
+    
+    # Dashboard statistics
+    STATS_CACHE_TTL_SECONDS: int = 30
+    STATS_RECONCILE_INTERVAL_SECONDS: int = 3600  # Full recount of the rollup table (0 = disabled)
     
     # Email
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
     SMTP_USER: str = ""
     SMTP_PASSWORD: str = ""
+    SMTP_USE_TLS: bool = True  # STARTTLS; disable for a local stand-in server
+    SMTP_TIMEOUT_SECONDS: int = 30
+    SMTP_POOL_SIZE: int = 4  # Persistent connections kept open to the server
+    SMTP_BATCH_SIZE: int = 50  # Messages sent per connection turn
+    SMTP_RATE_PER_MINUTE: int = 600  # Provider send limit (0 = unlimited)
+    SMTP_MAX_RETRIES: int = 3
+    SMTP_RETRY_BASE_SECONDS: float = 2.0  # Doubled on every retry
+    EMAIL_FROM: str = ""  # Defaults to SMTP_USER
+    EMAIL_TRANSPORT: str = "none"  # "smtp", "memory" or "none" (reminders are marked as sent only)
+    
+    # Reminder dispatch
+    REMINDER_DISPATCHER_ENABLED: bool = False  # Run the reminder scheduler in the API process
+    REMINDER_BATCH_SIZE: int = 200  # Reminders claimed per batch
+    REMINDER_SEND_CONCURRENCY: int = 50  # Deliveries in flight per dispatcher
+    REMINDER_LEASE_SECONDS: int = 300  # Claimed reminders return to the queue if not finished in time
+    REMINDER_SCHEDULER_HORIZON_SECONDS: int = 3600  # Reminders due this far ahead are kept in memory
+    REMINDER_SCHEDULER_REFRESH_SECONDS: int = 300  # Reload interval; picks up reminders created by other processes
     
     class Config:
         env_file = ".env"
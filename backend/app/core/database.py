@@ -2,19 +2,233 @@
 Database Configuration and Session Management
 """
 
-from sqlalchemy import create_engine
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+
+class PoolMetrics:
+    """Checkout counters of a connection pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def record(self, wait: float, checked_out: int, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "peak_checked_out": self.peak_checked_out,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - started, self.checkedout(), timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started, self.checkedout())
+        return connection
+
+
+class MeteredAsyncQueuePool(MeteredQueuePool, AsyncAdaptedQueuePool):
+    """MeteredQueuePool for async engines"""
+
+
+# Async driver used for each backend when ASYNC_DATABASE_URL is not set
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg", "mysql": "aiomysql"}
+
+
+def _engine_options(url, asynchronous: bool = False) -> Dict:
+    """Pool and driver options for the configured database"""
+    backend = url.get_backend_name()
+    poolclass = MeteredAsyncQueuePool if asynchronous else MeteredQueuePool
+    if backend == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}
+        if url.database in (None, "", ":memory:"):
+            # In-memory databases live in a single connection per thread
+            return options
+        # Single-node profile: a small pool, WAL and busy timeout are set on connect
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+        return options
+
+    options = {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+                "application_name": "botboss-api",
+            }}
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}",
+                "application_name": "botboss-api",
+            }
+    return options
+
+
+database_url = make_url(settings.DATABASE_URL)
+engine = create_engine(database_url, **_engine_options(database_url))
+
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    """Readers run alongside the writer (WAL); writers wait for the lock instead of failing"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}")
+    if settings.SQLITE_WAL and database_url.database not in (None, "", ":memory:"):
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.close()
+
+
+if database_url.get_backend_name() == "sqlite":
+    event.listen(engine, "connect", _configure_sqlite)
+
+# Created on first use so scripts and migrations don't need the async driver
+_async_engine: Optional[AsyncEngine] = None
+
+
+def async_database_url():
+    """URL of the configured database with its async driver"""
+    if settings.ASYNC_DATABASE_URL:
+        return make_url(settings.ASYNC_DATABASE_URL)
+    backend = database_url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise RuntimeError(f"No async driver known for {backend}; set ASYNC_DATABASE_URL")
+    return database_url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def get_async_engine() -> AsyncEngine:
+    """Async engine for the configured database (aiosqlite, asyncpg, ...)"""
+    global _async_engine
+    if _async_engine is None:
+        url = async_database_url()
+        async_engine = create_async_engine(url, **_engine_options(url, asynchronous=True))
+        event.listen(async_engine.sync_engine, "before_cursor_execute", _record_query)
+        if url.get_backend_name() == "sqlite":
+            event.listen(async_engine.sync_engine, "connect", _configure_sqlite)
+        _async_engine = async_engine
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """Close the async engine's pooled connections"""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+def _pool_metrics(pool) -> Dict:
+    """Usage and checkout metrics of one pool"""
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=settings.DB_MAX_OVERFLOW,
+        )
+    if isinstance(pool, MeteredQueuePool):
+        status.update(pool.metrics.snapshot())
+    return status
+
+
+def pool_status() -> Dict:
+    """Current usage and checkout metrics of the connection pools"""
+    status = {"backend": database_url.get_backend_name(), **_pool_metrics(engine.pool)}
+    if _async_engine is not None:
+        status["async"] = _pool_metrics(_async_engine.pool)
+    return status
+
+
+# Statements recorded by count_queries() in the current context
+_query_log: ContextVar[Optional[List[str]]] = ContextVar("query_log", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    statements = _query_log.get()
+    if statements is not None:
+        statements.append(statement)
+
+
+@contextmanager
+def count_queries():
+    """
+    Record the SQL statements executed inside the block
+    
+    The context is inherited by the threadpool and tasks started from it,
+    so wrapping a request counts every query its endpoint makes:
+    
+        with count_queries() as statements:
+            ...
+        assert len(statements) <= 3
+    """
+    statements: List[str] = []
+    token = _query_log.set(statements)
+    try:
+        yield statements
+    finally:
+        _query_log.reset(token)
+
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Objects stay readable after commit: expired attributes can't lazy load in async code
+AsyncSessionLocal = async_sessionmaker(class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -26,3 +240,9 @@ def get_db():
     finally:
         db.close()
 
+
+
+async def get_async_db():
+    """Dependency for getting an async database session"""
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
@@ -0,0 +1,44 @@
+"""
+Database Migrations
+Runs the Alembic migrations in backend/alembic on startup
+"""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from app.core.database import engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Revision matching the oldest schema create_all produced (the later revisions fill in the rest)
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config() -> Config:
+    """Alembic config usable from any working directory"""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.attributes["skip_logging"] = True
+    return config
+
+
+def run_migrations():
+    """
+    Upgrade the database to the latest revision
+
+    Databases created by create_all before migrations were introduced are
+    stamped at the baseline first, so only the later revisions run on them.
+    Those skip the tables, columns and indexes such a database already has,
+    since create_all may have run part way through the later changes.
+    """
+    config = get_alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        if "users" in tables and "alembic_version" not in tables:
+            print(f"Stamping existing database at migration {BASELINE_REVISION}")
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
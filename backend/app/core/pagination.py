@@ -0,0 +1,132 @@
+"""
+Keyset Pagination
+Pages through ordered queries with opaque cursors instead of OFFSET
+"""
+
+import base64
+import json
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, and_, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode the sort key values of a row as an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor, rejecting anything that was not produced for this ordering"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def paginate(
+    query: Query,
+    order: List[Tuple[Any, bool]],
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    response: Optional[Response] = None
+) -> List[Any]:
+    """
+    Fetch one page of an ordered query
+
+    Rows are ordered by `order`, a list of (column, descending) pairs that
+    must end with a unique column (the primary key); sort columns must be
+    NOT NULL. With a cursor, the page starts right after the row the cursor
+    was taken from, using a (sort key, id) comparison the matching
+    composite index can seek to.
+    Without one, `skip` is applied as an OFFSET for compatibility.
+
+    Args:
+        query: Filtered query (entities or column projection)
+        order: Sort columns and directions
+        limit: Page size
+        cursor: Cursor from the previous page's X-Next-Cursor header
+        skip: Legacy offset, used only when no cursor is given
+        response: Response on which to set X-Next-Cursor when more rows exist
+
+    Returns:
+        The rows of the page
+    """
+    rows = _page(query, order, limit, cursor, skip).all()
+    return _trim(rows, order, limit, response)
+
+
+async def paginate_async(
+    db: AsyncSession,
+    statement: Select,
+    order: List[Tuple[Any, bool]],
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    response: Optional[Response] = None
+) -> List[Any]:
+    """
+    Fetch one page of an ordered select() on an async session
+
+    Same as paginate(); like Query, a single-entity select returns the
+    entities and anything else returns rows.
+    """
+    result = await db.execute(_page(statement, order, limit, cursor, skip))
+    columns = statement.column_descriptions
+    single_entity = len(columns) == 1 and columns[0]["expr"] is columns[0]["entity"]
+    rows = result.scalars().all() if single_entity else result.all()
+    return _trim(rows, order, limit, response)
+
+
+def _page(query, order: List[Tuple[Any, bool]], limit: int, cursor: Optional[str], skip: int):
+    """Apply the cursor condition, ordering and limit (one extra row to detect a next page)"""
+    if cursor:
+        values = decode_cursor(cursor, len(order))
+        query = query.filter(_after(order, values))
+
+    query = query.order_by(*[column.desc() if descending else column.asc() for column, descending in order])
+    if not cursor and skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+def _trim(rows: List[Any], order: List[Tuple[Any, bool]], limit: int, response: Optional[Response]) -> List[Any]:
+    """Drop the extra row and set X-Next-Cursor when there is a next page"""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if response is not None and has_more and rows:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([getattr(last, column.key) for column, _ in order])
+    return rows
+
+
+def _after(order: List[Tuple[Any, bool]], values: List[Any]):
+    """
+    Condition selecting rows that sort strictly after the given key values
+
+    When every column sorts the same way this is one row-value comparison,
+    (score, id) < (:score, :id), which reads as a range of the composite
+    index; mixed directions fall back to the expanded OR of key prefixes.
+    """
+    directions = {descending for _, descending in order}
+    if len(directions) == 1:
+        key = tuple_(*[column for column, _ in order])
+        return key < tuple(values) if directions.pop() else key > tuple(values)
+
+    clauses = []
+    for index, (column, descending) in enumerate(order):
+        equal = [order[i][0] == values[i] for i in range(index)]
+        beyond = column < values[index] if descending else column > values[index]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
@@ -0,0 +1,99 @@
+"""
+Password Hashing
+bcrypt hashing off the event loop, in a dedicated bounded worker pool
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+# Hashes with any other cost are flagged for rehashing, so raising or lowering
+# BCRYPT_ROUNDS takes effect for each user on their next login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+_hash_pool: Optional[Executor] = None
+_hash_pool_lock = Lock()
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the configured cost"""
+    return pwd_context.hash(password)
+
+
+def verify_and_update(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also returns a new hash when the stored one uses outdated parameters"""
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+def _warm_up_worker(_: int) -> int:
+    """No-op task forcing a worker process to start"""
+    return os.getpid()
+
+
+def _pool_size() -> int:
+    """Configured number of hashing workers"""
+    return settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+
+
+def get_hash_pool() -> Executor:
+    """
+    Return the hashing pool, starting it on first use
+
+    In "process" mode hashes run in their own processes so they never
+    compete with request handling for the GIL or the shared threadpool;
+    "thread" mode uses a dedicated thread pool (bcrypt releases the GIL).
+    Either way at most PASSWORD_HASH_WORKERS hashes run at once and the
+    rest queue.
+    """
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            if settings.PASSWORD_HASH_MODE == "process":
+                _hash_pool = ProcessPoolExecutor(
+                    max_workers=_pool_size(),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                _hash_pool = ThreadPoolExecutor(max_workers=_pool_size(), thread_name_prefix="password-hash")
+        return _hash_pool
+
+
+def start_hash_pool():
+    """Start the hashing pool and its workers ahead of the first login"""
+    pool = get_hash_pool()
+    if isinstance(pool, ProcessPoolExecutor):
+        list(pool.map(_warm_up_worker, range(_pool_size())))
+
+
+def shutdown_hash_pool():
+    """Stop the hashing pool"""
+    global _hash_pool
+    with _hash_pool_lock:
+        pool, _hash_pool = _hash_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password() in the hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), hash_password, password)
+
+
+async def verify_and_update_async(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update() in the hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), verify_and_update, password, hashed_password)
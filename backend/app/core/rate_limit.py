@@ -0,0 +1,44 @@
+"""
+Rate Limiting
+Spaces out calls to rate-limited external APIs (OpenAI, email, SMS)
+"""
+
+import asyncio
+import time
+from threading import Lock
+
+
+class RateLimiter:
+    """Thread-safe limiter allowing at most `rate_per_minute` acquisitions per minute"""
+
+    def __init__(self, rate_per_minute: float):
+        self.interval = 60.0 / rate_per_minute if rate_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = Lock()
+
+    def _reserve(self) -> float:
+        """Take the next slot; returns the seconds to wait for it"""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot - now
+
+    def acquire(self):
+        """Block until the next call is allowed"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait until the next call is allowed without blocking the event loop"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def backoff(self, seconds: float):
+        """Push every caller back, e.g. after a 429 with Retry-After"""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
@@ -2,21 +2,35 @@
 Security utilities for authentication and password hashing
 """
 
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
+from app.core.cache import create_cache
 from app.core.config import settings
-from app.core.database import get_db
-from app.models.user import User
+from app.core.database import get_async_db
+from app.core.password_hashing import pwd_context
+from app.models.user import User, UserRole
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/users/login")
 
+# Users resolved from tokens, keyed by subject (email)
+user_cache = create_cache(
+    "users", max_entries=settings.USER_CACHE_MAX_ENTRIES, default_ttl=max(settings.USER_CACHE_TTL_SECONDS, 1)
+)
+
+# Columns kept in the cache (never the password hash)
+USER_CACHE_FIELDS = ("id", "email", "full_name", "role", "is_active", "created_at", "updated_at")
+
+# Session.info key collecting users changed in the current transaction
+_CHANGED_USERS = "changed_user_emails"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -28,6 +42,14 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def token_claims(user: User) -> Dict:
+    """Claims identifying a user in an access token"""
+    claims = {"sub": user.email}
+    if settings.AUTH_EMBED_CLAIMS:
+        claims.update(uid=user.id, role=user.role.value)
+    return claims
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
@@ -41,28 +63,120 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user"""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _decode_token(token: str) -> Dict:
+    """Validate a token and return its claims"""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    if payload.get("sub") is None:
+        raise _credentials_exception()
+    return payload
+
+
+def _user_to_cache(user: User) -> Dict:
+    values = {field: getattr(user, field) for field in USER_CACHE_FIELDS}
+    values["role"] = user.role.value
+    for field in ("created_at", "updated_at"):
+        if values[field] is not None:
+            values[field] = values[field].isoformat()
+    return values
+
+
+def _user_from_cache(values: Dict) -> User:
+    """Detached User carrying the cached columns"""
+    values = dict(values, role=UserRole(values["role"]))
+    for field in ("created_at", "updated_at"):
+        if values[field] is not None:
+            values[field] = datetime.fromisoformat(values[field])
+    return User(**values)
+
+
+def invalidate_user_cache(email: str):
+    """Drop a user from the token user cache (done automatically when a User row changes)"""
+    user_cache.delete(email)
+
+
+async def _resolve_user(payload: Dict, db: AsyncSession) -> User:
+    """User named by the token's subject, from the cache or the database"""
+    email = payload["sub"]
+    use_cache = settings.USER_CACHE_TTL_SECONDS > 0
     
-    user = db.query(User).filter(User.email == email).first()
-    if user is None:
-        raise credentials_exception
+    cached = await user_cache.get_async(email) if use_cache else None
+    if cached is not None:
+        user = _user_from_cache(cached)
+    else:
+        user = (await db.execute(select(User).filter(User.email == email))).scalars().first()
+        if user is None:
+            raise _credentials_exception()
+        # Never keep an entry past the token's own expiry
+        ttl = min(settings.USER_CACHE_TTL_SECONDS, int(payload.get("exp", 0) - time.time()))
+        if use_cache and ttl > 0:
+            await user_cache.set_async(email, _user_to_cache(user), ttl=ttl)
     
+    if user.is_active is False:
+        raise _credentials_exception()
     return user
 
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Get current authenticated user
+    
+    Cached users are detached User objects with every column except the
+    password hash; load the row in the endpoint's session to modify it.
+    """
+    return await _resolve_user(_decode_token(token), db)
+
+
+async def get_token_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Get the current user for read-only endpoints that only need id and role
+    
+    With AUTH_EMBED_CLAIMS the user is built from the token's uid/role
+    claims without any lookup, so role changes and deactivation take effect
+    when the token expires. Otherwise this is get_current_user.
+    """
+    payload = _decode_token(token)
+    if settings.AUTH_EMBED_CLAIMS and "uid" in payload and "role" in payload:
+        return User(id=payload["uid"], email=payload["sub"], role=UserRole(payload["role"]), is_active=True)
+    return await _resolve_user(payload, db)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _record_changed_user(mapper, connection, target: User):
+    """Remember changed users so their cache entries are dropped on commit"""
+    session = object_session(target)
+    if session is None:
+        return
+    emails = session.info.setdefault(_CHANGED_USERS, set())
+    emails.add(target.email)
+    # An email change also invalidates the old subject
+    emails.update(inspect(target).attrs.email.history.deleted or ())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session):
+    for email in session.info.pop(_CHANGED_USERS, ()):
+        invalidate_user_cache(email)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session):
+    session.info.pop(_CHANGED_USERS, None)
+
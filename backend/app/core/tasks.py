@@ -0,0 +1,73 @@
+"""
+Background Task Queue
+Runs slow work (LLM calls, NLP analysis) outside the request cycle
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Optional
+
+
+class BackgroundTaskQueue:
+    """Bounded worker pool for fire-and-forget background jobs"""
+
+    def __init__(self, name: str, max_workers: int = 4):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+        self._pending = 0
+
+    def start(self):
+        """Start the worker pool (idempotent)"""
+        with self._lock:
+            self._ensure_executor()
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool if needed; call with the lock held"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"{self.name}-worker"
+            )
+        return self._executor
+
+    def stop(self, wait: bool = True):
+        """Stop the worker pool, optionally waiting for queued jobs"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a job for a background worker
+
+        Args:
+            func: Callable to run
+            *args, **kwargs: Arguments passed to the callable
+
+        Returns:
+            Future for the job result
+        """
+        # Submit under the lock so a concurrent stop() cannot swap the executor out
+        with self._lock:
+            future = self._ensure_executor().submit(self._run, func, *args, **kwargs)
+            self._pending += 1
+        return future
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running"""
+        return self._pending
+
+    def _run(self, func: Callable, *args, **kwargs):
+        """Run a job and log failures instead of losing them silently"""
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            print(f"Error in {self.name} task: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
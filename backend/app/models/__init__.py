@@ -1,15 +1,19 @@
 # Database Models Package
 
 from app.models.user import User, UserRole
-from app.models.interview import Interview, InterviewResponse, InterviewStatus
+from app.models.interview import Interview, InterviewResponse, InterviewStatus, ScoringStatus
 from app.models.question import QuestionBank
 from app.models.reminder import Reminder, ReminderStatus
-from app.models.application import Application, ApplicationStatus
+from app.models.application import Application, ApplicationStatus, CVProcessingStatus, CVDocument, CVAnalysis
+from app.models.cv_import import CVImport, CVImportItem, CVImportStatus, CVImportItemStatus
+from app.models.statistics import InterviewRoleStats
 
 __all__ = [
     "User", "UserRole",
-    "Interview", "InterviewResponse", "InterviewStatus",
+    "Interview", "InterviewResponse", "InterviewStatus", "ScoringStatus",
     "QuestionBank",
     "Reminder", "ReminderStatus",
-    "Application", "ApplicationStatus",
+    "Application", "ApplicationStatus", "CVProcessingStatus", "CVDocument", "CVAnalysis",
+    "CVImport", "CVImportItem", "CVImportStatus", "CVImportItemStatus",
+    "InterviewRoleStats",
 ]
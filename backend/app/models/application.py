@@ -2,7 +2,7 @@
 Application and CV Models
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -19,17 +19,36 @@ class ApplicationStatus(str, enum.Enum):
     ACCEPTED = "accepted"
 
 
+class CVProcessingStatus(str, enum.Enum):
+    """CV extraction and analysis status"""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Application(Base):
     """Job application model"""
     __tablename__ = "applications"
+    __table_args__ = (
+        # Keyset pagination (filter, id) for candidate and HR listings
+        Index("ix_applications_candidate_id_id", "candidate_id", "id"),
+        Index("ix_applications_status_id", "status", "id"),
+        Index("ix_applications_job_role_id", "job_role", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     job_role = Column(String, nullable=False)  # Job role applied for
     status = Column(Enum(ApplicationStatus), default=ApplicationStatus.PENDING)
     cv_file_path = Column(String, nullable=True)  # Path to uploaded CV
-    cv_text = Column(Text, nullable=True)  # Extracted text from CV
-    cv_analysis = Column(Text, nullable=True)  # AI analysis of CV
+    cv_document_id = Column(Integer, ForeignKey("cv_documents.id"), nullable=True)  # Shared extracted text
+    cv_analysis_id = Column(Integer, ForeignKey("cv_analyses.id"), nullable=True)  # Shared AI analysis
+    stored_cv_text = Column("cv_text", Text, nullable=True)  # Per-application text (legacy rows)
+    stored_cv_analysis = Column("cv_analysis", Text, nullable=True)  # Manual override of the analysis
+    cv_sha256 = Column(String(64), nullable=True)  # Hash of the uploaded CV file
+    cv_size_bytes = Column(Integer, nullable=True)
+    cv_status = Column(Enum(CVProcessingStatus), nullable=True)  # Set once a CV is uploaded
     cover_letter = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -37,6 +56,63 @@ class Application(Base):
     # Relationships
     candidate = relationship("User", foreign_keys=[candidate_id])
     interview = relationship("Interview", back_populates="application", uselist=False)
+    cv_document = relationship("CVDocument", lazy="selectin")
+    shared_cv_analysis = relationship("CVAnalysis", lazy="selectin")
+    
+    @property
+    def cv_text(self):
+        """Extracted text from CV"""
+        if self.cv_document is not None:
+            return self.cv_document.text
+        return self.stored_cv_text
+    
+    @cv_text.setter
+    def cv_text(self, value):
+        self.stored_cv_text = value
+    
+    @property
+    def cv_analysis(self):
+        """AI analysis of CV (a manual override takes precedence)"""
+        if self.stored_cv_analysis is not None:
+            return self.stored_cv_analysis
+        if self.shared_cv_analysis is not None:
+            return self.shared_cv_analysis.analysis
+        return None
+    
+    @cv_analysis.setter
+    def cv_analysis(self, value):
+        self.stored_cv_analysis = value
+
+
+class CVDocument(Base):
+    """Extracted CV text, shared by every upload of the same file"""
+    __tablename__ = "cv_documents"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, index=True, nullable=False)  # Hash of the file contents
+    text = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    analyses = relationship("CVAnalysis", back_populates="document")
+
+
+class CVAnalysis(Base):
+    """AI analysis of a CV document for a job role"""
+    __tablename__ = "cv_analyses"
+    __table_args__ = (
+        UniqueConstraint("document_id", "job_role", name="uq_cv_analyses_document_role"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    document_id = Column(Integer, ForeignKey("cv_documents.id"), nullable=False)
+    job_role = Column(String, nullable=False)  # Normalized (lowercase) job role
+    analysis = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    document = relationship("CVDocument", back_populates="analyses")
 
 
 # Add relationship to Interview model
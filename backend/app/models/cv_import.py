@@ -0,0 +1,72 @@
+"""
+Bulk CV Import Models
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+import enum
+
+from app.core.database import Base
+
+
+class CVImportStatus(str, enum.Enum):
+    """Bulk import status"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class CVImportItemStatus(str, enum.Enum):
+    """Progress of one imported file; each stage is skipped when resuming"""
+    STAGED = "staged"  # File stored, no application yet
+    CREATED = "created"  # Application created
+    EXTRACTED = "extracted"  # Text extracted (or shared entry found)
+    COMPLETED = "completed"  # Analysis attached
+    FAILED = "failed"
+
+
+class CVImport(Base):
+    """Bulk CV import job"""
+    __tablename__ = "cv_imports"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_role = Column(String, nullable=False)  # Default role for files without one in the manifest
+    status = Column(Enum(CVImportStatus), default=CVImportStatus.PENDING)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)  # Null when run from the CLI
+    total_files = Column(Integer, default=0)
+    completed_files = Column(Integer, default=0)
+    failed_files = Column(Integer, default=0)
+    report = Column(JSON)  # Throughput report of the last run
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    # Worker lease: set while a run is in progress and renewed after every batch, reclaimable once expired
+    claimed_by = Column(String, nullable=True)
+    claim_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Relationships
+    items = relationship("CVImportItem", back_populates="cv_import")
+
+
+class CVImportItem(Base):
+    """One file of a bulk CV import"""
+    __tablename__ = "cv_import_items"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    import_id = Column(Integer, ForeignKey("cv_imports.id"), nullable=False, index=True)
+    file_name = Column(String, nullable=False)  # Name in the upload or zip
+    file_path = Column(String, nullable=False)  # Stored copy
+    sha256 = Column(String(64), nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    candidate_email = Column(String, nullable=True)  # From the manifest
+    candidate_name = Column(String, nullable=True)
+    job_role = Column(String, nullable=True)  # From the manifest, overrides the import's role
+    application_id = Column(Integer, ForeignKey("applications.id"), nullable=True)
+    status = Column(Enum(CVImportItemStatus), default=CVImportItemStatus.STAGED, index=True)
+    error = Column(Text, nullable=True)
+    
+    # Relationships
+    cv_import = relationship("CVImport", back_populates="items")
+    application = relationship("Application")
@@ -2,7 +2,7 @@
 Interview Models
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -18,9 +18,24 @@ class InterviewStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+class ScoringStatus(str, enum.Enum):
+    """Response scoring status"""
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Interview(Base):
     """Interview model"""
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Keyset pagination of the candidate ranking: ORDER BY overall_score DESC, id DESC
+        # reads these backwards (overall_score is NOT NULL, so no NULLS ordering applies)
+        Index("ix_interviews_score_id", "overall_score", "id"),
+        Index("ix_interviews_role_score_id", "role", "overall_score", "id"),
+        Index("ix_interviews_status_score_id", "status", "overall_score", "id"),
+        Index("ix_interviews_candidate_id_id", "candidate_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -31,7 +46,7 @@ class Interview(Base):
     scheduled_at = Column(DateTime(timezone=True))
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
-    overall_score = Column(Float, default=0.0)
+    overall_score = Column(Float, nullable=False, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -43,6 +58,10 @@ class Interview(Base):
 class InterviewResponse(Base):
     """Interview response model"""
     __tablename__ = "interview_responses"
+    __table_args__ = (
+        # Responses are always loaded per interview
+        Index("ix_interview_responses_interview_question", "interview_id", "question_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False)
@@ -61,6 +80,9 @@ class InterviewResponse(Base):
     sentiment_analysis = Column(JSON)  # Detailed sentiment analysis
     behavioral_cues = Column(JSON)  # Behavioral indicators
     ai_feedback = Column(Text)  # AI-generated feedback
+    followup_question = Column(Text)  # Streamed follow-up question asked after this answer
+    candidate_feedback = Column(Text)  # Streamed feedback shown to the candidate
+    scoring_status = Column(Enum(ScoringStatus), default=ScoringStatus.COMPLETED)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
@@ -2,7 +2,7 @@
 Question Bank Models
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, Index
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -11,6 +11,12 @@ from app.core.database import Base
 class QuestionBank(Base):
     """Question bank model"""
     __tablename__ = "question_banks"
+    __table_args__ = (
+        # Keyset pagination of role/category listings
+        Index("ix_question_banks_role_category_id", "role", "category", "id"),
+        # Question selection samples by role and difficulty
+        Index("ix_question_banks_role_difficulty", "role", "difficulty_level", "is_active"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     role = Column(String, nullable=False, index=True)  # e.g., "developer", "designer", "manager"
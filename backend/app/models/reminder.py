@@ -2,7 +2,7 @@
 Reminder Model
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -20,6 +20,10 @@ class ReminderStatus(str, enum.Enum):
 class Reminder(Base):
     """Reminder model"""
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Due reminder lookups: status = pending AND scheduled_time <= now
+        Index("ix_reminders_status_scheduled_time", "status", "scheduled_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False)
@@ -28,6 +32,9 @@ class Reminder(Base):
     scheduled_time = Column(DateTime(timezone=True), nullable=False)
     status = Column(Enum(ReminderStatus), default=ReminderStatus.PENDING)
     sent_at = Column(DateTime(timezone=True))
+    # Dispatcher lease: set while a dispatcher delivers the reminder, reclaimable once expired
+    claimed_by = Column(String, nullable=True, index=True)
+    claim_expires_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -0,0 +1,19 @@
+"""
+Dashboard Statistics Models
+"""
+
+from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class InterviewRoleStats(Base):
+    """Interview totals per job role, kept up to date as interviews change"""
+    __tablename__ = "interview_role_stats"
+    
+    role = Column(String, primary_key=True)
+    total_interviews = Column(Integer, nullable=False, default=0)
+    completed_interviews = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)  # Sum of overall_score of completed interviews
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -3,10 +3,11 @@ Application Schemas
 """
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Dict, Any
 from datetime import datetime
 
-from app.models.application import ApplicationStatus
+from app.models.application import ApplicationStatus, CVProcessingStatus
+from app.models.cv_import import CVImportStatus
 
 
 class ApplicationBase(BaseModel):
@@ -34,9 +35,38 @@ class ApplicationResponse(ApplicationBase):
     cv_file_path: Optional[str] = None
     cv_text: Optional[str] = None
     cv_analysis: Optional[str] = None
+    cv_sha256: Optional[str] = None
+    cv_size_bytes: Optional[int] = None
+    cv_status: Optional[CVProcessingStatus] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
 
+
+
+class CVUploadStatus(BaseModel):
+    """CV processing status resource"""
+    application_id: int
+    cv_status: Optional[CVProcessingStatus] = None
+    cv_sha256: Optional[str] = None
+    cv_size_bytes: Optional[int] = None
+    status_url: str
+
+
+class CVImportResponse(BaseModel):
+    """Bulk CV import progress and throughput report"""
+    id: int
+    job_role: str
+    status: CVImportStatus
+    total_files: int = 0
+    completed_files: int = 0
+    failed_files: int = 0
+    report: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -2,11 +2,11 @@
 Interview Schemas
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, conint
 from typing import Optional, List
 from datetime import datetime
 
-from app.models.interview import InterviewStatus
+from app.models.interview import InterviewStatus, ScoringStatus
 
 
 class InterviewBase(BaseModel):
@@ -21,6 +21,20 @@ class InterviewCreate(InterviewBase):
     hr_id: Optional[int] = None
 
 
+class InterviewSlot(BaseModel):
+    """One candidate of a bulk scheduling request"""
+    candidate_id: int
+    scheduled_at: Optional[datetime] = None  # Defaults to the batch's scheduled_at
+
+
+class InterviewBulkCreate(InterviewBase):
+    """Bulk interview scheduling schema (one interview per candidate)"""
+    hr_id: Optional[int] = None
+    candidates: List[InterviewSlot] = Field(..., min_length=1, max_length=1000)
+    # Minutes before each interview at which a reminder is sent
+    reminder_offsets_minutes: List[conint(gt=0)] = Field([24 * 60, 60, 10], min_length=1, max_length=5)
+
+
 class InterviewUpdate(BaseModel):
     """Interview update schema"""
     status: Optional[InterviewStatus] = None
@@ -44,6 +58,12 @@ class InterviewResponse(BaseModel):
         from_attributes = True
 
 
+class InterviewBulkResult(BaseModel):
+    """Bulk interview scheduling result"""
+    interviews: List[InterviewResponse]
+    reminders_created: int
+
+
 class InterviewResponseBase(BaseModel):
     """Base interview response schema"""
     question: str
@@ -56,6 +76,11 @@ class InterviewResponseCreate(InterviewResponseBase):
     interview_id: int
 
 
+class InterviewResponseBatchCreate(BaseModel):
+    """Batch interview response submission schema"""
+    responses: List[InterviewResponseBase]
+
+
 class InterviewResponseDetail(InterviewResponseBase):
     """Detailed interview response schema"""
     id: int
@@ -68,6 +93,9 @@ class InterviewResponseDetail(InterviewResponseBase):
     sentiment_analysis: Optional[dict] = None
     behavioral_cues: Optional[dict] = None
     ai_feedback: Optional[str] = None
+    followup_question: Optional[str] = None
+    candidate_feedback: Optional[str] = None
+    scoring_status: Optional[ScoringStatus] = ScoringStatus.COMPLETED
     created_at: datetime
     
     class Config:
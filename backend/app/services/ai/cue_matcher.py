@@ -0,0 +1,167 @@
+"""
+Behavioral Cue Matcher
+Counts behavioral cue phrases on word boundaries from a single tokenization
+of the text
+"""
+
+import json
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Default cue vocabularies, keyed by behavioral_cues category
+DEFAULT_CUE_LEXICONS: Dict[str, List[str]] = {
+    "confidence_indicators": ["confident", "certain", "definitely", "sure", "proven", "successful"],
+    "uncertainty_indicators": ["maybe", "perhaps", "might", "uncertain", "not sure", "think"],
+    "enthusiasm_indicators": ["excited", "passionate", "love", "enjoy", "enthusiastic", "eager"],
+    "professional_indicators": ["collaborate", "team", "professional", "experience", "skills"],
+}
+
+# Words, plus punctuation runs so that phrases do not match across them
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]+")
+
+# ASCII characters outside \w: whitespace separates tokens, punctuation becomes its own token
+ASCII_SEPARATORS = str.maketrans({
+    chr(code): " " if chr(code).isspace() else " | "
+    for code in range(128) if not (chr(code).isalnum() or chr(code) == "_")
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into word and punctuation tokens (translate + split in C for ASCII text)"""
+    if text.isascii():
+        return text.translate(ASCII_SEPARATORS).split()
+    return TOKEN_PATTERN.findall(text)
+
+
+def _count_sequence(tokens: List[str], phrase: Tuple[str, ...]) -> int:
+    """Count non-overlapping occurrences of a multi-word phrase in tokens"""
+    first, rest, size = phrase[0], list(phrase[1:]), len(phrase)
+    count = 0
+    pos = -1
+    try:
+        while True:
+            pos = tokens.index(first, pos + 1)
+            if tokens[pos + 1:pos + size] == rest:
+                count += 1
+                pos += size - 1
+    except ValueError:
+        return count
+
+
+def _occurrences(phrase: Tuple[str, ...], sub: Tuple[str, ...]) -> int:
+    """Number of times sub appears as a word sequence inside phrase"""
+    size = len(sub)
+    return sum(1 for i in range(len(phrase) - size + 1) if phrase[i:i + size] == sub)
+
+
+class CueMatcher:
+    """
+    Matches all cue vocabularies against one tokenization of the text
+
+    Phrases are word sequences, so "think" no longer matches inside
+    "rethinking". Single words are counted with one Counter over the tokens
+    that belong to the vocabulary; multi-word phrases are located with
+    list.index on their first word. Longer phrases take precedence, so
+    "not sure" is not also counted as "sure".
+    """
+
+    def __init__(self, lexicons: Dict[str, List[str]]):
+        self.categories = list(lexicons.keys())
+        phrase_categories: Dict[Tuple[str, ...], List[str]] = {}
+        for category, phrases in lexicons.items():
+            for phrase in phrases:
+                words = tuple(tokenize(phrase.lower()))
+                if words:
+                    phrase_categories.setdefault(words, []).append(category)
+
+        # Lexicon order, used for the hits lists
+        self._phrases = [(" ".join(words), words, categories) for words, categories in phrase_categories.items()]
+        self._vocabulary = {word for words in phrase_categories for word in words}
+        self._multi_word = sorted((words for words in phrase_categories if len(words) > 1), key=len, reverse=True)
+
+        # Shorter phrases inside each multi-word phrase, with their multiplicity
+        self._contained = [
+            (words, [(sub, _occurrences(words, sub)) for sub in phrase_categories
+                     if len(sub) < len(words) and _occurrences(words, sub)])
+            for words in self._multi_word
+        ]
+
+    def match(self, text: str) -> Dict[str, Dict]:
+        """
+        Find every cue category in the text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mapping of category to {"hits": [...], "count": int}, where hits
+            are the distinct phrases found in lexicon order and count is the
+            total number of occurrences
+        """
+        result = {category: {"hits": [], "count": 0} for category in self.categories}
+        if not text:
+            return result
+
+        tokens = tokenize(text.lower())
+        word_counts = Counter(filter(self._vocabulary.__contains__, tokens))
+        if not word_counts:
+            return result
+
+        counts = {}
+        for words in self._multi_word:
+            if all(word_counts[word] for word in words):
+                counts[words] = _count_sequence(tokens, words)
+
+        # Longest first, so each phrase only gives up occurrences it owns
+        for words, contained in self._contained:
+            count = counts.get(words, 0)
+            if count:
+                for sub, times in contained:
+                    base = counts[sub] if len(sub) > 1 else counts.get(sub, word_counts[sub[0]])
+                    counts[sub] = base - times * count
+
+        for phrase, words, categories in self._phrases:
+            count = counts.get(words, 0) if len(words) > 1 else counts.get(words, word_counts[words[0]])
+            if count > 0:
+                for category in categories:
+                    result[category]["hits"].append(phrase)
+                    result[category]["count"] += count
+        return result
+
+
+def _load_role_lexicons() -> Dict[str, Dict[str, List[str]]]:
+    """Load per-role lexicon overrides from CUE_LEXICONS_FILE"""
+    if not settings.CUE_LEXICONS_FILE:
+        return {}
+    try:
+        with open(settings.CUE_LEXICONS_FILE, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except Exception as e:
+        print(f"Error loading cue lexicons: {e}")
+        return {}
+
+
+def lexicons_for_role(role: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Build the cue vocabularies for a role
+
+    Entries for the role (or "default") in CUE_LEXICONS_FILE extend the
+    built-in vocabularies; new categories are added as-is.
+    """
+    role_lexicons = _load_role_lexicons()
+    lexicons = {category: list(words) for category, words in DEFAULT_CUE_LEXICONS.items()}
+    for key in ("default", (role or "").lower()):
+        for category, words in role_lexicons.get(key, {}).items():
+            lexicons.setdefault(category, [])
+            lexicons[category].extend(w for w in words if w not in lexicons[category])
+    return lexicons
+
+
+@lru_cache(maxsize=64)
+def get_cue_matcher(role: Optional[str] = None) -> CueMatcher:
+    """Compiled matcher for a role, built once per process"""
+    return CueMatcher(lexicons_for_role(role))
@@ -3,10 +3,14 @@ CV/Resume Analyzer Service
 Extracts text from CV files and analyzes them using AI
 """
 
-from typing import Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple
+import multiprocessing
 import os
-from openai import OpenAI
 from app.core.config import settings
+from app.services.registry import get_openai_client, get_async_openai_client
 
 try:
     import PyPDF2
@@ -20,92 +24,109 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+# Returned when the AI analysis fails; never stored in the shared CV cache
+ANALYSIS_UNAVAILABLE = "CV analysis unavailable. Please review manually."
+
+# Characters of CV text sent to the model for analysis
+ANALYSIS_MAX_CHARS = 3000
+
+# Process pool for extracting page ranges of large PDFs
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = Lock()
+
 
 class CVAnalyzer:
     """Service for analyzing CVs/resumes"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
+        self.async_client = get_async_openai_client()
         self.model = settings.OPENAI_MODEL
     
-    def extract_text(self, file_path: str, file_ext: str) -> str:
+    def extract_text(self, file_path: str, file_ext: str, max_chars: Optional[int] = None) -> str:
         """
         Extract text from CV file
         
         Args:
             file_path: Path to the CV file
             file_ext: File extension (.pdf, .docx, .txt)
+            max_chars: Stop once this much text is extracted (defaults to
+                CV_EXTRACT_MAX_CHARS; never less than what the analysis uses)
         
         Returns:
             Extracted text
         """
-        try:
-            if file_ext == '.pdf':
-                return self._extract_from_pdf(file_path)
-            elif file_ext in ['.doc', '.docx']:
-                return self._extract_from_docx(file_path)
-            elif file_ext == '.txt':
-                return self._extract_from_txt(file_path)
-            else:
-                return ""
-        except Exception as e:
-            print(f"Error extracting text: {e}")
-            return ""
+        return extract_file_text(file_path, file_ext, max_chars)
     
-    def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF"""
-        if not PDF_AVAILABLE:
-            return "PDF extraction not available. Install PyPDF2: pip install PyPDF2"
+    def extract_text_many(self, files: List[Tuple[str, str]]) -> List[str]:
+        """
+        Extract several files, one file per PDF pool worker
         
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            print(f"Error reading PDF: {e}")
-        return text
-    
-    def _extract_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX"""
-        if not DOCX_AVAILABLE:
-            return "DOCX extraction not available. Install python-docx: pip install python-docx"
+        Args:
+            files: (file_path, file_ext) pairs
         
-        text = ""
-        try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-        except Exception as e:
-            print(f"Error reading DOCX: {e}")
-        return text
-    
-    def _extract_from_txt(self, file_path: str) -> str:
-        """Extract text from TXT"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except Exception as e:
-            print(f"Error reading TXT: {e}")
-            return ""
+        Returns:
+            Extracted texts in the same order as files
+        """
+        if _pdf_pool_size() < 2 or len(files) < 2:
+            return [extract_file_text(path, ext) for path, ext in files]
+        paths = [path for path, _ in files]
+        exts = [ext for _, ext in files]
+        return list(get_pdf_pool().map(_extract_file_in_worker, paths, exts))
     
-    def analyze_cv(self, cv_text: str, job_role: str) -> str:
+    def analyze_cv(self, cv_text: str, job_role: str, raise_errors: bool = False) -> str:
         """
         Analyze CV using AI
         
         Args:
             cv_text: Extracted text from CV
             job_role: Job role applied for
+            raise_errors: Raise API errors instead of returning the fallback
         
         Returns:
             AI analysis of the CV
         """
+        messages = self._analysis_messages(cv_text, job_role)
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=500
+            )
+            
+            return response.choices[0].message.content
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Error analyzing CV: {e}")
+            return ANALYSIS_UNAVAILABLE
+    
+    async def analyze_cv_async(self, cv_text: str, job_role: str) -> str:
+        """Async version of analyze_cv using AsyncOpenAI"""
+        messages = self._analysis_messages(cv_text, job_role)
+        
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=500
+            )
+            
+            return response.choices[0].message.content
+        except Exception as e:
+            print(f"Error analyzing CV: {e}")
+            return ANALYSIS_UNAVAILABLE
+    
+    def _analysis_messages(self, cv_text: str, job_role: str) -> list:
+        """Build chat messages for CV analysis"""
         prompt = f"""
         Analyze this CV/resume for a {job_role} position.
         
         CV Content:
-        {cv_text[:3000]}  # Limit to avoid token limits
+        {cv_text[:ANALYSIS_MAX_CHARS]}  # Limit to avoid token limits
         
         Provide analysis in the following format:
         1. Key Skills Match: List skills that match the job role
@@ -117,20 +138,165 @@ class CVAnalyzer:
         
         Be concise and objective.
         """
+        return [
+            {"role": "system", "content": "You are an expert HR recruiter analyzing CVs. Be objective and thorough."},
+            {"role": "user", "content": prompt}
+        ]
+
+
+def extract_file_text(
+    file_path: str,
+    file_ext: str,
+    max_chars: Optional[int] = None,
+    parallel: bool = True
+) -> str:
+    """
+    Extract text from a CV file (see CVAnalyzer.extract_text)
+    
+    parallel=False keeps large PDFs in the calling process.
+    """
+    if max_chars is None:
+        max_chars = settings.CV_EXTRACT_MAX_CHARS
+    if max_chars:
+        max_chars = max(max_chars, ANALYSIS_MAX_CHARS)
+    
+    try:
+        if file_ext == '.pdf':
+            return _extract_from_pdf(file_path, max_chars or None, parallel)
+        elif file_ext in ['.doc', '.docx']:
+            return _extract_from_docx(file_path)
+        elif file_ext == '.txt':
+            return _extract_from_txt(file_path)
+        else:
+            return ""
+    except Exception as e:
+        print(f"Error extracting text: {e}")
+        return ""
+
+
+def _extract_from_pdf(file_path: str, max_chars: Optional[int] = None, parallel: bool = True) -> str:
+    """
+    Extract text from PDF
+    
+    Pages are streamed and joined once. Large documents are split into
+    page ranges extracted in parallel by the PDF process pool. Extraction
+    stops at the first page that brings the text past max_chars.
+    """
+    if not PDF_AVAILABLE:
+        return "PDF extraction not available. Install PyPDF2: pip install PyPDF2"
+    
+    try:
+        with open(file_path, 'rb') as file:
+            page_count = len(PyPDF2.PdfReader(file).pages)
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert HR recruiter analyzing CVs. Be objective and thorough."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
+        if parallel and page_count >= settings.CV_PDF_PARALLEL_MIN_PAGES and _pdf_pool_size() > 1:
+            chunks = _iter_pdf_chunks_parallel(file_path, page_count)
+        else:
+            chunks = iter_pdf_pages(file_path)
+        return _join_until(chunks, max_chars)
+    except Exception as e:
+        print(f"Error reading PDF: {e}")
+        return ""
+
+
+def _extract_from_docx(file_path: str) -> str:
+    """Extract text from DOCX"""
+    if not DOCX_AVAILABLE:
+        return "DOCX extraction not available. Install python-docx: pip install python-docx"
+    
+    try:
+        doc = Document(file_path)
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
+    except Exception as e:
+        print(f"Error reading DOCX: {e}")
+        return ""
+
+
+def _extract_from_txt(file_path: str) -> str:
+    """Extract text from TXT"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.read()
+    except Exception as e:
+        print(f"Error reading TXT: {e}")
+        return ""
+
+
+def _extract_file_in_worker(file_path: str, file_ext: str) -> str:
+    """Extract a whole file in a PDF pool worker (pages are not split further)"""
+    return extract_file_text(file_path, file_ext, parallel=False)
+
+
+def iter_pdf_pages(file_path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of each page in [start, stop), newline-terminated"""
+    with open(file_path, 'rb') as file:
+        pages = PyPDF2.PdfReader(file).pages
+        for index in range(start, len(pages) if stop is None else min(stop, len(pages))):
+            yield (pages[index].extract_text() or "") + "\n"
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> str:
+    """Extract a range of pages (runs in a PDF pool worker)"""
+    return "".join(iter_pdf_pages(file_path, start, stop))
+
+
+def _join_until(chunks: Iterator[str], max_chars: Optional[int] = None) -> str:
+    """Join text chunks once, stopping after the chunk that reaches max_chars"""
+    parts: List[str] = []
+    total = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        total += len(chunk)
+        if max_chars and total >= max_chars:
+            if hasattr(chunks, "close"):
+                chunks.close()
+            break
+    return "".join(parts)
+
+
+def _iter_pdf_chunks_parallel(file_path: str, page_count: int) -> Iterator[str]:
+    """
+    Yield page-range texts in order, extracted by the PDF process pool
+    
+    At most one range per worker is in flight, so stopping early (closing
+    the generator) leaves little wasted work; pending ranges are cancelled.
+    """
+    pool = get_pdf_pool()
+    step = max(1, settings.CV_PDF_PAGES_PER_TASK)
+    ranges = deque((start, min(start + step, page_count)) for start in range(0, page_count, step))
+    in_flight = deque()
+    try:
+        while ranges or in_flight:
+            while ranges and len(in_flight) < _pdf_pool_size():
+                start, stop = ranges.popleft()
+                in_flight.append(pool.submit(_extract_page_range, file_path, start, stop))
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def _pdf_pool_size() -> int:
+    """Configured number of PDF extraction processes"""
+    return settings.CV_PDF_WORKERS or os.cpu_count() or 1
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the shared PDF extraction pool, starting it on first use"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=_pdf_pool_size(),
+                mp_context=multiprocessing.get_context("spawn")
             )
-            
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"Error analyzing CV: {e}")
-            return "CV analysis unavailable. Please review manually."
+        return _pdf_pool
+
 
+def shutdown_pdf_pool():
+    """Stop the shared PDF extraction pool"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,564 @@
+"""
+Bulk CV Import
+Stages many CVs (files or zip archives), creates their applications in
+batches, extracts text with the PDF worker pool and analyzes them under a
+request rate limit. Progress is stored per file so an interrupted import
+can be resumed. A run holds a lease on its import, so the same import
+never runs on two workers at once.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import secrets
+import socket
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.rate_limit import RateLimiter
+from app.core.security import get_password_hash
+from app.core.tasks import BackgroundTaskQueue
+from app.models.application import Application, ApplicationStatus, CVProcessingStatus
+from app.models.cv_import import CVImport, CVImportItem, CVImportStatus, CVImportItemStatus
+from app.models.user import User, UserRole
+from app.services.ai.cv_analyzer import ANALYSIS_UNAVAILABLE
+from app.services.ai.cv_store import CVStore, normalize_job_role
+from app.services.registry import get_cv_analyzer
+
+IMPORT_DIR = Path("uploads/imports")
+ALLOWED_CV_EXTENSIONS = {'.pdf', '.doc', '.docx', '.txt'}
+MANIFEST_NAME = "manifest.csv"  # Optional: file,email,full_name,job_role
+PLACEHOLDER_EMAIL_DOMAIN = "imports.botboss.local"
+
+import_queue = BackgroundTaskQueue("cv-import", max_workers=1)
+
+# Session.info key holding the lease token of the run using the session
+_IMPORT_CLAIM = "cv_import_claim"
+
+
+class ImportLeaseLost(Exception):
+    """The lease of a run expired and another worker claimed the import"""
+
+
+def create_import(db: Session, job_role: str, created_by: Optional[int] = None) -> CVImport:
+    """Create an import job and its staging directory"""
+    cv_import = CVImport(job_role=job_role, created_by=created_by, status=CVImportStatus.PENDING)
+    db.add(cv_import)
+    db.commit()
+    import_dir(cv_import.id).mkdir(parents=True, exist_ok=True)
+    return cv_import
+
+
+def import_dir(import_id: int) -> Path:
+    """Staging directory of an import"""
+    return IMPORT_DIR / str(import_id)
+
+
+def is_cv_file(file_name: str) -> bool:
+    """Whether a file (or archive entry) should be imported as a CV"""
+    path = Path(file_name)
+    if path.name.startswith(".") or "__MACOSX" in path.parts:
+        return False
+    return path.suffix.lower() in ALLOWED_CV_EXTENSIONS
+
+
+def new_item(
+    cv_import: CVImport,
+    file_name: str,
+    file_path: Path,
+    size_bytes: int,
+    sha256: str
+) -> CVImportItem:
+    """Item for a staged file (added to the session and committed by the caller)"""
+    return CVImportItem(
+        import_id=cv_import.id,
+        file_name=file_name,
+        file_path=str(file_path),
+        sha256=sha256,
+        size_bytes=size_bytes,
+        status=CVImportItemStatus.STAGED
+    )
+
+
+def stage_stream(
+    cv_import: CVImport,
+    file_name: str,
+    source: BinaryIO,
+    index: int
+) -> Optional[CVImportItem]:
+    """
+    Copy a CV into the staging directory, hashing it in chunks
+
+    Returns:
+        The staged item, or None if the file exceeds CV_MAX_UPLOAD_BYTES
+    """
+    destination = import_dir(cv_import.id) / f"{index}_{Path(file_name).name}"
+    digest = hashlib.sha256()
+    size = 0
+    with open(destination, "wb") as buffer:
+        while True:
+            chunk = source.read(settings.CV_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > settings.CV_MAX_UPLOAD_BYTES:
+                break
+            digest.update(chunk)
+            buffer.write(chunk)
+
+    if size > settings.CV_MAX_UPLOAD_BYTES:
+        print(f"Skipping {file_name}: larger than {settings.CV_MAX_UPLOAD_BYTES} bytes")
+        destination.unlink()
+        return None
+    return new_item(cv_import, file_name, destination, size, digest.hexdigest())
+
+
+def stage_zip(
+    cv_import: CVImport,
+    archive_path: Path,
+    start_index: int = 0
+) -> Tuple[List[CVImportItem], Dict]:
+    """
+    Stage every CV in a zip archive
+
+    Only touches the filesystem, so it can run in a worker thread; the
+    caller adds the returned items to its session.
+
+    Returns:
+        (staged items, manifest rows found in the archive keyed by file name)
+    """
+    items = []
+    manifest = {}
+    with zipfile.ZipFile(archive_path) as archive:
+        for entry in archive.infolist():
+            if entry.is_dir():
+                continue
+            if Path(entry.filename).name.lower() == MANIFEST_NAME:
+                with archive.open(entry) as source:
+                    manifest.update(read_manifest(source))
+                continue
+            if not is_cv_file(entry.filename):
+                continue
+            if start_index + len(items) >= settings.CV_IMPORT_MAX_FILES:
+                print(f"Import {cv_import.id}: file limit of {settings.CV_IMPORT_MAX_FILES} reached")
+                break
+            with archive.open(entry) as source:
+                item = stage_stream(cv_import, entry.filename, source, start_index + len(items))
+            if item is not None:
+                items.append(item)
+    return items, manifest
+
+
+def read_manifest(source: BinaryIO) -> Dict[str, Dict]:
+    """Parse a manifest CSV (file,email,full_name,job_role) keyed by base file name"""
+    rows = {}
+    reader = csv.DictReader(io.TextIOWrapper(source, encoding="utf-8-sig"))
+    for row in reader:
+        name = Path((row.get("file") or "").strip()).name
+        if name:
+            rows[name] = {key: (value or "").strip() for key, value in row.items() if key}
+    return rows
+
+
+def apply_manifest(items: List[CVImportItem], manifest: Dict[str, Dict]):
+    """Set candidate details and job roles of staged items from manifest rows"""
+    for item in items:
+        row = manifest.get(Path(item.file_name).name)
+        if not row:
+            continue
+        item.candidate_email = row.get("email") or None
+        item.candidate_name = row.get("full_name") or None
+        item.job_role = row.get("job_role") or None
+
+
+def finish_staging(db: Session, cv_import: CVImport):
+    """Commit staged items and record the file count"""
+    db.flush()
+    cv_import.total_files = db.query(CVImportItem).filter(CVImportItem.import_id == cv_import.id).count()
+    db.commit()
+
+
+def claim_import(db: Session, import_id: int) -> Optional[str]:
+    """
+    Mark an import as running under a new lease
+
+    The UPDATE only matches an import that is not running or whose lease
+    has expired, so two workers never claim the same import.
+
+    Returns:
+        The claim token, or None if another worker holds the import
+    """
+    now = datetime.utcnow()
+    token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+    claimed = db.execute(
+        update(CVImport)
+        .where(
+            CVImport.id == import_id,
+            or_(
+                CVImport.status != CVImportStatus.RUNNING,
+                CVImport.claim_expires_at.is_(None),
+                CVImport.claim_expires_at < now,
+            )
+        )
+        .values(
+            status=CVImportStatus.RUNNING,
+            started_at=datetime.now(timezone.utc),
+            claimed_by=token,
+            claim_expires_at=now + timedelta(seconds=settings.CV_IMPORT_LEASE_SECONDS)
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return token if claimed else None
+
+
+def import_running(db: Session, import_id: int) -> bool:
+    """Whether a worker currently holds an unexpired lease on the import"""
+    return db.query(CVImport.id).filter(
+        CVImport.id == import_id,
+        CVImport.status == CVImportStatus.RUNNING,
+        CVImport.claim_expires_at >= datetime.utcnow()
+    ).first() is not None
+
+
+def run_import(import_id: int) -> Optional[Dict]:
+    """
+    Run (or resume) an import
+
+    Each stage only picks up files that have not been through it yet, so
+    running an interrupted import again continues where it stopped.
+
+    Returns:
+        Throughput report of this run, or None if the import does not
+        exist or is running on another worker
+    """
+    db = SessionLocal()
+    try:
+        token = claim_import(db, import_id)
+        if token is None:
+            if db.query(CVImport.id).filter(CVImport.id == import_id).first() is not None:
+                print(f"CV import {import_id} is already running")
+            return None
+        db.info[_IMPORT_CLAIM] = token
+        cv_import = db.query(CVImport).filter(CVImport.id == import_id).first()
+
+        report = {"files": cv_import.total_files, "stages": {}}
+        started = time.perf_counter()
+        try:
+            for name, stage in (
+                ("create_applications", _create_applications),
+                ("extract", _extract_texts),
+                ("analyze", _analyze_texts),
+            ):
+                stage_started = time.perf_counter()
+                counters = stage(db, cv_import)
+                counters["seconds"] = round(time.perf_counter() - stage_started, 3)
+                report["stages"][name] = counters
+            cv_import.status = CVImportStatus.COMPLETED
+        except ImportLeaseLost:
+            print(f"CV import {import_id}: lease expired, another worker took over")
+            db.rollback()
+            return None
+        except Exception as e:
+            print(f"Error in CV import {import_id}: {e}")
+            db.rollback()
+            cv_import.status = CVImportStatus.FAILED
+            report["error"] = str(e)
+
+        elapsed = time.perf_counter() - started
+        processed = report["stages"].get("analyze", {}).get("files", 0)
+        report["seconds"] = round(elapsed, 3)
+        report["files_per_second"] = round(processed / elapsed, 2) if elapsed else 0.0
+
+        try:
+            _renew_lease(db, cv_import)
+        except ImportLeaseLost:
+            print(f"CV import {import_id}: lease expired, another worker took over")
+            db.rollback()
+            return None
+        cv_import.completed_files = _count_items(db, import_id, CVImportItemStatus.COMPLETED)
+        cv_import.failed_files = _count_items(db, import_id, CVImportItemStatus.FAILED)
+        cv_import.report = report
+        cv_import.finished_at = datetime.now(timezone.utc)
+        cv_import.claimed_by = None
+        cv_import.claim_expires_at = None
+        db.commit()
+        return report
+    finally:
+        db.close()
+
+
+def enqueue_import(import_id: int):
+    """Queue an import for the background import worker"""
+    return import_queue.submit(run_import, import_id)
+
+
+def _renew_lease(db: Session, cv_import: CVImport):
+    """
+    Extend this run's lease (token in db.info); called before each batch commit
+
+    Raises:
+        ImportLeaseLost: if the lease expired and was claimed by another worker
+    """
+    renewed = db.execute(
+        update(CVImport)
+        .where(CVImport.id == cv_import.id, CVImport.claimed_by == db.info[_IMPORT_CLAIM])
+        .values(claim_expires_at=datetime.utcnow() + timedelta(seconds=settings.CV_IMPORT_LEASE_SECONDS))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not renewed:
+        raise ImportLeaseLost(f"lease on import {cv_import.id} lost")
+
+
+def _count_items(db: Session, import_id: int, status: CVImportItemStatus) -> int:
+    return db.query(CVImportItem).filter(
+        CVImportItem.import_id == import_id,
+        CVImportItem.status == status
+    ).count()
+
+
+def _items(db: Session, cv_import: CVImport, status: CVImportItemStatus) -> List[CVImportItem]:
+    return db.query(CVImportItem).filter(
+        CVImportItem.import_id == cv_import.id,
+        CVImportItem.status == status
+    ).order_by(CVImportItem.id).all()
+
+
+def _batches(items: List, size: int):
+    size = max(1, size)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _fail(item: CVImportItem, error: str):
+    item.status = CVImportItemStatus.FAILED
+    item.error = error
+    if item.application is not None:
+        item.application.cv_status = CVProcessingStatus.FAILED
+
+
+def _create_applications(db: Session, cv_import: CVImport) -> Dict:
+    """
+    Create candidates and applications for staged files, one commit per batch
+
+    Manifest emails are only matched to existing candidate accounts; files
+    whose email belongs to an HR or admin user fail instead of being
+    attached to that account.
+    """
+    items = _items(db, cv_import, CVImportItemStatus.STAGED)
+    created_users = 0
+    rejected = 0
+    password_hash = None  # Imported candidates get an unusable random password
+
+    for batch in _batches(items, settings.CV_IMPORT_BATCH_SIZE):
+        emails = {
+            item.id: (item.candidate_email or f"cv-{item.sha256[:16]}@{PLACEHOLDER_EMAIL_DOMAIN}").lower()
+            for item in batch
+        }
+        users = {
+            user.email: user
+            for user in db.query(User).filter(User.email.in_(set(emails.values()))).all()
+        }
+        for item in batch:
+            email = emails[item.id]
+            if email not in users:
+                if password_hash is None:
+                    password_hash = get_password_hash(secrets.token_urlsafe(32))
+                users[email] = User(
+                    email=email,
+                    hashed_password=password_hash,
+                    full_name=item.candidate_name or Path(item.file_name).stem,
+                    role=UserRole.CANDIDATE,
+                    is_active=True
+                )
+                db.add(users[email])
+                created_users += 1
+        db.flush()
+
+        for item in batch:
+            user = users[emails[item.id]]
+            if user.role != UserRole.CANDIDATE:
+                _fail(item, f"{user.email} belongs to a non-candidate account")
+                rejected += 1
+                continue
+            application = Application(
+                candidate_id=user.id,
+                job_role=item.job_role or cv_import.job_role,
+                status=ApplicationStatus.PENDING,
+                cv_file_path=item.file_path,
+                cv_sha256=item.sha256,
+                cv_size_bytes=item.size_bytes,
+                cv_status=CVProcessingStatus.PENDING
+            )
+            db.add(application)
+            item.application = application
+            item.status = CVImportItemStatus.CREATED
+        _renew_lease(db, cv_import)
+        db.commit()
+
+    return {"files": len(items), "candidates_created": created_users, "emails_rejected": rejected}
+
+
+def _extract_texts(db: Session, cv_import: CVImport) -> Dict:
+    """Extract each distinct file once, reusing text already stored for its hash"""
+    items = _items(db, cv_import, CVImportItemStatus.CREATED)
+    store = CVStore(db)
+    cv_analyzer = get_cv_analyzer()
+    extracted = reused = 0
+
+    for batch in _batches(items, settings.CV_IMPORT_BATCH_SIZE):
+        documents = {}
+        to_extract = {}
+        for item in batch:
+            if item.sha256 in documents or item.sha256 in to_extract:
+                continue
+            document = store.get_document(item.sha256)
+            if document is not None:
+                documents[item.sha256] = document
+                reused += 1
+            else:
+                to_extract[item.sha256] = item
+
+        pending = list(to_extract.values())
+        texts = cv_analyzer.extract_text_many(
+            [(item.file_path, Path(item.file_path).suffix.lower()) for item in pending]
+        )
+        for item, text in zip(pending, texts):
+            extracted += 1
+            if text.strip():
+                documents[item.sha256] = store.add_document(item.sha256, text, item.size_bytes)
+
+        for item in batch:
+            document = documents.get(item.sha256)
+            if document is None:
+                _fail(item, "No text could be extracted")
+                continue
+            item.application.cv_document = document
+            item.application.stored_cv_text = None
+            item.application.cv_status = CVProcessingStatus.PROCESSING
+            item.status = CVImportItemStatus.EXTRACTED
+        _renew_lease(db, cv_import)
+        db.commit()
+
+    return {"files": len(items), "documents_extracted": extracted, "documents_reused": reused}
+
+
+def _analyze_texts(db: Session, cv_import: CVImport) -> Dict:
+    """
+    Analyze each distinct (document, job role) once
+
+    Requests run on CV_IMPORT_CONCURRENCY threads, spaced by a shared
+    CV_IMPORT_RATE_PER_MINUTE limiter. Results are committed as they
+    arrive, so an interruption only loses in-flight analyses.
+    """
+    items = _items(db, cv_import, CVImportItemStatus.EXTRACTED)
+    store = CVStore(db)
+    cv_analyzer = get_cv_analyzer()
+    limiter = RateLimiter(settings.CV_IMPORT_RATE_PER_MINUTE)
+
+    groups: Dict[Tuple[int, str], List[CVImportItem]] = {}
+    for item in items:
+        application = item.application
+        groups.setdefault((application.cv_document_id, normalize_job_role(application.job_role)), []).append(item)
+
+    to_analyze = []
+    reused = failed = 0
+    for group in groups.values():
+        application = group[0].application
+        analysis = store.get_analysis(application.cv_document, application.job_role)
+        if analysis is not None:
+            _complete(group, analysis, None)
+            reused += 1
+        else:
+            to_analyze.append(group)
+    _renew_lease(db, cv_import)
+    db.commit()
+
+    with ThreadPoolExecutor(max_workers=max(1, settings.CV_IMPORT_CONCURRENCY)) as executor:
+        futures = {
+            executor.submit(
+                _analyze_with_retry,
+                cv_analyzer,
+                limiter,
+                group[0].application.cv_document.text,
+                group[0].application.job_role
+            ): group
+            for group in to_analyze
+        }
+        try:
+            for future in as_completed(futures):
+                group = futures[future]
+                result = future.result()
+                application = group[0].application
+                if result == ANALYSIS_UNAVAILABLE:
+                    failed += 1
+                    _complete(group, None, result)
+                else:
+                    _complete(group, store.add_analysis(application.cv_document, application.job_role, result), None)
+                _renew_lease(db, cv_import)
+                db.commit()
+        except Exception:
+            # Do not start queued analyses once the run is abandoned
+            for future in futures:
+                future.cancel()
+            raise
+
+    return {
+        "files": len(items),
+        "analyses_run": len(to_analyze),
+        "analyses_reused": reused,
+        "analyses_failed": failed,
+    }
+
+
+def _complete(group: List[CVImportItem], analysis, fallback: Optional[str]):
+    """
+    Attach an analysis (or the fallback text) to every application in a group
+
+    Items given the fallback stay EXTRACTED so resuming retries the analysis.
+    """
+    for item in group:
+        application = item.application
+        application.shared_cv_analysis = analysis
+        application.stored_cv_analysis = fallback
+        application.cv_status = CVProcessingStatus.COMPLETED
+        application.status = ApplicationStatus.REVIEWING
+        if analysis is not None:
+            item.status = CVImportItemStatus.COMPLETED
+            item.error = None
+        else:
+            item.error = "CV analysis unavailable"
+
+
+def _analyze_with_retry(cv_analyzer, limiter: RateLimiter, cv_text: str, job_role: str) -> str:
+    """Analyze a CV, backing off and retrying when the API rate-limits us"""
+    for attempt in range(settings.CV_IMPORT_MAX_RETRIES + 1):
+        limiter.acquire()
+        try:
+            return cv_analyzer.analyze_cv(cv_text, job_role, raise_errors=True)
+        except Exception as e:
+            if getattr(e, "status_code", None) != 429 or attempt == settings.CV_IMPORT_MAX_RETRIES:
+                print(f"Error analyzing CV: {e}")
+                return ANALYSIS_UNAVAILABLE
+            limiter.backoff(_retry_after(e) or 2 ** attempt)
+    return ANALYSIS_UNAVAILABLE
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of a rate-limit error, if any"""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
@@ -0,0 +1,172 @@
+"""
+CV Processing
+Streams CV uploads to disk and runs extraction/analysis in background workers
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+import aiofiles
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.tasks import BackgroundTaskQueue
+from app.models.application import Application, ApplicationStatus, CVProcessingStatus
+from app.services.ai.cv_analyzer import ANALYSIS_UNAVAILABLE
+from app.services.ai.cv_store import CVStore
+from app.services.registry import get_cv_analyzer
+
+cv_queue = BackgroundTaskQueue("cv", max_workers=settings.CV_WORKERS)
+
+
+async def save_upload_stream(
+    file: UploadFile,
+    destination: Path,
+    max_bytes: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Stream an upload to disk in fixed-size chunks
+
+    Memory use is bounded by CV_UPLOAD_CHUNK_BYTES, the SHA-256 is computed
+    incrementally, and uploads over max_bytes are rejected with 413.
+    The file is written under a temporary name and renamed when complete.
+
+    Args:
+        file: Incoming upload
+        destination: Final path for the file
+        max_bytes: Size limit (defaults to CV_MAX_UPLOAD_BYTES)
+
+    Returns:
+        Tuple of (size in bytes, hex SHA-256 digest)
+    """
+    max_bytes = max_bytes or settings.CV_MAX_UPLOAD_BYTES
+    partial = destination.with_name(destination.name + ".part")
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        async with aiofiles.open(partial, "wb") as buffer:
+            while True:
+                chunk = await file.read(settings.CV_UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Maximum size is {max_bytes} bytes"
+                    )
+                digest.update(chunk)
+                await buffer.write(chunk)
+        os.replace(partial, destination)
+    except BaseException:
+        if partial.exists():
+            partial.unlink()
+        raise
+
+    return size, digest.hexdigest()
+
+
+def attach_cv(db: Session, application: Application):
+    """
+    Set the extracted text and analysis of an application's uploaded CV
+
+    Text is only extracted the first time a file hash is seen, and the AI
+    analysis only runs once per (file hash, job role); otherwise the shared
+    entries are reused. Empty extractions and failed analyses are kept on
+    the application and not shared, so a later upload retries them.
+    """
+    store = CVStore(db)
+    cv_analyzer = get_cv_analyzer()
+
+    document = store.get_document(application.cv_sha256)
+    cv_text = document.text if document else None
+    if document is None:
+        file_ext = Path(application.cv_file_path).suffix.lower()
+        cv_text = cv_analyzer.extract_text(application.cv_file_path, file_ext)
+        if cv_text.strip():
+            document = store.add_document(application.cv_sha256, cv_text, application.cv_size_bytes)
+
+    analysis = store.get_analysis(document, application.job_role) if document else None
+    cv_analysis = analysis.analysis if analysis else None
+    if analysis is None:
+        cv_analysis = cv_analyzer.analyze_cv(cv_text, application.job_role)
+        if document is not None and cv_analysis != ANALYSIS_UNAVAILABLE:
+            analysis = store.add_analysis(document, application.job_role, cv_analysis)
+
+    store.link(application, document, analysis, cv_text, cv_analysis)
+
+
+async def attach_cv_async(db: AsyncSession, application: Application):
+    """
+    Async version of attach_cv using the async CV analysis
+
+    Store lookups run on the async session through run_sync and blocking
+    file parsing runs in the threadpool, so the event loop is never blocked.
+    """
+    store = CVStore(db.sync_session)
+    cv_analyzer = get_cv_analyzer()
+
+    document = await db.run_sync(lambda _: store.get_document(application.cv_sha256))
+    cv_text = document.text if document else None
+    if document is None:
+        file_ext = Path(application.cv_file_path).suffix.lower()
+        cv_text = await run_in_threadpool(cv_analyzer.extract_text, application.cv_file_path, file_ext)
+        if cv_text.strip():
+            document = await db.run_sync(
+                lambda _: store.add_document(application.cv_sha256, cv_text, application.cv_size_bytes)
+            )
+
+    analysis = await db.run_sync(lambda _: store.get_analysis(document, application.job_role)) if document else None
+    cv_analysis = analysis.analysis if analysis else None
+    if analysis is None:
+        cv_analysis = await cv_analyzer.analyze_cv_async(cv_text, application.job_role)
+        if document is not None and cv_analysis != ANALYSIS_UNAVAILABLE:
+            analysis = await db.run_sync(lambda _: store.add_analysis(document, application.job_role, cv_analysis))
+
+    store.link(application, document, analysis, cv_text, cv_analysis)
+
+
+def process_cv(application_id: int) -> bool:
+    """
+    Extract and analyze an uploaded CV, updating the application
+
+    Args:
+        application_id: ID of the application with an uploaded CV
+
+    Returns:
+        True if processing completed
+    """
+    db = SessionLocal()
+    try:
+        application = db.query(Application).filter(Application.id == application_id).first()
+        if not application or not application.cv_file_path:
+            return False
+
+        application.cv_status = CVProcessingStatus.PROCESSING
+        db.commit()
+
+        try:
+            attach_cv(db, application)
+            application.cv_status = CVProcessingStatus.COMPLETED
+            application.status = ApplicationStatus.REVIEWING
+        except Exception as e:
+            print(f"Error processing CV for application {application_id}: {e}")
+            db.rollback()
+            application.cv_status = CVProcessingStatus.FAILED
+
+        db.commit()
+        return application.cv_status == CVProcessingStatus.COMPLETED
+    finally:
+        db.close()
+
+
+def enqueue_cv_processing(application_id: int):
+    """Queue an uploaded CV for background extraction and analysis"""
+    return cv_queue.submit(process_cv, application_id)
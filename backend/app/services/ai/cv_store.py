@@ -0,0 +1,85 @@
+"""
+CV Store
+Content-addressed store of extracted CV text and per-role analyses, so the
+same file uploaded to several applications is parsed and analyzed once
+"""
+
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.application import Application, CVDocument, CVAnalysis
+
+
+def normalize_job_role(job_role: str) -> str:
+    """Key used for analyses, so "Backend Engineer" and "backend engineer" share one"""
+    return " ".join((job_role or "").lower().split())
+
+
+class CVStore:
+    """Shared CV documents keyed by file hash, and analyses keyed by (hash, job role)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_document(self, sha256: str) -> Optional[CVDocument]:
+        """Get the extracted text stored for a file hash"""
+        return self.db.query(CVDocument).filter(CVDocument.sha256 == sha256).first()
+
+    def add_document(self, sha256: str, text: str, size_bytes: Optional[int] = None) -> CVDocument:
+        """
+        Store extracted text for a file hash
+
+        If another worker stored the same hash concurrently, its entry is
+        returned instead. Pending changes must be committed beforehand.
+        """
+        document = CVDocument(sha256=sha256, text=text, size_bytes=size_bytes)
+        self.db.add(document)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return self.get_document(sha256)
+        return document
+
+    def get_analysis(self, document: CVDocument, job_role: str) -> Optional[CVAnalysis]:
+        """Get the stored analysis of a document for a job role"""
+        return self.db.query(CVAnalysis).filter(
+            CVAnalysis.document_id == document.id,
+            CVAnalysis.job_role == normalize_job_role(job_role)
+        ).first()
+
+    def add_analysis(self, document: CVDocument, job_role: str, analysis: str) -> CVAnalysis:
+        """
+        Store an analysis of a document for a job role
+
+        If another worker stored the same analysis concurrently, its entry is
+        returned instead. Pending changes must be committed beforehand.
+        """
+        entry = CVAnalysis(document_id=document.id, job_role=normalize_job_role(job_role), analysis=analysis)
+        self.db.add(entry)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return self.get_analysis(document, job_role)
+        return entry
+
+    def link(
+        self,
+        application: Application,
+        document: Optional[CVDocument],
+        analysis: Optional[CVAnalysis],
+        cv_text: Optional[str] = None,
+        cv_analysis: Optional[str] = None
+    ):
+        """
+        Point an application at the shared entries
+
+        cv_text / cv_analysis are only kept on the application when there is
+        no shared entry for them (failed extraction or analysis).
+        """
+        application.cv_document = document
+        application.shared_cv_analysis = analysis
+        application.stored_cv_text = None if document is not None else cv_text
+        application.stored_cv_analysis = None if analysis is not None else cv_analysis
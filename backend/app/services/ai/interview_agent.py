@@ -3,17 +3,43 @@ AI Interview Agent - Agentic AI Implementation
 Manages the interview flow and question generation
 """
 
-from typing import List, Dict, Optional
-from openai import OpenAI
+import asyncio
+import json
+from typing import AsyncIterator, List, Dict, Optional
+from app.core.cache import create_cache, make_cache_key
 from app.core.config import settings
+from app.services.registry import get_openai_client, get_async_openai_client
+
+# Generated question sets are shared by every agent in the process
+question_cache = create_cache(
+    "questions",
+    max_entries=settings.QUESTION_CACHE_MAX_ENTRIES,
+    default_ttl=settings.QUESTION_CACHE_TTL_SECONDS
+)
+
+EVALUATION_FIELDS = """
+        1. relevance_score (0-1): How relevant is the answer to the question
+        2. clarity_score (0-1): How clear and well-structured is the answer
+        3. sentiment: Overall sentiment (positive, neutral, negative)
+        4. confidence_indicators: List of confidence indicators found
+        5. feedback: Constructive feedback for the candidate
+        6. strengths: List of strengths in the answer
+        7. improvements: List of areas for improvement
+"""
+
+EVALUATION_SCORE_FIELDS = ("relevance_score", "clarity_score")
+
+EVALUATION_SYSTEM_PROMPT = "You are an expert interviewer evaluating candidate responses. Be objective and constructive."
 
 
 class InterviewAgent:
     """AI Agent for conducting interviews"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
+        self.async_client = get_async_openai_client()
         self.model = settings.OPENAI_MODEL
+        self.question_cache = question_cache
     
     def generate_questions(
         self,
@@ -34,39 +60,64 @@ class InterviewAgent:
         Returns:
             List of question dictionaries
         """
-        prompt = f"""
-        Generate {num_questions} interview questions for a {role} position.
-        Category: {category}
-        Difficulty: {difficulty}
+        messages = self._question_messages(role, category, num_questions, difficulty)
+        cache_key = make_cache_key(self.model, messages)
+        cached = self.question_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        For each question, provide:
-        1. The question text
-        2. Expected keywords or topics that should be covered in a good answer
-        3. Question type (technical, behavioral, or situational)
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=1000
+            )
+            questions = self._parse_questions(response.choices[0].message.content)
+            self.question_cache.set(cache_key, questions)
+            return questions
+            
+        except Exception as e:
+            print(f"Error generating questions: {e}")
+            return self.get_fallback_questions(role, num_questions)
+    
+    async def generate_questions_async(
+        self,
+        role: str,
+        category: str = "mixed",
+        num_questions: int = 5,
+        difficulty: str = "medium",
+        raise_errors: bool = False,
+        exclude: Optional[List[str]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Async version of generate_questions
         
-        Format as JSON array with keys: question, expected_keywords, type
+        raise_errors raises instead of returning fallback questions; exclude
+        lists questions already asked, which the model is told not to repeat.
         """
+        messages = self._question_messages(role, category, num_questions, difficulty, exclude)
+        cache_key = make_cache_key(self.model, messages)
+        cached = await self.question_cache.get_async(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert HR interviewer. Generate relevant interview questions."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0.7,
                 max_tokens=1000
             )
-            
-            import json
-            questions_text = response.choices[0].message.content
-            # Extract JSON from response
-            questions = json.loads(questions_text)
-            return questions if isinstance(questions, list) else [questions]
+            questions = self._parse_questions(response.choices[0].message.content)
+            await self.question_cache.set_async(cache_key, questions)
+            return questions
             
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error generating questions: {e}")
-            return self._get_fallback_questions(role, num_questions)
+            return self.get_fallback_questions(role, num_questions)
     
     def evaluate_response(
         self,
@@ -85,43 +136,141 @@ class InterviewAgent:
         Returns:
             Dictionary with scores and feedback
         """
-        prompt = f"""
-        Evaluate this interview response:
-        
-        Question: {question}
-        Answer: {answer}
-        {"Expected keywords: " + ", ".join(expected_keywords) if expected_keywords else ""}
-        
-        Provide evaluation in JSON format with:
-        1. relevance_score (0-1): How relevant is the answer to the question
-        2. clarity_score (0-1): How clear and well-structured is the answer
-        3. sentiment: Overall sentiment (positive, neutral, negative)
-        4. confidence_indicators: List of confidence indicators found
-        5. feedback: Constructive feedback for the candidate
-        6. strengths: List of strengths in the answer
-        7. improvements: List of areas for improvement
-        """
+        messages = self._evaluation_messages(question, answer, expected_keywords)
         
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert interviewer evaluating candidate responses. Be objective and constructive."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0.3,
                 max_tokens=500
             )
+            return json.loads(response.choices[0].message.content)
             
-            import json
-            evaluation_text = response.choices[0].message.content
-            evaluation = json.loads(evaluation_text)
-            return evaluation
+        except Exception as e:
+            print(f"Error evaluating response: {e}")
+            return self._get_default_evaluation()
+    
+    async def evaluate_response_async(
+        self,
+        question: str,
+        answer: str,
+        expected_keywords: Optional[List[str]] = None
+    ) -> Dict:
+        """Async version of evaluate_response using AsyncOpenAI"""
+        messages = self._evaluation_messages(question, answer, expected_keywords)
+        
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=500
+            )
+            return json.loads(response.choices[0].message.content)
             
         except Exception as e:
             print(f"Error evaluating response: {e}")
             return self._get_default_evaluation()
     
+    def evaluate_responses_batch(self, items: List[Dict]) -> List[Dict]:
+        """
+        Evaluate several responses with packed prompts (sync client)
+        
+        Args:
+            items: Dicts with question, answer and optional expected_keywords
+        
+        Returns:
+            One evaluation dictionary per item, in the same order
+        """
+        size = max(1, settings.EVALUATION_BATCH_SIZE)
+        evaluations = []
+        for start in range(0, len(items), size):
+            chunk = items[start:start + size]
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=self._batch_evaluation_messages(chunk),
+                    temperature=0.3,
+                    max_tokens=400 * len(chunk)
+                )
+                evaluations.extend(
+                    self._parse_batch_evaluations(response.choices[0].message.content, len(chunk))
+                )
+            except Exception as e:
+                print(f"Error evaluating batch: {e}")
+                evaluations.extend(
+                    self.evaluate_response(
+                        question=item["question"],
+                        answer=item["answer"],
+                        expected_keywords=item.get("expected_keywords")
+                    )
+                    for item in chunk
+                )
+        return evaluations
+    
+    async def evaluate_responses_batch_async(
+        self,
+        items: List[Dict],
+        mode: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Evaluate several responses with as few round-trips as possible
+        
+        Args:
+            items: Dicts with question, answer and optional expected_keywords
+            mode: "packed" (several answers per prompt) or "concurrent"
+                  (one prompt per answer, bounded concurrency)
+        
+        Returns:
+            One evaluation dictionary per item, in the same order
+        """
+        if not items:
+            return []
+        
+        mode = mode or settings.EVALUATION_BATCH_MODE
+        semaphore = asyncio.Semaphore(settings.EVALUATION_CONCURRENCY)
+        
+        if mode == "packed":
+            size = max(1, settings.EVALUATION_BATCH_SIZE)
+            chunks = [items[i:i + size] for i in range(0, len(items), size)]
+            results = await asyncio.gather(
+                *(self._evaluate_packed_async(chunk, semaphore) for chunk in chunks)
+            )
+            return [evaluation for chunk_result in results for evaluation in chunk_result]
+        
+        return await self._evaluate_concurrent_async(items, semaphore)
+    
+    async def _evaluate_packed_async(self, items: List[Dict], semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Evaluate a chunk in one prompt, falling back to per-answer calls"""
+        messages = self._batch_evaluation_messages(items)
+        
+        try:
+            async with semaphore:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=400 * len(items)
+                )
+            return self._parse_batch_evaluations(response.choices[0].message.content, len(items))
+        except Exception as e:
+            print(f"Error evaluating batch: {e}")
+        
+        return await self._evaluate_concurrent_async(items, semaphore)
+    
+    async def _evaluate_concurrent_async(self, items: List[Dict], semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Evaluate each item with its own request under a shared semaphore"""
+        async def evaluate(item: Dict) -> Dict:
+            async with semaphore:
+                return await self.evaluate_response_async(
+                    question=item["question"],
+                    answer=item["answer"],
+                    expected_keywords=item.get("expected_keywords")
+                )
+        
+        return list(await asyncio.gather(*(evaluate(item) for item in items)))
+    
     def generate_followup_question(
         self,
         previous_question: str,
@@ -129,23 +278,35 @@ class InterviewAgent:
         context: str = ""
     ) -> str:
         """Generate a follow-up question based on previous answer"""
-        prompt = f"""
-        Based on this interview exchange, generate a relevant follow-up question:
-        
-        Previous Question: {previous_question}
-        Candidate's Answer: {previous_answer}
-        Context: {context}
-        
-        Generate one concise follow-up question that deepens understanding.
-        """
+        messages = self._followup_messages(previous_question, previous_answer, context)
         
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert interviewer asking insightful follow-up questions."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
+                temperature=0.7,
+                max_tokens=150
+            )
+            
+            return response.choices[0].message.content.strip()
+            
+        except Exception as e:
+            print(f"Error generating follow-up: {e}")
+            return "Can you elaborate on that?"
+    
+    async def generate_followup_question_async(
+        self,
+        previous_question: str,
+        previous_answer: str,
+        context: str = ""
+    ) -> str:
+        """Async version of generate_followup_question using AsyncOpenAI"""
+        messages = self._followup_messages(previous_question, previous_answer, context)
+        
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
                 temperature=0.7,
                 max_tokens=150
             )
@@ -156,7 +317,218 @@ class InterviewAgent:
             print(f"Error generating follow-up: {e}")
             return "Can you elaborate on that?"
     
-    def _get_fallback_questions(self, role: str, num: int) -> List[Dict]:
+    async def stream_followup_question(
+        self,
+        previous_question: str,
+        previous_answer: str,
+        context: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Streaming version of generate_followup_question: yields text as it is generated
+        
+        If generation fails before any text, the fallback question is yielded
+        instead; a failure part way through is raised, since the text so far
+        is incomplete.
+        """
+        messages = self._followup_messages(previous_question, previous_answer, context)
+        streamed = False
+        try:
+            async for text in self._stream_completion(messages, temperature=0.7, max_tokens=150):
+                streamed = True
+                yield text
+        except Exception as e:
+            print(f"Error generating follow-up: {e}")
+            if streamed:
+                raise
+            yield "Can you elaborate on that?"
+    
+    async def stream_feedback(
+        self,
+        question: str,
+        answer: str,
+        expected_keywords: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream written feedback on a response, as evaluate_response's feedback field
+        
+        Scores still come from evaluate_response; this only produces the
+        feedback text, yielded as it is generated. Failures are handled as in
+        stream_followup_question.
+        """
+        messages = self._feedback_messages(question, answer, expected_keywords)
+        streamed = False
+        try:
+            async for text in self._stream_completion(messages, temperature=0.3, max_tokens=300):
+                streamed = True
+                yield text
+        except Exception as e:
+            print(f"Error generating feedback: {e}")
+            if streamed:
+                raise
+            yield self._get_default_evaluation()["feedback"]
+    
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        """Yield the content of a chat completion chunk by chunk"""
+        stream = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Stop downloading when the consumer goes away early
+            await stream.response.aclose()
+    
+    def _question_messages(
+        self,
+        role: str,
+        category: str,
+        num_questions: int,
+        difficulty: str,
+        exclude: Optional[List[str]] = None
+    ) -> List[Dict[str, str]]:
+        """Build chat messages for question generation"""
+        prompt = f"""
+        Generate {num_questions} interview questions for a {role} position.
+        Category: {category}
+        Difficulty: {difficulty}
+        
+        For each question, provide:
+        1. The question text
+        2. Expected keywords or topics that should be covered in a good answer
+        3. Question type (technical, behavioral, or situational)
+        
+        Format as JSON array with keys: question, expected_keywords, type
+        """
+        if exclude:
+            listed = "\n".join(f"- {question}" for question in exclude)
+            prompt += f"\nDo not repeat or rephrase any of these questions:\n{listed}\n"
+        return [
+            {"role": "system", "content": "You are an expert HR interviewer. Generate relevant interview questions."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _parse_questions(self, questions_text: str) -> List[Dict[str, str]]:
+        """Parse the JSON question list returned by the model"""
+        questions = json.loads(questions_text)
+        return questions if isinstance(questions, list) else [questions]
+    
+    def _evaluation_messages(
+        self,
+        question: str,
+        answer: str,
+        expected_keywords: Optional[List[str]] = None
+    ) -> List[Dict[str, str]]:
+        """Build chat messages for response evaluation"""
+        prompt = f"""
+        Evaluate this interview response:
+        
+        Question: {question}
+        Answer: {answer}
+        {"Expected keywords: " + ", ".join(expected_keywords) if expected_keywords else ""}
+        
+        Provide evaluation in JSON format with:
+        {EVALUATION_FIELDS}
+        """
+        return [
+            {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _parse_batch_evaluations(self, evaluations_text: str, expected: int) -> List[Dict]:
+        """Parse a packed evaluation response, validating its length"""
+        evaluations = json.loads(evaluations_text)
+        if not isinstance(evaluations, list) or len(evaluations) != expected:
+            raise ValueError(f"expected {expected} evaluations")
+        for evaluation in evaluations:
+            if not isinstance(evaluation, dict):
+                raise ValueError("evaluation is not an object")
+            for field in EVALUATION_SCORE_FIELDS:
+                score = evaluation.get(field)
+                if isinstance(score, bool) or not isinstance(score, (int, float)):
+                    raise ValueError(f"evaluation {field} is not a number")
+        return evaluations
+    
+    def _batch_evaluation_messages(self, items: List[Dict]) -> List[Dict[str, str]]:
+        """Build chat messages evaluating several responses in one prompt"""
+        sections = []
+        for index, item in enumerate(items, start=1):
+            keywords = item.get("expected_keywords")
+            sections.append(
+                f"Response {index}:\n"
+                f"Question: {item['question']}\n"
+                f"Answer: {item['answer']}\n"
+                + ("Expected keywords: " + ", ".join(keywords) + "\n" if keywords else "")
+            )
+        responses_text = "\n".join(sections)
+        prompt = f"""
+        Evaluate each of these {len(items)} interview responses independently.
+        
+        {responses_text}
+        
+        Return a JSON array with exactly {len(items)} evaluation objects, in the
+        same order as the responses. Each object must contain:
+        {EVALUATION_FIELDS}
+        """
+        return [
+            {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _feedback_messages(
+        self,
+        question: str,
+        answer: str,
+        expected_keywords: Optional[List[str]] = None
+    ) -> List[Dict[str, str]]:
+        """Build chat messages for plain-text feedback on a response"""
+        prompt = f"""
+        Give the candidate constructive feedback on this interview response:
+        
+        Question: {question}
+        Answer: {answer}
+        {"Expected keywords: " + ", ".join(expected_keywords) if expected_keywords else ""}
+        
+        Address the candidate directly in two to four sentences of plain text:
+        what was strong and what to improve.
+        """
+        return [
+            {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _followup_messages(
+        self,
+        previous_question: str,
+        previous_answer: str,
+        context: str = ""
+    ) -> List[Dict[str, str]]:
+        """Build chat messages for follow-up question generation"""
+        prompt = f"""
+        Based on this interview exchange, generate a relevant follow-up question:
+        
+        Previous Question: {previous_question}
+        Candidate's Answer: {previous_answer}
+        Context: {context}
+        
+        Generate one concise follow-up question that deepens understanding.
+        """
+        return [
+            {"role": "system", "content": "You are an expert interviewer asking insightful follow-up questions."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def get_fallback_questions(self, role: str, num: int) -> List[Dict]:
         """Fallback questions if AI generation fails"""
         fallback = {
             "developer": [
@@ -0,0 +1,218 @@
+"""
+Question Selector
+Serves interview questions from the question bank, topping up with AI
+"""
+
+import random
+from typing import List, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.question import QuestionBank
+from app.services.ai.interview_agent import InterviewAgent
+
+# LLM requests per interview for questions the bank could not supply
+MAX_GENERATION_ATTEMPTS = 2
+
+
+def normalize_question(text: str) -> str:
+    """Key used to spot repeated questions, ignoring case and spacing"""
+    return " ".join((text or "").lower().split())
+
+
+class QuestionSelector:
+    """Selects interview questions, preferring the question bank over the LLM"""
+    
+    def __init__(self, interview_agent: InterviewAgent):
+        self.interview_agent = interview_agent
+    
+    async def select_questions(
+        self,
+        db: AsyncSession,
+        role: str,
+        num_questions: int = 5,
+        difficulty: str = "medium",
+        category: str = "mixed"
+    ) -> List[Dict]:
+        """
+        Select questions for an interview
+        
+        Args:
+            db: Async database session
+            role: Job role (e.g., "developer", "designer")
+            num_questions: Number of questions needed
+            difficulty: Difficulty level (easy, medium, hard)
+            category: Question category, or "mixed" for any
+        
+        Returns:
+            List of question dictionaries (id, question, expected_keywords,
+            type), without repeats; id is None for questions not in the bank
+        """
+        role = role.lower()
+        questions = await db.run_sync(self.sample_bank, role, num_questions, difficulty, category)
+        
+        shortfall = num_questions - len(questions)
+        if shortfall > 0:
+            # Don't hold a pooled connection while the LLM generates
+            await db.commit()
+            try:
+                generated = await self._generate_new(role, category, difficulty, shortfall, questions)
+            except Exception as e:
+                print(f"Error generating questions: {e}")
+                generated = []
+            ids = {}
+            if generated and settings.QUESTION_BANK_WRITE_BACK:
+                ids = await db.run_sync(self.save_to_bank, role, difficulty, category, generated)
+            questions.extend(self._to_served(q, category, ids.get(q["question"])) for q in generated)
+            
+            # Fallback questions fill any remaining gap but are never stored in the bank
+            served = {normalize_question(q["question"]) for q in questions}
+            for q in self.interview_agent.get_fallback_questions(role, num_questions):
+                if len(questions) < num_questions and normalize_question(q["question"]) not in served:
+                    questions.append(self._to_served(q, category, None))
+        
+        return questions
+    
+    async def _generate_new(
+        self,
+        role: str,
+        category: str,
+        difficulty: str,
+        count: int,
+        served: List[Dict]
+    ) -> List[Dict]:
+        """
+        Generate up to count questions that repeat neither served nor each other
+        
+        The model is given the questions to avoid; if it repeats one anyway,
+        the missing questions are requested again (the rejected ones are added
+        to the list to avoid, which also keeps the request out of the cache).
+        """
+        avoid = [q["question"] for q in served]
+        seen = {normalize_question(text) for text in avoid}
+        new = []
+        for _ in range(MAX_GENERATION_ATTEMPTS):
+            needed = count - len(new)
+            if needed <= 0:
+                break
+            generated = await self.interview_agent.generate_questions_async(
+                role=role,
+                category=category,
+                num_questions=needed,
+                difficulty=difficulty,
+                raise_errors=True,
+                exclude=avoid
+            )
+            for q in generated:
+                text = q.get("question") if isinstance(q, dict) else None
+                key = normalize_question(text)
+                if not key:
+                    continue
+                avoid.append(text)
+                if key not in seen:
+                    seen.add(key)
+                    new.append(q)
+        return new[:count]
+    
+    def sample_bank(
+        self,
+        db: Session,
+        role: str,
+        num_questions: int,
+        difficulty: str,
+        category: str = "mixed"
+    ) -> List[Dict]:
+        """Randomly sample active bank questions for a role and difficulty"""
+        id_query = db.query(QuestionBank.id).filter(
+            QuestionBank.role == role,
+            QuestionBank.difficulty_level == difficulty,
+            QuestionBank.is_active == True
+        )
+        if category != "mixed":
+            id_query = id_query.filter(QuestionBank.category == category)
+        
+        ids = [row.id for row in id_query.all()]
+        if not ids:
+            return []
+        
+        chosen = random.sample(ids, min(num_questions, len(ids)))
+        rows = db.query(QuestionBank).filter(QuestionBank.id.in_(chosen)).all()
+        random.shuffle(rows)
+        return [self._to_question(row) for row in rows]
+    
+    def save_to_bank(
+        self,
+        db: Session,
+        role: str,
+        difficulty: str,
+        category: str,
+        questions: List[Dict]
+    ) -> Dict[str, int]:
+        """
+        Store generated questions in the bank, skipping ones already present
+        
+        Returns:
+            Bank id of each question text (new or already stored); empty if
+            the questions could not be saved
+        """
+        texts = [q.get("question") for q in questions if q.get("question")]
+        if not texts:
+            return {}
+        
+        ids = {
+            row.question: row.id for row in db.query(QuestionBank.id, QuestionBank.question).filter(
+                QuestionBank.role == role,
+                QuestionBank.question.in_(texts)
+            ).all()
+        }
+        
+        new_rows = []
+        for q in questions:
+            text = q.get("question")
+            if not text or text in ids or any(row.question == text for row in new_rows):
+                continue
+            new_rows.append(QuestionBank(
+                role=role,
+                category=self._category_for(q, category),
+                question=text,
+                expected_keywords=q.get("expected_keywords") or [],
+                difficulty_level=difficulty,
+                is_active=True
+            ))
+        
+        if new_rows:
+            try:
+                db.add_all(new_rows)
+                db.commit()
+            except Exception as e:
+                print(f"Error saving questions to bank: {e}")
+                db.rollback()
+                return {}
+        ids.update((row.question, row.id) for row in new_rows)
+        return ids
+    
+    def _category_for(self, question: Dict, requested: str) -> str:
+        """Category to store for a generated question"""
+        question_type: Optional[str] = question.get("type")
+        if question_type:
+            return question_type
+        return requested if requested != "mixed" else "general"
+    
+    def _to_served(self, question: Dict, requested: str, bank_id: Optional[int]) -> Dict:
+        """Convert a generated or fallback question to the bank question format"""
+        return {
+            "id": bank_id,
+            "question": question["question"],
+            "expected_keywords": question.get("expected_keywords") or [],
+            "type": self._category_for(question, requested)
+        }
+    
+    def _to_question(self, row: QuestionBank) -> Dict:
+        """Convert a bank row to the question dictionary format"""
+        return {
+            "id": row.id,
+            "question": row.question,
+            "expected_keywords": row.expected_keywords or [],
+            "type": row.category
+        }
@@ -3,41 +3,50 @@ Sentiment Analysis Service
 Analyzes candidate responses for tone, confidence, and emotional cues
 """
 
-from typing import Dict, List
-import nltk
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import spacy
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Dict, List, Optional
+from starlette.concurrency import run_in_threadpool
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+from app.core.config import settings
+from app.services.ai.cue_matcher import get_cue_matcher
+from app.services.registry import registry
 
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
+# Process pool used when NLP_EXECUTION_MODE == "process"
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = Lock()
+
+# Analyzer owned by each pool worker process, created once by the initializer
+_worker_analyzer = None
 
 
 class SentimentAnalyzer:
     """Sentiment and behavioral analysis for interview responses"""
     
-    def __init__(self):
-        self.vader = SentimentIntensityAnalyzer()
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    @property
+    def vader(self):
+        """Shared VADER analyzer, loaded on first use"""
+        return registry.get("vader")
+    
+    @property
+    def nlp(self):
+        """Shared spaCy pipeline, loaded on first use (None if not installed)"""
+        return registry.get("spacy")
+    
+    def warm_up(self):
+        """Load every NLP model now instead of on the first analysis"""
+        registry.warm_up(["vader", "textblob", "spacy"])
     
-    def analyze(self, text: str) -> Dict:
+    def analyze(self, text: str, role: Optional[str] = None) -> Dict:
         """
         Comprehensive sentiment and behavioral analysis
         
         Args:
             text: Text to analyze
+            role: Job role selecting role-specific cue vocabularies
         
         Returns:
             Dictionary with sentiment scores and behavioral cues
@@ -46,15 +55,15 @@ class SentimentAnalyzer:
         vader_scores = self.vader.polarity_scores(text)
         
         # TextBlob Sentiment
-        blob = TextBlob(text)
+        blob = registry.get("textblob")(text)
         textblob_polarity = blob.sentiment.polarity
         textblob_subjectivity = blob.sentiment.subjectivity
         
         # Behavioral cues
-        behavioral_cues = self._extract_behavioral_cues(text)
+        behavioral_cues = self._extract_behavioral_cues(text, role)
         
         # Confidence indicators
-        confidence_score = self._calculate_confidence(text)
+        confidence_score = self._calculate_confidence(text, behavioral_cues)
         
         # Clarity score
         clarity_score = self._calculate_clarity(text)
@@ -76,38 +85,57 @@ class SentimentAnalyzer:
             "sentence_count": len(text.split('.'))
         }
     
-    def _extract_behavioral_cues(self, text: str) -> Dict[str, List[str]]:
-        """Extract behavioral indicators from text"""
-        cues = {
-            "confidence_indicators": [],
-            "uncertainty_indicators": [],
-            "enthusiasm_indicators": [],
-            "professional_indicators": []
-        }
+    async def analyze_async(self, text: str, role: Optional[str] = None) -> Dict:
+        """
+        Analyze without blocking the event loop
         
-        text_lower = text.lower()
+        Runs in the NLP process pool when enabled, otherwise in the threadpool.
+        """
+        pool = get_process_pool()
+        if pool is None:
+            return await run_in_threadpool(self.analyze, text, role)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, _analyze_in_worker, text, role)
+    
+    def analyze_many(self, texts: List[str], role: Optional[str] = None) -> List[Dict]:
+        """
+        Analyze several texts, spreading them across the process pool
         
-        # Confidence indicators
-        confidence_words = ["confident", "certain", "definitely", "sure", "proven", "successful"]
-        cues["confidence_indicators"] = [w for w in confidence_words if w in text_lower]
+        Args:
+            texts: Texts to analyze
+            role: Job role selecting role-specific cue vocabularies
         
-        # Uncertainty indicators
-        uncertainty_words = ["maybe", "perhaps", "might", "uncertain", "not sure", "think"]
-        cues["uncertainty_indicators"] = [w for w in uncertainty_words if w in text_lower]
+        Returns:
+            Analyses in the same order as texts
+        """
+        pool = get_process_pool()
+        if pool is None or len(texts) < 2:
+            return [self.analyze(text, role) for text in texts]
+        chunksize = max(1, len(texts) // (_pool_size() * 4))
+        return list(pool.map(_analyze_in_worker, texts, [role] * len(texts), chunksize=chunksize))
+    
+    def _extract_behavioral_cues(self, text: str, role: Optional[str] = None) -> Dict:
+        """
+        Extract behavioral indicators from text in a single scan
         
-        # Enthusiasm indicators
-        enthusiasm_words = ["excited", "passionate", "love", "enjoy", "enthusiastic", "eager"]
-        cues["enthusiasm_indicators"] = [w for w in enthusiasm_words if w in text_lower]
+        Args:
+            text: Text to analyze
+            role: Job role selecting role-specific cue vocabularies
         
-        # Professional indicators
-        professional_words = ["collaborate", "team", "professional", "experience", "skills"]
-        cues["professional_indicators"] = [w for w in professional_words if w in text_lower]
+        Returns:
+            Category -> distinct cue phrases found, plus "cue_counts" with
+            the number of occurrences per category
+        """
+        matches = get_cue_matcher(role).match(text)
         
+        cues = {category: match["hits"] for category, match in matches.items()}
+        cues["cue_counts"] = {category: match["count"] for category, match in matches.items()}
         return cues
     
-    def _calculate_confidence(self, text: str) -> float:
+    def _calculate_confidence(self, text: str, behavioral_cues: Optional[Dict] = None) -> float:
         """Calculate confidence score (0-1)"""
-        behavioral_cues = self._extract_behavioral_cues(text)
+        if behavioral_cues is None:
+            behavioral_cues = self._extract_behavioral_cues(text)
         
         confidence_indicators = len(behavioral_cues["confidence_indicators"])
         uncertainty_indicators = len(behavioral_cues["uncertainty_indicators"])
@@ -157,3 +185,65 @@ class SentimentAnalyzer:
         else:
             return "neutral"
 
+
+
+def _init_worker():
+    """Load NLP models once per pool worker process"""
+    global _worker_analyzer
+    _worker_analyzer = SentimentAnalyzer()
+    _worker_analyzer.warm_up()
+
+
+def _analyze_in_worker(text: str, role: Optional[str] = None) -> Dict:
+    """Run an analysis with the worker's preloaded analyzer"""
+    return _worker_analyzer.analyze(text, role)
+
+
+def _warm_up_worker(_: int) -> int:
+    """No-op task forcing a worker process to start and load its models"""
+    return os.getpid()
+
+
+def _pool_size() -> int:
+    """Configured number of NLP worker processes"""
+    return settings.NLP_PROCESS_WORKERS or os.cpu_count() or 1
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared NLP process pool, starting it if process mode is enabled"""
+    if settings.NLP_EXECUTION_MODE != "process":
+        return None
+    return start_process_pool()
+
+
+def start_process_pool(warm_up: bool = False) -> ProcessPoolExecutor:
+    """
+    Start the shared NLP process pool (idempotent)
+    
+    Args:
+        warm_up: Block until every worker has loaded its models
+    
+    Returns:
+        The process pool
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            workers = _pool_size()
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            if warm_up:
+                list(_process_pool.map(_warm_up_worker, range(workers)))
+        return _process_pool
+
+
+def shutdown_process_pool():
+    """Stop the shared NLP process pool"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
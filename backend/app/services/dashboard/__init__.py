@@ -0,0 +1,2 @@
+# Dashboard Services Package
+
@@ -0,0 +1,207 @@
+"""
+Dashboard Statistics Service
+Maintains the per-role interview rollup behind GET /dashboard/statistics
+"""
+
+import asyncio
+from typing import Dict, Optional
+from sqlalchemy import case, event, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.interview import Interview, InterviewStatus
+from app.models.statistics import InterviewRoleStats
+
+STATISTICS_CACHE_KEY = "statistics"
+# session.info flag set when the rollup changed in the session's transaction
+_STATISTICS_CHANGED = "statistics_changed"
+
+# Short-lived cache of the rendered statistics
+statistics_cache = create_cache("dashboard", max_entries=16, default_ttl=settings.STATS_CACHE_TTL_SECONDS)
+
+
+class StatisticsService:
+    """Incrementally maintained interview statistics"""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def record_interview_created(self, role: str, count: int = 1):
+        """Count new interviews (committed with the caller's transaction)"""
+        self._apply_delta(role, total=count)
+    
+    def record_interview_completed(
+        self,
+        role: str,
+        previous_status: Optional[InterviewStatus],
+        previous_score: Optional[float],
+        new_score: float
+    ):
+        """
+        Count a completed interview (committed with the caller's transaction)
+        
+        Completing an already completed interview again only replaces its
+        score in the sum.
+        """
+        if previous_status == InterviewStatus.COMPLETED:
+            self._apply_delta(role, score=new_score - (previous_score or 0.0))
+        else:
+            self._apply_delta(role, completed=1, score=new_score)
+    
+    def get_statistics(self) -> Dict:
+        """Dashboard statistics from the rollup table (one row per role)"""
+        cached = statistics_cache.get(STATISTICS_CACHE_KEY)
+        if cached is not None:
+            return cached
+        
+        statistics = self.compute_statistics()
+        statistics_cache.set(STATISTICS_CACHE_KEY, statistics)
+        return statistics
+    
+    def compute_statistics(self) -> Dict:
+        """Dashboard statistics read from the rollup table, bypassing the cache"""
+        rows = self.db.query(InterviewRoleStats).order_by(InterviewRoleStats.role).all()
+        total = sum(row.total_interviews for row in rows)
+        completed = sum(row.completed_interviews for row in rows)
+        score_sum = sum(row.score_sum for row in rows)
+        
+        statistics = {
+            "total_interviews": total,
+            "completed_interviews": completed,
+            "average_score": round(score_sum / completed, 2) if completed else 0.0,
+            "by_role": [
+                {
+                    "role": row.role,
+                    "count": row.completed_interviews,
+                    "avg_score": round(row.score_sum / row.completed_interviews, 2)
+                }
+                for row in rows if row.completed_interviews
+            ]
+        }
+        return statistics
+    
+    def reconcile(self) -> int:
+        """
+        Rebuild the rollup table from the interviews table
+        
+        Repairs drift from writes that bypassed the incremental updates.
+        The rollup is locked before the interviews are counted, so deltas
+        from concurrent transactions are either already counted or applied
+        after the rebuilt totals are committed, never overwritten.
+        
+        Returns:
+            Number of roles whose totals changed
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Also blocks deltas that would insert rows for new roles
+            self.db.execute(text(f"LOCK TABLE {InterviewRoleStats.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+        stored = {row.role: row for row in self.db.query(InterviewRoleStats).with_for_update().all()}
+        
+        is_completed = Interview.status == InterviewStatus.COMPLETED
+        actual = {
+            role: (total, completed or 0, score_sum or 0.0)
+            for role, total, completed, score_sum in self.db.query(
+                Interview.role,
+                func.count(Interview.id),
+                func.sum(case((is_completed, 1), else_=0)),
+                func.sum(case((is_completed, func.coalesce(Interview.overall_score, 0.0)), else_=0.0))
+            ).group_by(Interview.role).all()
+        }
+        
+        changed = 0
+        for role, row in stored.items():
+            if role not in actual:
+                self.db.delete(row)
+                changed += 1
+        for role, (total, completed, score_sum) in actual.items():
+            row = stored.get(role)
+            if row is None:
+                row = InterviewRoleStats(role=role)
+                self.db.add(row)
+            elif (row.total_interviews, row.completed_interviews) == (total, completed) \
+                    and abs(row.score_sum - score_sum) < 1e-6:
+                continue
+            row.total_interviews = total
+            row.completed_interviews = completed
+            row.score_sum = score_sum
+            changed += 1
+        
+        if changed:
+            self.db.info[_STATISTICS_CHANGED] = True
+        self.db.commit()
+        return changed
+    
+    def _apply_delta(self, role: str, total: int = 0, completed: int = 0, score: float = 0.0):
+        """Atomically add to a role's totals, creating its row if needed"""
+        table = InterviewRoleStats.__table__
+        values = {"role": role, "total_interviews": total, "completed_interviews": completed, "score_sum": score}
+        increments = {
+            "total_interviews": table.c.total_interviews + total,
+            "completed_interviews": table.c.completed_interviews + completed,
+            "score_sum": table.c.score_sum + score,
+        }
+        
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            statement = insert(table).values(**values)
+            self.db.execute(statement.on_conflict_do_update(index_elements=["role"], set_=increments))
+        else:
+            result = self.db.execute(table.update().where(table.c.role == role).values(**increments))
+            if result.rowcount == 0:
+                self.db.execute(table.insert().values(**values))
+        
+        # Cleared once committed; clearing now would let a concurrent read cache the old totals
+        self.db.info[_STATISTICS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_statistics(session: Session):
+    if session.info.pop(_STATISTICS_CHANGED, False):
+        statistics_cache.delete(STATISTICS_CACHE_KEY)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_statistics_change(session: Session):
+    session.info.pop(_STATISTICS_CHANGED, None)
+
+
+async def get_statistics_async(db: AsyncSession) -> Dict:
+    """get_statistics for async endpoints; the cache is read without blocking the event loop"""
+    cached = await statistics_cache.get_async(STATISTICS_CACHE_KEY)
+    if cached is not None:
+        return cached
+    
+    statistics = await db.run_sync(lambda session: StatisticsService(session).compute_statistics())
+    await statistics_cache.set_async(STATISTICS_CACHE_KEY, statistics)
+    return statistics
+
+
+def run_reconciliation() -> int:
+    """Reconcile the rollup table in a new session"""
+    db = SessionLocal()
+    try:
+        return StatisticsService(db).reconcile()
+    finally:
+        db.close()
+
+
+async def reconcile_periodically(interval_seconds: int):
+    """Reconcile on startup and then every interval_seconds (0 = startup only)"""
+    while True:
+        try:
+            changed = await run_in_threadpool(run_reconciliation)
+            if changed:
+                print(f"Dashboard statistics reconciled ({changed} roles corrected)")
+        except Exception as e:
+            print(f"Error reconciling dashboard statistics: {e}")
+        if interval_seconds <= 0:
+            return
+        await asyncio.sleep(interval_seconds)
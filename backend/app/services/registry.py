@@ -0,0 +1,184 @@
+"""
+Service Registry
+Lazily creates process-wide singletons for AI clients, NLP models and services
+"""
+
+import time
+from threading import RLock
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+
+class ServiceRegistry:
+    """Lazy, thread-safe registry of shared service instances"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._load_times: Dict[str, float] = {}
+        self._total_load_time = 0.0
+        self._depth = 0
+        self._lock = RLock()
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Register a factory, called once on first use of the service"""
+        self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """Get a service instance, creating it on first use"""
+        if name in self._instances:
+            return self._instances[name]
+        with self._lock:
+            if name not in self._instances:
+                started = time.perf_counter()
+                self._depth += 1
+                try:
+                    self._instances[name] = self._factories[name]()
+                finally:
+                    self._depth -= 1
+                elapsed = time.perf_counter() - started
+                self._load_times[name] = elapsed
+                if self._depth == 0:
+                    # Nested loads are already included in their parent's time
+                    self._total_load_time += elapsed
+        return self._instances[name]
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a service has already been created"""
+        return name in self._instances
+
+    def warm_up(self, names: Optional[List[str]] = None):
+        """Create services ahead of the first request"""
+        for name in names or list(self._factories):
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"Error warming up {name}: {e}")
+
+    def report(self) -> Dict:
+        """Load time of each created service (including its dependencies)"""
+        components = {name: round(seconds, 4) for name, seconds in self._load_times.items()}
+        return {
+            "components": components,
+            "total_seconds": round(self._total_load_time, 4),
+            "pending": [name for name in self._factories if name not in self._instances],
+        }
+
+
+registry = ServiceRegistry()
+
+
+def _load_nltk_data() -> bool:
+    """Make sure the NLTK corpora used by TextBlob are present"""
+    import nltk
+
+    for resource, package in (("tokenizers/punkt", "punkt"), ("vader_lexicon", "vader_lexicon")):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+    return True
+
+
+def _load_vader():
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+def _load_textblob():
+    registry.get("nltk_data")
+    from textblob import TextBlob
+    return TextBlob
+
+
+def _load_spacy():
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm")
+    except OSError:
+        print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+        return None
+
+
+def _load_openai():
+    from openai import OpenAI
+    return OpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+def _load_async_openai():
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+def _load_sentiment_analyzer():
+    from app.services.ai.sentiment_analyzer import SentimentAnalyzer
+    return SentimentAnalyzer()
+
+
+def _load_interview_agent():
+    from app.services.ai.interview_agent import InterviewAgent
+    return InterviewAgent()
+
+
+def _load_question_selector():
+    from app.services.ai.question_selector import QuestionSelector
+    return QuestionSelector(registry.get("interview_agent"))
+
+
+def _load_cv_analyzer():
+    from app.services.ai.cv_analyzer import CVAnalyzer
+    return CVAnalyzer()
+
+
+def _load_scoring_engine():
+    from app.services.scoring.scoring_engine import ScoringEngine
+    return ScoringEngine()
+
+
+registry.register("openai", _load_openai)
+registry.register("openai_async", _load_async_openai)
+registry.register("nltk_data", _load_nltk_data)
+registry.register("vader", _load_vader)
+registry.register("textblob", _load_textblob)
+registry.register("spacy", _load_spacy)
+registry.register("sentiment_analyzer", _load_sentiment_analyzer)
+registry.register("interview_agent", _load_interview_agent)
+registry.register("question_selector", _load_question_selector)
+registry.register("cv_analyzer", _load_cv_analyzer)
+registry.register("scoring_engine", _load_scoring_engine)
+
+
+def get_openai_client():
+    """Shared synchronous OpenAI client"""
+    return registry.get("openai")
+
+
+def get_async_openai_client():
+    """Shared AsyncOpenAI client"""
+    return registry.get("openai_async")
+
+
+def get_interview_agent():
+    """Shared InterviewAgent"""
+    return registry.get("interview_agent")
+
+
+def get_question_selector():
+    """Shared QuestionSelector"""
+    return registry.get("question_selector")
+
+
+def get_cv_analyzer():
+    """Shared CVAnalyzer"""
+    return registry.get("cv_analyzer")
+
+
+def get_scoring_engine():
+    """Shared ScoringEngine"""
+    return registry.get("scoring_engine")
+
+
+def get_sentiment_analyzer():
+    """Shared SentimentAnalyzer"""
+    return registry.get("sentiment_analyzer")
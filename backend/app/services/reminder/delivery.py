@@ -0,0 +1,300 @@
+"""
+Reminder Delivery
+Sends reminder emails in batches over pooled, persistent SMTP connections
+"""
+
+import asyncio
+import queue
+import smtplib
+import ssl
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.rate_limit import RateLimiter
+
+# Reply code servers use to shed load ("service not available, closing channel")
+THROTTLED_CODE = 421
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether sending again later may succeed: 4xx replies and connection problems"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    # SMTPException subclasses OSError; only plain socket errors are transient
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class EmailTransport(ABC):
+    """
+    Sends batches of messages for EmailDelivery
+
+    send_batch() returns one result per message (None when sent) rather than
+    raising, so one rejected recipient does not fail the rest of the batch.
+    """
+
+    name = "email"
+    connections = 1  # Batches the transport can send at once
+
+    @abstractmethod
+    async def send_batch(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        """Send messages, returning one error (or None when sent) per message"""
+
+    async def close(self):
+        pass
+
+
+class MemoryTransport(EmailTransport):
+    """Keeps messages in memory instead of sending them (development and tests)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self.outbox: List[EmailMessage] = []
+
+    async def send_batch(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        self.outbox.extend(messages)
+        return [None] * len(messages)
+
+
+class SMTPConnection:
+    """One SMTP session kept open between batches; used by one thread at a time"""
+
+    def __init__(self, host: str, port: int, user: str, password: str, use_tls: bool, timeout: int):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                smtp.starttls(context=ssl.create_default_context())
+            if self.user:
+                smtp.login(self.user, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+
+    def _send(self, message: EmailMessage):
+        if self._smtp is None:
+            self._connect()
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # Servers drop idle sessions; reconnect once
+            self._smtp = None
+            self._connect()
+            self._smtp.send_message(message)
+
+    def send(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        """Send messages over this session, reconnecting when needed"""
+        results: List[Optional[Exception]] = []
+        for index, message in enumerate(messages):
+            try:
+                self._send(message)
+                results.append(None)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                # Rejected message; the session itself is still usable
+                results.append(e)
+            except Exception as e:
+                # Broken session or unreachable server: fail the rest of the batch with it
+                self.close()
+                results.extend([e] * (len(messages) - index))
+                break
+        return results
+
+    def close(self):
+        """Quit the session, if open"""
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except Exception:
+                smtp.close()
+
+
+class SMTPTransport(EmailTransport):
+    """
+    SMTP over a pool of persistent connections
+
+    smtplib is blocking, so each batch runs on a dedicated thread holding
+    one pooled connection; sessions stay open across batches and event loops.
+    """
+
+    name = "smtp"
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: Optional[bool] = None,
+        pool_size: Optional[int] = None,
+        timeout: Optional[int] = None
+    ):
+        self.connections = max(1, pool_size or settings.SMTP_POOL_SIZE)
+        self._idle: "queue.Queue[SMTPConnection]" = queue.Queue()
+        for _ in range(self.connections):
+            self._idle.put(SMTPConnection(
+                host or settings.SMTP_HOST,
+                port or settings.SMTP_PORT,
+                settings.SMTP_USER if user is None else user,
+                settings.SMTP_PASSWORD if password is None else password,
+                settings.SMTP_USE_TLS if use_tls is None else use_tls,
+                timeout or settings.SMTP_TIMEOUT_SECONDS
+            ))
+        self._executor = ThreadPoolExecutor(max_workers=self.connections, thread_name_prefix="smtp")
+
+    def _send_batch(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        connection = self._idle.get()
+        try:
+            return connection.send(messages)
+        finally:
+            self._idle.put(connection)
+
+    async def send_batch(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._send_batch, messages)
+
+    def _close(self):
+        self._executor.shutdown(wait=True)
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self._close)
+
+
+class EmailDelivery:
+    """
+    Batches, rate-limits and retries sends over an email transport
+
+    send() queues a message and waits for its outcome. One worker per
+    transport connection takes up to batch_size queued messages at a time,
+    paced by the provider's rate limit. Transient failures are queued again
+    after an exponential backoff without holding up other messages.
+    """
+
+    def __init__(
+        self,
+        transport: EmailTransport,
+        batch_size: Optional[int] = None,
+        rate_per_minute: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None
+    ):
+        self.transport = transport
+        self.batch_size = batch_size or settings.SMTP_BATCH_SIZE
+        self.limiter = RateLimiter(settings.SMTP_RATE_PER_MINUTE if rate_per_minute is None else rate_per_minute)
+        self.max_retries = settings.SMTP_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_base_seconds = retry_base_seconds or settings.SMTP_RETRY_BASE_SECONDS
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The queue and workers belong to one event loop; scripts may run several in turn
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._workers = [loop.create_task(self._work()) for _ in range(self.transport.connections)]
+
+    async def send(self, message: EmailMessage):
+        """Send a message, raising the last error once it cannot be delivered"""
+        self._start()
+        future = self._loop.create_future()
+        self._queue.put_nowait((message, future, 0))
+        await future
+
+    async def _work(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # Skip messages whose sender stopped waiting
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            for _ in batch:
+                await self.limiter.acquire_async()
+            try:
+                errors = await self.transport.send_batch([message for message, _, _ in batch])
+            except Exception as e:
+                errors = [e] * len(batch)
+
+            for (message, future, attempt), error in zip(batch, errors):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                elif attempt < self.max_retries and is_transient(error):
+                    delay = self.retry_base_seconds * 2 ** attempt
+                    if getattr(error, "smtp_code", None) == THROTTLED_CODE:
+                        self.limiter.backoff(delay)
+                    self._loop.call_later(delay, self._queue.put_nowait, (message, future, attempt + 1))
+                else:
+                    future.set_exception(error)
+
+    async def close(self):
+        """Stop the workers and close the transport"""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        self._loop = None
+        await self.transport.close()
+
+
+_email_delivery: Optional[EmailDelivery] = None
+
+
+def get_email_delivery() -> EmailDelivery:
+    """Shared delivery for EMAIL_TRANSPORT, created on first use"""
+    global _email_delivery
+    if _email_delivery is None:
+        transport = SMTPTransport() if settings.EMAIL_TRANSPORT == "smtp" else MemoryTransport()
+        _email_delivery = EmailDelivery(transport)
+    return _email_delivery
+
+
+async def shutdown_email_delivery():
+    """Close the shared delivery and its connections"""
+    global _email_delivery
+    delivery, _email_delivery = _email_delivery, None
+    if delivery is not None:
+        await delivery.close()
+
+
+def reminder_email(message: Dict) -> EmailMessage:
+    """Email for a claimed reminder (see ReminderDispatcher.claim_batch)"""
+    email = EmailMessage()
+    email["From"] = settings.EMAIL_FROM or settings.SMTP_USER
+    email["To"] = message["candidate_email"]
+    email["Subject"] = f"Reminder: your {message['interview_role']} interview"
+    when = message["interview_scheduled_at"]
+    at = f" on {when:%A %d %B %Y at %H:%M} UTC" if when else ""
+    email.set_content(
+        f"Hi {message['candidate_name'] or 'there'},\n\n"
+        f"This is a reminder of your {message['interview_role']} interview{at}.\n\n"
+        f"Good luck!\n"
+    )
+    return email
+
+
+async def send_reminder_email(message: Dict):
+    """Reminder sender delivering by email"""
+    await get_email_delivery().send(reminder_email(message))
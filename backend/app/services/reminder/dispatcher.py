@@ -0,0 +1,186 @@
+"""
+Reminder Dispatcher
+Claims due reminders in batches and delivers them concurrently
+"""
+
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_async_engine
+from app.models.interview import Interview
+from app.models.reminder import Reminder, ReminderStatus
+from app.models.user import User
+from app.services.reminder.delivery import send_reminder_email
+
+# Delivers one reminder message; raises on failure
+Sender = Callable[[Dict], Awaitable[None]]
+
+
+async def mark_only_sender(message: Dict):
+    """Placeholder delivery: reminders are marked as sent without sending anything"""
+    return None
+
+
+def default_sender() -> Sender:
+    """Sender for EMAIL_TRANSPORT"""
+    if settings.EMAIL_TRANSPORT == "none":
+        return mark_only_sender
+    return send_reminder_email
+
+
+class ReminderDispatcher:
+    """
+    Delivers due reminders; any number of dispatchers can run side by side
+
+    Each batch is claimed by writing a lease (claim token and expiry) onto
+    up to batch_size due rows. Candidates are selected with FOR UPDATE SKIP
+    LOCKED where the database supports it, and the lease conditions are
+    re-checked by the UPDATE, so two dispatchers never claim the same row.
+    A dispatcher that dies leaves leases that expire and are reclaimed.
+    """
+
+    def __init__(
+        self,
+        sender: Optional[Sender] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[int] = None
+    ):
+        self.sender = sender or default_sender()
+        self.batch_size = batch_size or settings.REMINDER_BATCH_SIZE
+        self.concurrency = concurrency or settings.REMINDER_SEND_CONCURRENCY
+        self.lease_seconds = lease_seconds or settings.REMINDER_LEASE_SECONDS
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _session(self) -> AsyncSession:
+        return AsyncSessionLocal(bind=get_async_engine())
+
+    def _claimable(self, now: datetime):
+        return [
+            Reminder.status == ReminderStatus.PENDING,
+            Reminder.scheduled_time <= now,
+            or_(Reminder.claim_expires_at.is_(None), Reminder.claim_expires_at < now),
+        ]
+
+    async def claim_batch(self) -> List[Dict]:
+        """Claim up to batch_size due reminders (earliest first) with their candidate and interview details"""
+        now = datetime.utcnow()
+        token = f"{self.worker_id}:{uuid.uuid4().hex}"
+        async with self._session() as db:
+            candidates = select(Reminder.id).filter(*self._claimable(now)).order_by(
+                Reminder.scheduled_time
+            ).limit(self.batch_size)
+            candidate_ids = (await db.execute(candidates.with_for_update(skip_locked=True))).scalars().all()
+            if not candidate_ids:
+                return []
+
+            await db.execute(
+                update(Reminder)
+                .where(Reminder.id.in_(candidate_ids), *self._claimable(now))
+                .values(claimed_by=token, claim_expires_at=now + timedelta(seconds=self.lease_seconds))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+            # Candidate and interview details for the whole batch in one query
+            rows = (await db.execute(
+                select(
+                    Reminder.id,
+                    Reminder.reminder_type,
+                    Reminder.scheduled_time,
+                    Reminder.interview_id,
+                    User.email,
+                    User.full_name,
+                    Interview.role,
+                    Interview.scheduled_at
+                )
+                .outerjoin(User, User.id == Reminder.candidate_id)
+                .outerjoin(Interview, Interview.id == Reminder.interview_id)
+                .filter(Reminder.claimed_by == token)
+            )).all()
+
+        return [
+            {
+                "reminder_id": row.id,
+                "claim": token,
+                "reminder_type": row.reminder_type,
+                "scheduled_time": row.scheduled_time,
+                "interview_id": row.interview_id,
+                "candidate_email": row.email,
+                "candidate_name": row.full_name,
+                "interview_role": row.role,
+                "interview_scheduled_at": row.scheduled_at,
+            }
+            for row in rows
+        ]
+
+    async def deliver(self, messages: List[Dict]) -> Dict[int, Optional[str]]:
+        """
+        Send messages with at most `concurrency` deliveries in flight
+
+        Returns:
+            Error message per reminder id (None when sent)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send(message: Dict) -> Optional[str]:
+            if message["candidate_email"] is None or message["interview_role"] is None:
+                return "Candidate or interview not found"
+            async with semaphore:
+                try:
+                    await self.sender(message)
+                    return None
+                except Exception as e:
+                    return str(e) or type(e).__name__
+
+        errors = await asyncio.gather(*(send(message) for message in messages))
+        return {message["reminder_id"]: error for message, error in zip(messages, errors)}
+
+    async def record_results(self, token: str, results: Dict[int, Optional[str]]):
+        """Write the batch outcome back with one UPDATE per status"""
+        sent = [reminder_id for reminder_id, error in results.items() if error is None]
+        failed = [reminder_id for reminder_id, error in results.items() if error is not None]
+        async with self._session() as db:
+            for ids, values in (
+                (sent, {"status": ReminderStatus.SENT, "sent_at": datetime.utcnow()}),
+                (failed, {"status": ReminderStatus.FAILED}),
+            ):
+                if ids:
+                    # Only rows still leased to this batch; an expired lease may have been reclaimed
+                    await db.execute(
+                        update(Reminder)
+                        .where(Reminder.id.in_(ids), Reminder.claimed_by == token)
+                        .values(claimed_by=None, claim_expires_at=None, **values)
+                        .execution_options(synchronize_session=False)
+                    )
+            await db.commit()
+
+        for reminder_id in failed:
+            print(f"Error sending reminder {reminder_id}: {results[reminder_id]}")
+
+    async def dispatch_batch(self) -> Dict:
+        """Claim, deliver and record one batch"""
+        messages = await self.claim_batch()
+        if not messages:
+            return {"claimed": 0, "sent": 0, "failed": 0}
+        results = await self.deliver(messages)
+        await self.record_results(messages[0]["claim"], results)
+        sent = sum(1 for error in results.values() if error is None)
+        return {"claimed": len(messages), "sent": sent, "failed": len(messages) - sent}
+
+    async def dispatch_due(self) -> int:
+        """Deliver batches until no due reminders are left; returns the number sent"""
+        sent = 0
+        while True:
+            result = await self.dispatch_batch()
+            sent += result["sent"]
+            if result["claimed"] < self.batch_size:
+                return sent
@@ -3,14 +3,16 @@ Reminder Service
 Handles automated reminders for interviews and incomplete applications
 """
 
-from datetime import datetime, timedelta
-from typing import List
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 
+from app.core.database import dispose_async_engine
 from app.models.reminder import Reminder, ReminderStatus
-from app.models.interview import Interview
-from app.models.user import User
+from app.services.reminder.dispatcher import ReminderDispatcher
+from app.services.reminder.scheduler import reminder_scheduler
 
 
 class ReminderService:
@@ -40,8 +42,48 @@ class ReminderService:
         self.db.add(reminder)
         self.db.commit()
         self.db.refresh(reminder)
+        reminder_scheduler.schedule(reminder.id, reminder.scheduled_time)
         return reminder
     
+    def create_interview_reminders(
+        self,
+        interviews: List[Tuple[int, int, datetime]],
+        offsets_minutes: List[int]
+    ) -> List[Tuple[int, datetime]]:
+        """
+        Create reminders for many interviews with one multi-row INSERT
+        
+        Reminders whose time has already passed are skipped. Nothing is
+        committed; the caller commits and then schedules the returned reminders.
+        
+        Args:
+            interviews: (interview id, candidate id, interview time) tuples
+            offsets_minutes: Minutes before each interview to send a reminder
+        
+        Returns:
+            (reminder id, reminder time) of each created reminder
+        """
+        now = datetime.utcnow()
+        rows = []
+        for interview_id, candidate_id, interview_time in interviews:
+            if interview_time.tzinfo is not None:
+                interview_time = interview_time.astimezone(timezone.utc).replace(tzinfo=None)
+            for offset in sorted(set(offsets_minutes), reverse=True):
+                reminder_time = interview_time - timedelta(minutes=offset)
+                if reminder_time > now:
+                    rows.append({
+                        "interview_id": interview_id,
+                        "candidate_id": candidate_id,
+                        "reminder_type": "interview_scheduled",
+                        "scheduled_time": reminder_time,
+                        "status": ReminderStatus.PENDING,
+                    })
+        if not rows:
+            return []
+        
+        result = self.db.execute(insert(Reminder).returning(Reminder.id, Reminder.scheduled_time), rows)
+        return [(reminder_id, scheduled_time) for reminder_id, scheduled_time in result]
+    
     def get_pending_reminders(self) -> List[Reminder]:
         """Get all pending reminders that are due"""
         now = datetime.utcnow()
@@ -53,37 +95,18 @@ class ReminderService:
         ).all()
         return reminders
     
-    def send_reminder(self, reminder: Reminder) -> bool:
-        """Send a reminder (email/SMS)"""
-        try:
-            # Get candidate information
-            candidate = self.db.query(User).filter(User.id == reminder.candidate_id).first()
-            interview = self.db.query(Interview).filter(Interview.id == reminder.interview_id).first()
-            
-            if not candidate or not interview:
-                return False
-            
-            # TODO: Implement actual email/SMS sending
-            # For now, just mark as sent
-            reminder.status = ReminderStatus.SENT
-            reminder.sent_at = datetime.utcnow()
-            self.db.commit()
-            
-            return True
-        except Exception as e:
-            print(f"Error sending reminder: {e}")
-            reminder.status = ReminderStatus.FAILED
-            self.db.commit()
-            return False
-    
     def process_pending_reminders(self) -> int:
-        """Process all pending reminders"""
-        reminders = self.get_pending_reminders()
-        sent_count = 0
+        """
+        Deliver all due reminders and return the number sent
         
-        for reminder in reminders:
-            if self.send_reminder(reminder):
-                sent_count += 1
+        Blocking wrapper around ReminderDispatcher for scripts and workers;
+        async code should await ReminderDispatcher().dispatch_due() instead.
+        """
+        async def dispatch() -> int:
+            try:
+                return await ReminderDispatcher().dispatch_due()
+            finally:
+                # Pooled async connections belong to this event loop
+                await dispose_async_engine()
         
-        return sent_count
-
+        return asyncio.run(dispatch())
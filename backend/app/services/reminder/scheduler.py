@@ -0,0 +1,136 @@
+"""
+Reminder Scheduler
+Sleeps until the next reminder is due instead of polling the reminders table
+"""
+
+import asyncio
+import heapq
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_async_engine
+from app.models.reminder import Reminder, ReminderStatus
+from app.services.reminder.dispatcher import ReminderDispatcher
+
+
+def _timestamp(when: datetime) -> float:
+    """Epoch seconds of a reminder time (naive times are UTC)"""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+class ReminderScheduler:
+    """
+    Wakes the dispatcher when reminders fall due
+
+    Pending reminders due within the horizon are kept in a min-heap of
+    (due time, reminder id) and the scheduler sleeps until the earliest one.
+    Reminders created in this process are added as they are committed
+    (ReminderService.create_interview_reminder calls schedule()); the heap is
+    reloaded every REMINDER_SCHEDULER_REFRESH_SECONDS to pick up reminders
+    created by other processes and ones further out than the horizon.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Optional[ReminderDispatcher] = None,
+        horizon_seconds: Optional[int] = None,
+        refresh_seconds: Optional[int] = None
+    ):
+        self.dispatcher = dispatcher
+        self.horizon_seconds = horizon_seconds or settings.REMINDER_SCHEDULER_HORIZON_SECONDS
+        self.refresh_seconds = refresh_seconds or settings.REMINDER_SCHEDULER_REFRESH_SECONDS
+        self._heap: List[Tuple[float, int]] = []
+        # Current due time per scheduled reminder; heap entries that disagree are stale
+        self._due: Dict[int, float] = {}
+        self._loaded_until = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def schedule(self, reminder_id: int, scheduled_time: datetime):
+        """Add or move a reminder; safe to call from any thread, a no-op when the scheduler is not running"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._push, reminder_id, _timestamp(scheduled_time))
+
+    def _push(self, reminder_id: int, due: float):
+        if due > self._loaded_until or self._due.get(reminder_id) == due:
+            return  # Loaded with a later refresh, or already scheduled
+        self._due[reminder_id] = due
+        heapq.heappush(self._heap, (due, reminder_id))
+        if self._heap[0] == (due, reminder_id) and self._wake is not None:
+            self._wake.set()
+
+    def _pop_due(self, now: float) -> List[int]:
+        due_ids = []
+        while self._heap and self._heap[0][0] <= now:
+            due, reminder_id = heapq.heappop(self._heap)
+            if self._due.get(reminder_id) == due:
+                del self._due[reminder_id]
+                due_ids.append(reminder_id)
+        return due_ids
+
+    def _next_due(self) -> Optional[float]:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    async def load(self):
+        """Schedule every pending reminder due within the horizon (overdue ones included)"""
+        until = time.time() + self.horizon_seconds
+        async with AsyncSessionLocal(bind=get_async_engine()) as db:
+            rows = (await db.execute(
+                select(Reminder.id, Reminder.scheduled_time).filter(
+                    Reminder.status == ReminderStatus.PENDING,
+                    Reminder.scheduled_time <= datetime.utcfromtimestamp(until)
+                )
+            )).all()
+        self._loaded_until = until
+        for reminder_id, scheduled_time in rows:
+            self._push(reminder_id, _timestamp(scheduled_time))
+
+    async def run(self):
+        """Dispatch reminders as they fall due until cancelled"""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._heap, self._due, self._loaded_until = [], {}, 0.0
+        dispatcher = self.dispatcher or ReminderDispatcher()
+        next_load = 0.0
+        try:
+            while True:
+                now = time.time()
+                if now >= next_load:
+                    try:
+                        await self.load()
+                    except Exception as e:
+                        print(f"Error loading reminders: {e}")
+                    next_load = now + self.refresh_seconds
+
+                if self._pop_due(time.time()):
+                    try:
+                        sent = await dispatcher.dispatch_due()
+                        if sent:
+                            print(f"Reminders sent: {sent}")
+                    except Exception as e:
+                        print(f"Error dispatching reminders: {e}")
+                    continue
+
+                self._wake.clear()
+                next_due = self._next_due()
+                wake_at = next_load if next_due is None else min(next_load, next_due)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=max(0.0, wake_at - time.time()))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._wake = None
+
+
+reminder_scheduler = ReminderScheduler()
@@ -3,23 +3,24 @@ Scoring Engine
 Calculates overall scores for interview responses
 """
 
+import asyncio
 from typing import Dict, Optional
-from app.services.ai.sentiment_analyzer import SentimentAnalyzer
-from app.services.ai.interview_agent import InterviewAgent
+from app.services.registry import get_sentiment_analyzer, get_interview_agent
 
 
 class ScoringEngine:
     """Engine for scoring interview responses"""
     
     def __init__(self):
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.interview_agent = InterviewAgent()
+        self.sentiment_analyzer = get_sentiment_analyzer()
+        self.interview_agent = get_interview_agent()
     
     def score_response(
         self,
         question: str,
         answer: str,
-        expected_keywords: Optional[list] = None
+        expected_keywords: Optional[list] = None,
+        role: Optional[str] = None
     ) -> Dict:
         """
         Score a candidate's response
@@ -28,12 +29,13 @@ class ScoringEngine:
             question: Interview question
             answer: Candidate's answer
             expected_keywords: Keywords that should be in the answer
+            role: Job role, selects role-specific behavioral cue vocabularies
         
         Returns:
             Dictionary with all scores and analysis
         """
         # Sentiment and behavioral analysis
-        sentiment_analysis = self.sentiment_analyzer.analyze(answer)
+        sentiment_analysis = self.sentiment_analyzer.analyze(answer, role)
         
         # AI evaluation
         ai_evaluation = self.interview_agent.evaluate_response(
@@ -42,6 +44,66 @@ class ScoringEngine:
             expected_keywords=expected_keywords
         )
         
+        return self._combine_scores(sentiment_analysis, ai_evaluation)
+    
+    async def score_response_async(
+        self,
+        question: str,
+        answer: str,
+        expected_keywords: Optional[list] = None,
+        role: Optional[str] = None
+    ) -> Dict:
+        """
+        Async version of score_response
+        
+        The CPU-bound NLP analysis runs off the event loop while the AI
+        evaluation awaits the async OpenAI client, so both overlap.
+        """
+        sentiment_analysis, ai_evaluation = await asyncio.gather(
+            self.sentiment_analyzer.analyze_async(answer, role),
+            self.interview_agent.evaluate_response_async(
+                question=question,
+                answer=answer,
+                expected_keywords=expected_keywords
+            )
+        )
+        
+        return self._combine_scores(sentiment_analysis, ai_evaluation)
+    
+    def score_responses_batch(self, items: list, role: Optional[str] = None) -> list:
+        """
+        Score several responses, evaluating them in packed AI calls
+        
+        Args:
+            items: Dicts with question, answer and optional expected_keywords
+            role: Job role, selects role-specific behavioral cue vocabularies
+        
+        Returns:
+            List of score dictionaries in the same order as items
+        """
+        sentiment_analyses = self.sentiment_analyzer.analyze_many([item["answer"] for item in items], role)
+        ai_evaluations = self.interview_agent.evaluate_responses_batch(items)
+        
+        return [
+            self._combine_scores(sentiment_analysis, ai_evaluation)
+            for sentiment_analysis, ai_evaluation in zip(sentiment_analyses, ai_evaluations)
+        ]
+    
+    async def score_responses_batch_async(self, items: list, role: Optional[str] = None) -> list:
+        """Async version of score_responses_batch with bounded concurrent evaluation"""
+        sentiment_task = asyncio.gather(
+            *(self.sentiment_analyzer.analyze_async(item["answer"], role) for item in items)
+        )
+        evaluation_task = self.interview_agent.evaluate_responses_batch_async(items)
+        sentiment_analyses, ai_evaluations = await asyncio.gather(sentiment_task, evaluation_task)
+        
+        return [
+            self._combine_scores(sentiment_analysis, ai_evaluation)
+            for sentiment_analysis, ai_evaluation in zip(sentiment_analyses, ai_evaluations)
+        ]
+    
+    def _combine_scores(self, sentiment_analysis: Dict, ai_evaluation: Dict) -> Dict:
+        """Combine NLP analysis and AI evaluation into weighted scores"""
         # Extract scores
         sentiment_score = (sentiment_analysis["sentiment"]["compound"] + 1) / 2  # Normalize to 0-1
         confidence_score = sentiment_analysis["confidence_score"]
@@ -0,0 +1,145 @@
+"""
+Background Scoring Queue
+Scores persisted interview responses outside the request cycle
+"""
+
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.tasks import BackgroundTaskQueue
+from app.models.interview import InterviewResponse, ScoringStatus
+from app.services.scoring.scoring_engine import ScoringEngine
+
+scoring_queue = BackgroundTaskQueue("scoring", max_workers=settings.SCORING_WORKERS)
+
+
+def apply_scores(db_response: InterviewResponse, scores: dict):
+    """Copy scoring engine output onto a response row"""
+    db_response.sentiment_score = scores["sentiment_score"]
+    db_response.confidence_score = scores["confidence_score"]
+    db_response.clarity_score = scores["clarity_score"]
+    db_response.relevance_score = scores["relevance_score"]
+    db_response.overall_score = scores["overall_score"]
+    db_response.sentiment_analysis = scores["sentiment_analysis"]
+    db_response.behavioral_cues = scores["behavioral_cues"]
+    db_response.ai_feedback = scores["ai_feedback"]
+    db_response.scoring_status = ScoringStatus.COMPLETED
+
+
+def score_pending_response(response_id: int, scoring_engine: ScoringEngine) -> bool:
+    """
+    Score a pending response and persist the result
+
+    Args:
+        response_id: ID of the InterviewResponse row
+        scoring_engine: Engine used to compute the scores
+
+    Returns:
+        True if the response was scored
+    """
+    db = SessionLocal()
+    try:
+        db_response = db.query(InterviewResponse).filter(InterviewResponse.id == response_id).first()
+        if not db_response or db_response.scoring_status != ScoringStatus.PENDING:
+            return False
+
+        try:
+            scores = scoring_engine.score_response(
+                question=db_response.question,
+                answer=db_response.answer,
+                role=db_response.interview.role
+            )
+            apply_scores(db_response, scores)
+        except Exception as e:
+            print(f"Error scoring response {response_id}: {e}")
+            db_response.scoring_status = ScoringStatus.FAILED
+
+        db.commit()
+        return db_response.scoring_status == ScoringStatus.COMPLETED
+    finally:
+        db.close()
+
+
+def score_pending_batch(response_ids: List[int], scoring_engine: ScoringEngine) -> int:
+    """
+    Score several pending responses with one batched AI evaluation
+
+    Args:
+        response_ids: IDs of InterviewResponse rows
+        scoring_engine: Engine used to compute the scores
+
+    Returns:
+        Number of responses scored
+    """
+    db = SessionLocal()
+    try:
+        db_responses = db.query(InterviewResponse).filter(
+            InterviewResponse.id.in_(response_ids),
+            InterviewResponse.scoring_status == ScoringStatus.PENDING
+        ).all()
+        if not db_responses:
+            return 0
+
+        items = [{"question": r.question, "answer": r.answer} for r in db_responses]
+        try:
+            all_scores = scoring_engine.score_responses_batch(items, role=db_responses[0].interview.role)
+            for db_response, scores in zip(db_responses, all_scores):
+                apply_scores(db_response, scores)
+        except Exception as e:
+            print(f"Error scoring response batch {response_ids}: {e}")
+            for db_response in db_responses:
+                db_response.scoring_status = ScoringStatus.FAILED
+
+        db.commit()
+        return sum(1 for r in db_responses if r.scoring_status == ScoringStatus.COMPLETED)
+    finally:
+        db.close()
+
+
+def enqueue_scoring(response_id: int, scoring_engine: ScoringEngine):
+    """Queue a persisted response for background scoring"""
+    return scoring_queue.submit(score_pending_response, response_id, scoring_engine)
+
+
+def enqueue_batch_scoring(response_ids: List[int], scoring_engine: ScoringEngine):
+    """Queue several persisted responses for one batched background scoring job"""
+    return scoring_queue.submit(score_pending_batch, response_ids, scoring_engine)
+
+
+def requeue_unscored_responses(response_ids: Optional[List[int]] = None) -> int:
+    """
+    Queue PENDING and FAILED responses for scoring again
+
+    The queue lives in memory, so jobs queued before a restart are lost;
+    this runs at startup to pick them up, and retries failed scorings.
+
+    Args:
+        response_ids: Only these responses (default: all unscored ones)
+
+    Returns:
+        Number of responses queued
+    """
+    from app.services.registry import get_scoring_engine
+
+    db = SessionLocal()
+    try:
+        query = db.query(InterviewResponse).filter(
+            InterviewResponse.scoring_status.in_([ScoringStatus.PENDING, ScoringStatus.FAILED])
+        )
+        if response_ids is not None:
+            query = query.filter(InterviewResponse.id.in_(response_ids))
+        by_interview: Dict[int, List[int]] = {}
+        for db_response in query.all():
+            db_response.scoring_status = ScoringStatus.PENDING
+            by_interview.setdefault(db_response.interview_id, []).append(db_response.id)
+        db.commit()
+    finally:
+        db.close()
+
+    if by_interview:
+        scoring_engine = get_scoring_engine()
+        # Batches are scored with their interview's role, so one job per interview
+        for ids in by_interview.values():
+            enqueue_batch_scoring(ids, scoring_engine)
+    return sum(len(ids) for ids in by_interview.values())
@@ -0,0 +1,101 @@
+"""
+Benchmark for concurrent interview sessions on one worker
+Submits answers for many interviews at once with a simulated LLM latency
+and reports throughput, threads used and connection pool usage. Async
+endpoints wait for the LLM and the database on the event loop, so the
+number of in-flight sessions is not capped by the threadpool size.
+Run from the backend directory: python -m benchmarks.concurrent_sessions_benchmark
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+SESSIONS = (50, 200, 500)
+LLM_LATENCY_SECONDS = 0.5
+
+
+def _fake_scores() -> dict:
+    return {
+        "sentiment_score": 0.5, "confidence_score": 0.5, "clarity_score": 0.5, "relevance_score": 0.5,
+        "overall_score": 50.0, "sentiment_analysis": {}, "behavioral_cues": {}, "ai_feedback": "",
+    }
+
+
+async def _score_response_async(question: str, answer: str, role: str) -> dict:
+    await asyncio.sleep(LLM_LATENCY_SECONDS)
+    return _fake_scores()
+
+
+async def run_sessions(client, headers: dict, interview_ids: list) -> tuple:
+    """Submit one answer per interview concurrently; returns the wall time and peak thread count"""
+    peak_threads = threading.active_count()
+    running = True
+
+    async def watch_threads():
+        nonlocal peak_threads
+        while running:
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.01)
+
+    async def submit(interview_id: int):
+        response = await client.post(
+            f"/api/v1/interviews/{interview_id}/responses",
+            json={"interview_id": interview_id, "question": "Q?", "answer": "A.", "question_number": 1},
+            headers=headers,
+        )
+        response.raise_for_status()
+
+    watcher = asyncio.create_task(watch_threads())
+    started = time.perf_counter()
+    await asyncio.gather(*(submit(interview_id) for interview_id in interview_ids))
+    elapsed = time.perf_counter() - started
+    running = False
+    await watcher
+    return elapsed, peak_threads
+
+
+async def run_benchmark():
+    import httpx
+
+    from app.core.database import pool_status, dispose_async_engine
+    from app.core.migrations import run_migrations
+    from app.services.registry import get_scoring_engine
+    from main import app
+
+    run_migrations()
+    get_scoring_engine().score_response_async = _score_response_async
+
+    async with httpx.AsyncClient(app=app, base_url="http://benchmark") as client:
+        await client.post("/api/v1/users/register", json={
+            "email": "hr@benchmark.com", "password": "benchmark", "full_name": "HR", "role": "hr"
+        })
+        token = (await client.post(
+            "/api/v1/users/login", params={"email": "hr@benchmark.com", "password": "benchmark"}
+        )).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        candidate_id = (await client.get("/api/v1/users/me", headers=headers)).json()["id"]
+
+        print(f"Simulated LLM latency: {LLM_LATENCY_SECONDS * 1000:.0f} ms per answer")
+        print(f"{'sessions':>8} {'wall (s)':>9} {'answers/s':>10} {'peak threads':>13} {'peak conns':>11}")
+        for sessions in SESSIONS:
+            interview_ids = []
+            for _ in range(sessions):
+                created = await client.post(
+                    "/api/v1/interviews/", json={"candidate_id": candidate_id, "role": "developer"}, headers=headers
+                )
+                interview_ids.append(created.json()["id"])
+
+            elapsed, peak_threads = await run_sessions(client, headers, interview_ids)
+            peak_connections = pool_status().get("async", {}).get("peak_checked_out", 0)
+            print(f"{sessions:>8} {elapsed:>9.2f} {sessions / elapsed:>10.1f} {peak_threads:>13} {peak_connections:>11}")
+
+    await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/benchmark.db")
+    os.environ.setdefault("SCORING_MODE", "sync")
+    asyncio.run(run_benchmark())
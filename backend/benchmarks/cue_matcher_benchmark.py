@@ -0,0 +1,125 @@
+"""
+Micro-benchmark for behavioral cue extraction
+Compares the legacy substring scans, the same scans extended to count
+occurrences (the output CueMatcher produces), a combined word-boundary regex
+and CueMatcher on long synthetic transcripts, with the default vocabularies
+and with a role lexicon from CUE_LEXICONS_FILE.
+Run from the backend directory: python -m benchmarks.cue_matcher_benchmark
+"""
+
+import random
+import re
+import timeit
+
+from app.services.ai.cue_matcher import DEFAULT_CUE_LEXICONS, CueMatcher
+
+FILLER = (
+    "the a we i to of and in that it for on with as was our my project system "
+    "data users build built designed service deploy tested worked led improved "
+    "reduced latency api database release customer product feature review code "
+    "quality production incident migration planning careful shipped metrics"
+).split()
+
+# Words that contain a cue as a substring but are not cues
+DECOYS = ["rethinking", "teammates", "surely", "experienced", "lovely", "mighty"]
+
+# Extra vocabulary of the size a CUE_LEXICONS_FILE role entry typically adds
+ROLE_CUES = (
+    "scalable architecture refactored mentored ownership stakeholders tradeoffs observability "
+    "latency throughput kubernetes terraform pipeline automated monitoring alerting oncall postmortem "
+    "roadmap prioritized estimated delegated unblocked onboarding documentation benchmarked profiled "
+    "optimized cached sharded replicated migrated deprecated rollback canary feature flags "
+    "code review pair programming"
+).split()
+
+CUES = [phrase for phrases in DEFAULT_CUE_LEXICONS.values() for phrase in phrases]
+
+ROLE_LEXICONS = dict(DEFAULT_CUE_LEXICONS, role_indicators=ROLE_CUES)
+
+
+def legacy_extract(text: str, lexicons: dict = DEFAULT_CUE_LEXICONS) -> dict:
+    """Previous implementation: substring check per vocabulary word"""
+    text_lower = text.lower()
+    return {
+        category: [w for w in words if w in text_lower]
+        for category, words in lexicons.items()
+    }
+
+
+def legacy_analyze(text: str, lexicons: dict = DEFAULT_CUE_LEXICONS) -> dict:
+    """Previous analyze(): cues were extracted twice per answer"""
+    cues = legacy_extract(text, lexicons)
+    legacy_extract(text, lexicons)  # _calculate_confidence re-scanned the text
+    return cues
+
+
+def legacy_count_analyze(text: str, lexicons: dict = DEFAULT_CUE_LEXICONS) -> dict:
+    """Legacy scans reporting occurrence counts, as CueMatcher does"""
+    def extract():
+        text_lower = text.lower()
+        return {
+            category: {w: text_lower.count(w) for w in words}
+            for category, words in lexicons.items()
+        }
+
+    cues = extract()
+    extract()
+    return cues
+
+
+def build_regex_matcher(lexicons: dict = DEFAULT_CUE_LEXICONS):
+    """Combined word-boundary regex over every cue phrase"""
+    phrases = {phrase for words in lexicons.values() for phrase in words}
+    alternatives = sorted(phrases, key=len, reverse=True)
+    regex = re.compile(r"\b(?:" + "|".join(re.escape(p) for p in alternatives) + r")\b")
+    return lambda text: regex.findall(text.lower())
+
+
+def make_transcript(words: int, cue_rate: float = 0.02, decoy_rate: float = 0.005, seed: int = 42) -> str:
+    """Build a synthetic transcript with a realistic sprinkling of cue words"""
+    rng = random.Random(seed)
+    role_cues = ROLE_CUES[:8]  # An answer only touches a few role-specific terms
+    tokens = []
+    for _ in range(words):
+        roll = rng.random()
+        if roll < cue_rate:
+            tokens.append(rng.choice(CUES))
+        elif roll < cue_rate + decoy_rate:
+            tokens.append(rng.choice(DECOYS))
+        elif roll < cue_rate + decoy_rate + 0.002:
+            tokens.append(rng.choice(role_cues))
+        else:
+            tokens.append(rng.choice(FILLER))
+    return " ".join(tokens) + "."
+
+
+def run_benchmark():
+    for title, lexicons in (("default vocabularies", DEFAULT_CUE_LEXICONS), ("with role lexicon", ROLE_LEXICONS)):
+        matcher = CueMatcher(lexicons)
+        regex_match = build_regex_matcher(lexicons)
+        phrases = sum(len(words) for words in lexicons.values())
+        print(f"{title} ({phrases} phrases)")
+        print(
+            f"{'words':>8} {'legacy (ms)':>12} {'+counts (ms)':>13} {'regex (ms)':>11} "
+            f"{'matcher (ms)':>13} {'vs legacy':>10} {'vs +counts':>11}"
+        )
+        for words in (200, 2000, 20000, 100000):
+            text = make_transcript(words)
+            runs = max(5, 20000 // words)
+
+            def best(func):
+                return min(timeit.repeat(lambda: func(text), number=runs, repeat=5)) / runs
+
+            legacy = best(lambda t: legacy_analyze(t, lexicons))
+            counted = best(lambda t: legacy_count_analyze(t, lexicons))
+            regex = best(regex_match)
+            single = best(matcher.match)
+            print(
+                f"{words:>8} {legacy * 1000:>12.3f} {counted * 1000:>13.3f} {regex * 1000:>11.3f} "
+                f"{single * 1000:>13.3f} {legacy / single:>9.2f}x {counted / single:>10.2f}x"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,111 @@
+"""
+Benchmark for login storms
+Logs a cohort of candidates in at once and compares bcrypt verification on
+the shared request threadpool (the previous sync endpoint) with the
+dedicated hashing pool in thread and process mode. Besides login
+throughput it reports how long other work waits for a threadpool slot
+during the storm, which is what sync endpoints experience.
+Run from the backend directory: python -m benchmarks.login_benchmark
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+LOGINS = 64
+PROBE_INTERVAL_SECONDS = 0.02
+
+
+def _percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def storm(client, emails: list) -> dict:
+    """Log every user in concurrently while probing the shared threadpool"""
+    from starlette.concurrency import run_in_threadpool
+
+    probe_waits = []
+    running = True
+
+    async def probe():
+        while running:
+            started = time.perf_counter()
+            await run_in_threadpool(lambda: None)
+            probe_waits.append(time.perf_counter() - started)
+            await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+
+    async def login(email: str) -> float:
+        started = time.perf_counter()
+        response = await client.post("/api/v1/users/login", params={"email": email, "password": "benchmark"})
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    prober = asyncio.create_task(probe())
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(login(email) for email in emails))
+    elapsed = time.perf_counter() - started
+    running = False
+    await prober
+    return {
+        "logins_per_second": len(emails) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": _percentile(latencies, 0.95),
+        "threadpool_wait_p95": _percentile(probe_waits, 0.95),
+    }
+
+
+async def run_benchmark():
+    import httpx
+    from starlette.concurrency import run_in_threadpool
+
+    from app.api.v1.endpoints import users
+    from app.core.config import settings
+    from app.core.database import SessionLocal, dispose_async_engine
+    from app.core.migrations import run_migrations
+    from app.core import password_hashing
+    from app.models.user import User, UserRole
+    from main import app
+
+    run_migrations()
+    hashed = password_hashing.hash_password("benchmark")
+    emails = [f"candidate{index}@benchmark.com" for index in range(LOGINS)]
+    db = SessionLocal()
+    db.add_all([User(email=email, hashed_password=hashed, full_name="Candidate", role=UserRole.CANDIDATE)
+                for email in emails])
+    db.commit()
+    db.close()
+
+    async def verify_on_shared_threadpool(password: str, hashed_password: str):
+        return await run_in_threadpool(password_hashing.verify_and_update, password, hashed_password)
+
+    modes = [
+        ("shared threadpool", None),
+        ("dedicated threads", "thread"),
+        ("processes", "process"),
+    ]
+    print(f"bcrypt cost {settings.BCRYPT_ROUNDS}, {LOGINS} concurrent logins, "
+          f"{password_hashing._pool_size()} hashing workers")
+    print(f"{'mode':>18} {'logins/s':>9} {'p50 (ms)':>9} {'p95 (ms)':>9} {'threadpool wait p95 (ms)':>25}")
+    async with httpx.AsyncClient(app=app, base_url="http://benchmark") as client:
+        for name, mode in modes:
+            password_hashing.shutdown_hash_pool()
+            if mode is None:
+                users.verify_and_update_async = verify_on_shared_threadpool
+            else:
+                users.verify_and_update_async = password_hashing.verify_and_update_async
+                settings.PASSWORD_HASH_MODE = mode
+                password_hashing.start_hash_pool()
+            result = await storm(client, emails)
+            print(f"{name:>18} {result['logins_per_second']:>9.1f} {result['p50'] * 1000:>9.0f} "
+                  f"{result['p95'] * 1000:>9.0f} {result['threadpool_wait_p95'] * 1000:>25.1f}")
+
+    password_hashing.shutdown_hash_pool()
+    await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/benchmark.db")
+    asyncio.run(run_benchmark())
@@ -0,0 +1,111 @@
+"""
+Benchmark for CV PDF text extraction
+Builds a corpus of synthetic multi-page PDFs and compares the previous
+serial `text +=` extraction with the streaming/parallel extractor, both
+reading the whole file and stopping early at CV_EXTRACT_MAX_CHARS.
+Run from the backend directory: python -m benchmarks.pdf_extraction_benchmark
+"""
+
+import os
+import random
+import tempfile
+import time
+
+import PyPDF2
+
+from app.core.config import settings
+from app.services.ai.cv_analyzer import _extract_from_pdf, extract_file_text, get_pdf_pool, shutdown_pdf_pool
+
+WORDS = (
+    "python developer experience team project led built designed deployed service "
+    "api database cloud migration production latency customers product delivered "
+    "improved reduced testing review mentoring architecture platform engineering"
+).split()
+
+LINES_PER_PAGE = 45
+PAGE_COUNTS = (2, 10, 40, 120)
+FILES_PER_SIZE = 3
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(path: str, pages: int, seed: int = 0):
+    """Write a minimal text PDF with the given number of pages"""
+    rng = random.Random(seed)
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for _ in range(pages):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(LINES_PER_PAGE)]
+        stream = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"({_escape(line)}) '" for line in lines) + " ET"
+        stream = stream.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as file:
+        file.write(output)
+
+
+def legacy_extract(file_path: str) -> str:
+    """Previous implementation: serial pages with quadratic string building"""
+    text = ""
+    with open(file_path, "rb") as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in pdf_reader.pages:
+            text += page.extract_text() + "\n"
+    return text
+
+
+def _time(func, paths) -> float:
+    started = time.perf_counter()
+    for path in paths:
+        func(path)
+    return (time.perf_counter() - started) / len(paths)
+
+
+def run_benchmark():
+    get_pdf_pool()
+
+    print(f"PDF workers: {settings.CV_PDF_WORKERS or os.cpu_count()}, "
+          f"parallel from {settings.CV_PDF_PARALLEL_MIN_PAGES} pages, "
+          f"early stop at {settings.CV_EXTRACT_MAX_CHARS} chars")
+    print(f"{'pages':>6} {'legacy (ms)':>12} {'full (ms)':>10} {'early stop (ms)':>16} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for pages in PAGE_COUNTS:
+            paths = []
+            for index in range(FILES_PER_SIZE):
+                path = os.path.join(directory, f"cv_{pages}_{index}.pdf")
+                make_pdf(path, pages, seed=index)
+                paths.append(path)
+
+            # Also warms up the pool workers before timing
+            expected = legacy_extract(paths[0])
+            assert _extract_from_pdf(paths[0]) == expected
+
+            legacy = _time(legacy_extract, paths)
+            full = _time(_extract_from_pdf, paths)
+            early = _time(lambda p: extract_file_text(p, ".pdf"), paths)
+            print(f"{pages:>6} {legacy * 1000:>12.1f} {full * 1000:>10.1f} {early * 1000:>16.1f} "
+                  f"{legacy / early:>7.1f}x")
+    shutdown_pdf_pool()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,178 @@
+"""
+Script to check the query plans of hot queries
+Migrates a database and EXPLAINs the dashboard, pagination, question
+sampling and reminder queries. Exits non-zero when one of them falls back
+to a full table scan, walks a whole index although it filters on an indexed
+prefix or a keyset cursor, or sorts its rows instead of reading an index in
+order, so a dropped or mismatched index fails CI.
+
+Usage:
+    python check_query_plans.py                  # Fresh temporary SQLite database
+    python check_query_plans.py --configured-db  # DATABASE_URL (e.g. a PostgreSQL staging copy)
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime
+
+
+def hot_queries(db):
+    """(name, table that must be read through an index, query) of every hot path"""
+    from sqlalchemy import tuple_
+
+    from app.models.application import Application, ApplicationStatus, CVAnalysis, CVDocument
+    from app.models.interview import Interview, InterviewResponse, InterviewStatus
+    from app.models.question import QuestionBank
+    from app.models.reminder import Reminder, ReminderStatus
+    from app.models.user import User
+
+    candidates = db.query(Interview.id, Interview.overall_score, User.full_name).outerjoin(
+        User, User.id == Interview.candidate_id
+    )
+    # Same ordering and cursor condition as the dashboard's keyset pagination
+    by_score = (Interview.overall_score.desc(), Interview.id.desc())
+    after_score = tuple_(Interview.overall_score, Interview.id) < (50.0, 100)
+    return [
+        ("candidates ranked by score", "interviews",
+         candidates.order_by(*by_score).limit(51)),
+        ("candidates ranked by score, next page", "interviews",
+         candidates.filter(after_score).order_by(*by_score).limit(51)),
+        ("candidates by role", "interviews",
+         candidates.filter(Interview.role == "developer").order_by(*by_score).limit(51)),
+        ("candidates by role, next page", "interviews",
+         candidates.filter(Interview.role == "developer", after_score).order_by(*by_score).limit(51)),
+        ("candidates by status", "interviews",
+         candidates.filter(Interview.status == InterviewStatus.COMPLETED).order_by(*by_score).limit(51)),
+        ("candidate interviews", "interviews",
+         db.query(Interview).filter(Interview.candidate_id == 1, Interview.id > 10).order_by(Interview.id).limit(51)),
+        ("interview responses", "interview_responses",
+         db.query(InterviewResponse).filter(InterviewResponse.interview_id == 1)
+         .order_by(InterviewResponse.question_number)),
+        ("applications by candidate", "applications",
+         db.query(Application).filter(Application.candidate_id == 1).order_by(Application.id).limit(51)),
+        ("applications by status", "applications",
+         db.query(Application).filter(Application.status == ApplicationStatus.PENDING)
+         .order_by(Application.id).limit(51)),
+        ("applications by job role", "applications",
+         db.query(Application).filter(Application.job_role == "developer").order_by(Application.id).limit(51)),
+        ("question bank listing", "question_banks",
+         db.query(QuestionBank).filter(QuestionBank.role == "developer", QuestionBank.category == "technical")
+         .order_by(QuestionBank.id).limit(51)),
+        ("question bank sampling", "question_banks",
+         db.query(QuestionBank.id).filter(
+             QuestionBank.role == "developer",
+             QuestionBank.difficulty_level == "medium",
+             QuestionBank.is_active == True
+         )),
+        ("due reminders", "reminders",
+         db.query(Reminder).filter(
+             Reminder.status == ReminderStatus.PENDING,
+             Reminder.scheduled_time <= datetime(2030, 1, 1)
+         )),
+        ("reminders of a dispatch batch", "reminders",
+         db.query(Reminder.id).filter(Reminder.claimed_by == "worker:batch")),
+        ("user by email", "users",
+         db.query(User).filter(User.email == "candidate@example.com")),
+        ("CV document by hash", "cv_documents",
+         db.query(CVDocument).filter(CVDocument.sha256 == "0" * 64)),
+        ("CV analysis by document and role", "cv_analyses",
+         db.query(CVAnalysis).filter(CVAnalysis.document_id == 1, CVAnalysis.job_role == "developer")),
+    ]
+
+
+def explain(db, query) -> list:
+    """Plan lines of a query"""
+    connection = db.connection()
+    compiled = query.statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+        return [row[-1] for row in rows]
+    if connection.dialect.name == "postgresql":
+        # Small tables are cheaper to scan; only fall back to one when no index applies
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        rows = connection.exec_driver_sql(f"EXPLAIN {compiled}").fetchall()
+        return [row[0] for row in rows]
+    raise SystemExit(f"Unsupported database for plan checks: {connection.dialect.name}")
+
+
+def plan_problems(plan: list, table: str, filtered: bool) -> list:
+    """
+    Full scans of the table and sorts that an index should have avoided
+
+    A query with a WHERE clause must seek into an index: SQLite's
+    "SCAN <table> USING INDEX" and a PostgreSQL index scan without an
+    Index Cond walk the whole index, which only an unfiltered
+    ORDER BY ... LIMIT may do.
+    """
+    problems = []
+    walk = None  # PostgreSQL index scan of the table that has shown no Index Cond yet
+    for line in plan:
+        text = line.strip()
+        if line.startswith(" ") and not text.startswith("->"):
+            # Detail line of the PostgreSQL plan node above it
+            if text.startswith("Index Cond:"):
+                walk = None
+            continue
+
+        if walk is not None and filtered:
+            problems.append(walk)
+        node = text[2:].strip() if text.startswith("->") else text
+        walk = node if re.match(rf"Index (Only )?Scan .*\bon {table}\b", node) else None
+
+        if line.startswith(f"SCAN {table}") and ("INDEX" not in line or filtered):
+            problems.append(line)
+        elif f"Seq Scan on {table}" in node:
+            problems.append(node)
+        elif "TEMP B-TREE FOR ORDER BY" in line:
+            problems.append(line)
+        elif re.match(r"(Incremental )?Sort\b", node):
+            problems.append(node)
+    if walk is not None and filtered:
+        problems.append(walk)
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when a hot query is not served by an index")
+    parser.add_argument("--configured-db", action="store_true",
+                        help="Check DATABASE_URL instead of a fresh temporary SQLite database")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan")
+    args = parser.parse_args()
+
+    if not args.configured_db:
+        directory = tempfile.mkdtemp()
+        os.environ["DATABASE_URL"] = f"sqlite:///{directory}/query_plans.db"
+
+    from app.core.database import SessionLocal
+    from app.core.migrations import run_migrations
+
+    run_migrations()
+    db = SessionLocal()
+    failures = 0
+    try:
+        for name, table, query in hot_queries(db):
+            plan = explain(db, query)
+            problems = plan_problems(plan, table, query.whereclause is not None)
+            if problems:
+                failures += 1
+                print(f"❌ {name}: {'; '.join(problems)}")
+            else:
+                print(f"✅ {name}")
+            if args.verbose or problems:
+                for line in plan:
+                    print(f"     {line}")
+            db.rollback()
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n{failures} hot queries are not served by an index")
+        sys.exit(1)
+    print("\nAll hot queries use indexes")
+
+
+if __name__ == "__main__":
+    main()
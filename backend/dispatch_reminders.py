@@ -0,0 +1,53 @@
+"""
+Script to dispatch reminders
+Delivers due reminders in batches. Several copies can run side by side
+(on one or more hosts); each batch is leased so no reminder is sent twice.
+
+Usage:
+    python dispatch_reminders.py          # Keep delivering reminders as they fall due
+    python dispatch_reminders.py --once   # Deliver what is due now and exit
+"""
+
+import argparse
+import asyncio
+
+from app.core.config import settings
+from app.core.database import dispose_async_engine
+from app.core.migrations import run_migrations
+from app.services.reminder.delivery import shutdown_email_delivery
+from app.services.reminder.dispatcher import ReminderDispatcher
+from app.services.reminder.scheduler import ReminderScheduler
+
+
+async def dispatch(once: bool, batch_size: int, concurrency: int):
+    dispatcher = ReminderDispatcher(batch_size=batch_size, concurrency=concurrency)
+    try:
+        if once:
+            sent = await dispatcher.dispatch_due()
+            print(f"📨 Sent {sent} reminders")
+        else:
+            print(f"🚀 Dispatching reminders as {dispatcher.worker_id}...")
+            await ReminderScheduler(dispatcher).run()
+    finally:
+        await shutdown_email_delivery()
+        await dispose_async_engine()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deliver due interview reminders")
+    parser.add_argument("--once", action="store_true", help="Deliver due reminders once and exit")
+    parser.add_argument("--batch-size", type=int, default=settings.REMINDER_BATCH_SIZE,
+                        help="Reminders claimed per batch")
+    parser.add_argument("--concurrency", type=int, default=settings.REMINDER_SEND_CONCURRENCY,
+                        help="Deliveries in flight at once")
+    args = parser.parse_args()
+
+    run_migrations()
+    try:
+        asyncio.run(dispatch(args.once, args.batch_size, args.concurrency))
+    except KeyboardInterrupt:
+        print("👋 Dispatcher stopped")
+
+
+if __name__ == "__main__":
+    main()
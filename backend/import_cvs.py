@@ -0,0 +1,104 @@
+"""
+Script to bulk import CVs
+Stages CV files, directories and zip archives as one import, then creates
+applications, extracts text and analyzes the CVs. Interrupted imports can
+be resumed with --resume.
+
+Usage:
+    python import_cvs.py --job-role "Software Engineer" cvs.zip more_cvs/ manifest.csv
+    python import_cvs.py --resume 3
+"""
+
+import argparse
+from pathlib import Path
+
+from app.core.database import SessionLocal
+from app.core.migrations import run_migrations
+from app.models.cv_import import CVImport
+from app.services.ai.cv_analyzer import shutdown_pdf_pool
+from app.services.ai.cv_import import (
+    MANIFEST_NAME, create_import, is_cv_file, stage_stream, stage_zip,
+    read_manifest, apply_manifest, finish_staging, run_import
+)
+
+
+def stage_paths(job_role: str, paths: list) -> int:
+    """Stage files, directories and zip archives as a new import"""
+    db = SessionLocal()
+    try:
+        cv_import = create_import(db, job_role)
+        items = []
+        manifest = {}
+
+        files = []
+        for path in map(Path, paths):
+            files.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+
+        for path in files:
+            if path.suffix.lower() == ".zip":
+                staged, found = stage_zip(cv_import, path, len(items))
+                items.extend(staged)
+                manifest.update(found)
+            elif path.name.lower() == MANIFEST_NAME:
+                with open(path, "rb") as source:
+                    manifest.update(read_manifest(source))
+            elif is_cv_file(path.name):
+                with open(path, "rb") as source:
+                    item = stage_stream(cv_import, path.name, source, len(items))
+                if item is not None:
+                    items.append(item)
+
+        apply_manifest(items, manifest)
+        db.add_all(items)
+        finish_staging(db, cv_import)
+        print(f"📁 Staged {len(items)} CV files as import #{cv_import.id}")
+        return cv_import.id
+    finally:
+        db.close()
+
+
+def print_report(import_id: int, report: dict):
+    """Print the progress and throughput report of an import run"""
+    db = SessionLocal()
+    try:
+        cv_import = db.query(CVImport).filter(CVImport.id == import_id).first()
+        print(f"\n📊 Import #{import_id}: {cv_import.status.value}")
+        print(f"   Files: {cv_import.total_files} "
+              f"(completed: {cv_import.completed_files}, failed: {cv_import.failed_files})")
+        for stage, counters in report.get("stages", {}).items():
+            details = ", ".join(f"{key}={value}" for key, value in counters.items())
+            print(f"   {stage}: {details}")
+        print(f"   Total: {report['seconds']}s, {report['files_per_second']} files/s")
+        if report.get("error"):
+            print(f"❌ {report['error']} (resume with --resume {import_id})")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import CVs as job applications")
+    parser.add_argument("paths", nargs="*", help="CV files, directories, zip archives or manifest.csv")
+    parser.add_argument("--job-role", help="Job role for CVs without one in the manifest")
+    parser.add_argument("--resume", type=int, metavar="IMPORT_ID", help="Resume an existing import")
+    args = parser.parse_args()
+
+    if args.resume is None and (not args.paths or not args.job_role):
+        parser.error("paths and --job-role are required unless --resume is given")
+
+    run_migrations()
+    import_id = args.resume if args.resume is not None else stage_paths(args.job_role, args.paths)
+
+    print(f"🚀 Running import #{import_id}...")
+    try:
+        report = run_import(import_id)
+    finally:
+        shutdown_pdf_pool()
+
+    if report is None:
+        print(f"❌ Import #{import_id} not found or already running on another worker")
+        return
+    print_report(import_id, report)
+
+
+if __name__ == "__main__":
+    main()
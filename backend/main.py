@@ -3,24 +3,62 @@ Botboss - AI-Driven Virtual Interview System
 Main FastAPI Application Entry Point
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.core.database import engine, Base
+from app.core.database import count_queries, pool_status, dispose_async_engine
+from app.core.migrations import run_migrations
+from app.core.password_hashing import start_hash_pool, shutdown_hash_pool
+from app.services.scoring.scoring_queue import scoring_queue, requeue_unscored_responses
+from app.services.ai.sentiment_analyzer import start_process_pool, shutdown_process_pool
+from app.services.registry import registry
+from app.services.ai.cv_processing import cv_queue
+from app.services.ai.cv_analyzer import shutdown_pdf_pool
+from app.services.ai.cv_import import import_queue
+from app.services.dashboard.statistics import reconcile_periodically
+from app.services.reminder.delivery import shutdown_email_delivery
+from app.services.reminder.scheduler import reminder_scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
-    Base.metadata.create_all(bind=engine)
+    if settings.DB_AUTO_MIGRATE:
+        run_migrations()
+    if settings.WARM_UP_SERVICES:
+        registry.warm_up()
+        print(f"Service warm-up: {registry.report()}")
+    if settings.SCORING_MODE == "background":
+        scoring_queue.start()
+        requeued = requeue_unscored_responses()
+        if requeued:
+            print(f"Responses queued for scoring: {requeued}")
+    if settings.NLP_EXECUTION_MODE == "process":
+        start_process_pool(warm_up=True)
+    start_hash_pool()
+    reconcile_task = asyncio.create_task(reconcile_periodically(settings.STATS_RECONCILE_INTERVAL_SECONDS))
+    reminder_task = None
+    if settings.REMINDER_DISPATCHER_ENABLED:
+        reminder_task = asyncio.create_task(reminder_scheduler.run())
     yield
     # Shutdown
-    pass
+    reconcile_task.cancel()
+    if reminder_task is not None:
+        reminder_task.cancel()
+    await shutdown_email_delivery()
+    scoring_queue.stop()
+    cv_queue.stop()
+    import_queue.stop()
+    shutdown_process_pool()
+    shutdown_pdf_pool()
+    shutdown_hash_pool()
+    await dispose_async_engine()
 
 
 app = FastAPI(
@@ -37,8 +75,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+if settings.QUERY_COUNT_HEADER:
+    @app.middleware("http")
+    async def query_count_header(request: Request, call_next):
+        """Report the number of SQL queries each request made"""
+        with count_queries() as statements:
+            response = await call_next(request)
+        response.headers["X-Query-Count"] = str(len(statements))
+        return response
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -59,6 +107,18 @@ async def health_check():
     return {"status": "healthy", "service": "botboss-api"}
 
 
+@app.get("/health/database")
+async def database_report():
+    """Connection pool usage: checked-out connections, overflow and checkout wait times"""
+    return pool_status()
+
+
+@app.get("/health/startup")
+async def startup_report():
+    """Load times of lazily created services (AI clients, NLP models)"""
+    return registry.report()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)